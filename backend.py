@@ -1,8 +1,19 @@
 # backend_ga.py
 # Algoritmo genético sencillo que acepta parámetros desde el frontend
+import bisect
+import itertools
 import random
 import math
-import copy
+import operator
+import os
+import time
+from array import array
+from collections import OrderedDict
+
+from cache_resultados import TAM_MAX_MB, CacheResultados, clave_corrida
+from catalogo import CatalogoColumnar, huella_catalogo
+from puntos_control import (EscritorPuntosControl, estado_random, leer_punto_control, params_serializables,
+                            restaurar_random)
 
 AREA_MAXIMA = 50.0  # m²
 LADO_PLANO = math.sqrt(AREA_MAXIMA)
@@ -29,53 +40,337 @@ CATALOGO_POR_DEFECTO = [
 def area_item(item):
     return item.get('ancho', 0.0) * item.get('largo', 0.0)
 
-def evaluar_individuo(ind, catalogo):
-    """Individuo: lista de cantidades (0..stock) por artículo. """
-    area = sum(q * area_item(a) for q, a in zip(ind, catalogo))
-    ganancia = sum(q * a['ganancia'] for q, a in zip(ind, catalogo))
+def fitness_desde_totales(area, ganancia):
     if area > AREA_MAXIMA:
         # fuerte penalización
         exceso = area - AREA_MAXIMA
         return ganancia - 1000.0 * exceso
     return ganancia
 
-def crear_individuo_aleatorio(catalogo):
-    return [random.randint(0, a.get('stock', 1)) for a in catalogo]
-
-# selección
-def seleccion_ruleta(poblacion, fitnesses):
-    total = sum(fitnesses)
-    if total <= 0:
-        return copy.deepcopy(random.choice(poblacion))
-    pick = random.uniform(0, total)
-    cur = 0.0
-    for p, f in zip(poblacion, fitnesses):
-        cur += f
-        if cur >= pick:
-            return copy.deepcopy(p)
-    return copy.deepcopy(poblacion[-1])
-
-def seleccion_torneo(poblacion, fitnesses, k=3):
-    idxs = random.sample(range(len(poblacion)), min(k, len(poblacion)))
-    mejor = max(idxs, key=lambda i: fitnesses[i])
-    return copy.deepcopy(poblacion[mejor])
-
-def cruce_un_punto(a, b, pc):
-    if random.random() > pc:
-        return copy.deepcopy(a), copy.deepcopy(b)
-    punto = random.randint(1, len(a)-1)
-    hijo1 = a[:punto] + b[punto:]
-    hijo2 = b[:punto] + a[punto:]
+def columnas_catalogo(catalogo):
+    """(areas, ganancias, stocks) por artículo; un CatalogoColumnar ya las trae calculadas."""
+    if isinstance(catalogo, CatalogoColumnar):
+        return catalogo.areas, catalogo.ganancias, catalogo.stocks
+    return ([area_item(a) for a in catalogo], [a['ganancia'] for a in catalogo],
+            [a.get('stock', 1) for a in catalogo])
+
+def totales_individuo(ind, catalogo):
+    """(área, ganancia) del individuo."""
+    if isinstance(catalogo, CatalogoColumnar):
+        return sum(map(operator.mul, ind, catalogo.areas)), sum(map(operator.mul, ind, catalogo.ganancias))
+    area = sum(q * area_item(a) for q, a in zip(ind, catalogo))
+    ganancia = sum(q * a['ganancia'] for q, a in zip(ind, catalogo))
+    return area, ganancia
+
+def evaluar_individuo(ind, catalogo):
+    """Individuo: lista de cantidades (0..stock) por artículo. """
+    return fitness_desde_totales(*totales_individuo(ind, catalogo))
+
+def prefijos_individuo(ind, areas, ganancias):
+    """Sumas prefijas de área y ganancia (con 0 inicial): prefijo[p] = total de los genes [0, p)."""
+    pref_area = list(itertools.accumulate(map(operator.mul, ind, areas), initial=0.0))
+    pref_gan = list(itertools.accumulate(map(operator.mul, ind, ganancias), initial=0.0))
+    return pref_area, pref_gan
+
+class CacheFitness:
+    """
+    Caché LRU genotipo -> fitness. La clave es el genotipo empaquetado en bytes, así que
+    los individuos repetidos (muy comunes al final de la corrida) no se vuelven a evaluar.
+    """
+    def __init__(self, tam_max=4096, funcion=evaluar_individuo):
+        self.tam_max = tam_max
+        self.funcion = funcion
+        self._datos = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def evaluar(self, ind, catalogo):
+        clave = array('l', ind).tobytes()
+        fit = self._datos.get(clave)
+        if fit is not None:
+            self._datos.move_to_end(clave)
+            self.aciertos += 1
+            return fit
+        self.fallos += 1
+        fit = self.funcion(ind, catalogo)
+        self._datos[clave] = fit
+        if len(self._datos) > self.tam_max:
+            self._datos.popitem(last=False)
+        return fit
+
+    def estadisticas(self):
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'evaluaciones_ahorradas': self.aciertos,
+            'tam': len(self._datos),
+            'tam_max': self.tam_max,
+        }
+
+class EvaluadorEmpaquetado:
+    """
+    Fitness geométrico: ganancia de los artículos que el empaquetador coloca de verdad.
+    Los individuos que ya superan AREA_MAXIMA no se empaquetan (filtro barato por área, con la
+    misma penalización que evaluar_individuo). Acumula el tiempo de la parte aritmética y del
+    empaquetado; conviene envolverlo en un CacheFitness para no reempaquetar genotipos repetidos.
+    """
+    def __init__(self, params=None):
+        self.params = params
+        self.tiempo_aritmetica = 0.0
+        self.tiempo_empaquetado = 0.0
+        self.empaquetados = 0
+
+    def __call__(self, ind, catalogo):
+        t0 = time.perf_counter()
+        area, ganancia = totales_individuo(ind, catalogo)
+        t1 = time.perf_counter()
+        self.tiempo_aritmetica += t1 - t0
+        if area > AREA_MAXIMA:
+            return fitness_desde_totales(area, ganancia)
+        placements = empaquetar(ind, catalogo, self.params)
+        fuera = sum(catalogo[p['articulo']]['ganancia'] for p in placements if not p['incluido'])
+        self.tiempo_empaquetado += time.perf_counter() - t1
+        self.empaquetados += 1
+        return ganancia - fuera
+
+    def estadisticas(self):
+        return {
+            'aritmetica': self.tiempo_aritmetica,
+            'empaquetado': self.tiempo_empaquetado,
+            'empaquetados': self.empaquetados,
+        }
+
+def preparar_evaluacion(params):
+    """
+    Función de fitness según params['fitness'] ('area' o 'empaquetado') y params['cache_fitness'].
+    Devuelve (evaluar, cache, evaluador); cache y evaluador pueden ser None.
+    """
+    evaluador = None
+    if params.get('fitness', 'area') == 'empaquetado':
+        evaluador = EvaluadorEmpaquetado(params)
+    funcion = evaluador or evaluar_individuo
+    tam_cache = int(params.get('cache_fitness', 4096))
+    if params.get('evaluacion_incremental') and evaluador is None:
+        # con totales incrementales el fitness aritmético ya es O(1)
+        tam_cache = 0
+    cache = CacheFitness(tam_cache, funcion) if tam_cache > 0 else None
+    evaluar = cache.evaluar if cache is not None else funcion
+    return evaluar, cache, evaluador
+
+def estadisticas_evaluacion(cache, evaluador):
+    """Contadores de la caché y tiempos del evaluador, con las claves del dict de resultado."""
+    estadisticas = {}
+    if cache is not None:
+        estadisticas['cache_fitness'] = cache.estadisticas()
+    if evaluador is not None:
+        estadisticas['tiempos_evaluacion'] = evaluador.estadisticas()
+    return estadisticas
+
+# las funciones aleatorias aceptan rng (random.Random) para ejecuciones reproducibles;
+# por defecto usan el módulo random global
+def crear_individuo_aleatorio(catalogo, rng=random):
+    if isinstance(catalogo, CatalogoColumnar):
+        return [rng.randint(0, s) for s in catalogo.stocks]
+    return [rng.randint(0, a.get('stock', 1)) for a in catalogo]
+
+# reparación y siembra por densidad de ganancia (ganancia / área)
+def preparar_reparacion(catalogo):
+    """Vectores por artículo y orden ascendente de ganancia/área que usan la reparación y la siembra."""
+    areas, ganancias, stocks = columnas_catalogo(catalogo)
+    # los artículos sin área no ocupan plano: van al final (nunca se quitan)
+    orden = sorted(range(len(catalogo)),
+                   key=lambda i: ganancias[i] / areas[i] if areas[i] > 0 else math.inf)
+    return areas, ganancias, stocks, orden
+
+def _reparar(ind, datos, area, rellenar=False):
+    """Núcleo de reparar_individuo: recibe el área actual y devuelve (área nueva, cambio de ganancia)."""
+    areas, ganancias, _, orden = datos
+    d_gan = 0.0
+    if area > AREA_MAXIMA:
+        for i in orden:
+            if ind[i] <= 0 or areas[i] <= 0:
+                continue
+            # unidades justas para volver a caber (o todas las que haya)
+            quitar = min(ind[i], math.ceil((area - AREA_MAXIMA) / areas[i] - 1e-9))
+            ind[i] -= quitar
+            area -= quitar * areas[i]
+            d_gan -= quitar * ganancias[i]
+            if area <= AREA_MAXIMA:
+                break
+    if rellenar:
+        area, d_relleno = _rellenar(ind, datos, area, reversed(orden))
+        d_gan += d_relleno
+    return area, d_gan
+
+def _rellenar(ind, datos, area, orden):
+    """
+    Añade unidades en el `orden` dado mientras quepan; devuelve (área nueva, cambio de ganancia).
+    Los artículos sin ganancia positiva no se añaden: solo restarían (como en solver_dp).
+    """
+    areas, ganancias, stocks, _ = datos
+    d_gan = 0.0
+    for i in orden:
+        libres = stocks[i] - ind[i]
+        if libres <= 0 or ganancias[i] <= 0:
+            continue
+        if areas[i] > 0:
+            libres = min(libres, int((AREA_MAXIMA - area) / areas[i] + 1e-9))
+        if libres > 0:
+            ind[i] += libres
+            area += libres * areas[i]
+            d_gan += libres * ganancias[i]
+    return area, d_gan
+
+def reparar_individuo(ind, catalogo, rellenar=False, datos=None):
+    """
+    Quita unidades de los artículos con menor ganancia/área hasta que el individuo cabe en
+    AREA_MAXIMA; con `rellenar`, ocupa después el hueco libre con los de mayor ganancia/área.
+    Modifica `ind` y lo devuelve.
+    """
+    datos = datos or preparar_reparacion(catalogo)
+    area = sum(map(operator.mul, ind, datos[0]))
+    _reparar(ind, datos, area, rellenar)
+    return ind
+
+def crear_individuo_greedy(catalogo, rng=random, datos=None, ruido=0.0):
+    """
+    Solución voraz por ganancia/área descendente. Con `ruido` > 0 cada ratio se multiplica por
+    un factor aleatorio en [1 - ruido, 1 + ruido] para obtener semillas distintas.
+    """
+    datos = datos or preparar_reparacion(catalogo)
+    areas, ganancias, _, orden = datos
+    if ruido > 0:
+        factor = {i: rng.uniform(1 - ruido, 1 + ruido) for i in orden}
+        orden = sorted(orden, key=lambda i: factor[i] * ganancias[i] / areas[i] if areas[i] > 0 else math.inf)
+    ind = [0] * len(catalogo)
+    _rellenar(ind, datos, 0.0, reversed(orden))
+    return ind
+
+def poblacion_inicial(catalogo, n, params, rng=random):
+    """
+    Población inicial aleatoria (reparada si params['reparacion']); con params['fraccion_greedy']
+    esa fracción se siembra con soluciones voraces (la primera sin ruido, el resto con
+    params['ruido_greedy'], 0.3 por defecto). Con params['inyectar_dp'] el primer individuo es
+    la solución exacta de solver_dp (con params['resolucion_area']).
+    """
+    n_greedy = min(n, int(round(n * float(params.get('fraccion_greedy', 0.0)))))
+    poblacion = [crear_individuo_aleatorio(catalogo, rng) for _ in range(n - n_greedy)]
+    if params.get('reparacion'):
+        datos = preparar_reparacion(catalogo)
+        for ind in poblacion:
+            reparar_individuo(ind, catalogo, bool(params.get('rellenar', False)), datos)
+    if n_greedy:
+        datos = preparar_reparacion(catalogo)
+        ruido = float(params.get('ruido_greedy', 0.3))
+        poblacion.extend(crear_individuo_greedy(catalogo, rng, datos, ruido if k else 0.0)
+                         for k in range(n_greedy))
+    if params.get('inyectar_dp') and poblacion:
+        from solver_dp import resolver_cantidades_dp
+        poblacion[0], _ = resolver_cantidades_dp(catalogo, float(params.get('resolucion_area', 0.001)),
+                                                 float(params.get('memoria_max_mb', 256)))
+    return poblacion
+
+# selección: las variantes *_idx devuelven el índice del padre elegido (sin copiar nada)
+def indice_ruleta(fitnesses):
+    """
+    Pesos acumulados de la ruleta; se construye una vez por generación y cada tirada
+    es una búsqueda binaria. Los individuos penalizados (fitness <= 0) tienen peso 0; si
+    nadie tiene fitness positivo, el peso es la distancia al peor (los menos penalizados
+    tienen más opciones) y, si todos son iguales, la ruleta es uniforme.
+    """
+    pesos = [f if f > 0 else 0.0 for f in fitnesses]
+    if not any(pesos):
+        minimo = min(fitnesses)
+        pesos = [f - minimo for f in fitnesses]
+        if not any(pesos):
+            pesos = [1.0] * len(fitnesses)
+    return list(itertools.accumulate(pesos))
+
+def seleccion_ruleta_idx(acumulado, rng=random):
+    # pick en [0, total): bisect_right nunca cae en un individuo de peso 0
+    pick = rng.random() * acumulado[-1]
+    return min(bisect.bisect_right(acumulado, pick), len(acumulado) - 1)
+
+def seleccion_sus_idx(acumulado, n, rng=random):
+    """Muestreo universal estocástico: n padres con una sola tirada y n punteros equiespaciados."""
+    if n <= 0:
+        return []
+    paso = acumulado[-1] / n
+    pick = rng.random() * paso
+    ultimo = len(acumulado) - 1
+    elegidos = []
+    i = 0
+    for _ in range(n):
+        while i < ultimo and acumulado[i] <= pick:
+            i += 1
+        elegidos.append(i)
+        pick += paso
+    # los punteros salen ordenados; se barajan para no cruzar siempre vecinos
+    rng.shuffle(elegidos)
+    return elegidos
+
+def seleccion_torneo_idx(fitnesses, k=3, rng=random):
+    idxs = rng.sample(range(len(fitnesses)), min(k, len(fitnesses)))
+    return max(idxs, key=lambda i: fitnesses[i])
+
+def seleccion_ruleta(poblacion, fitnesses, rng=random):
+    return list(poblacion[seleccion_ruleta_idx(indice_ruleta(fitnesses), rng)])
+
+def seleccion_torneo(poblacion, fitnesses, k=3, rng=random):
+    return list(poblacion[seleccion_torneo_idx(fitnesses, k, rng)])
+
+def cruce_un_punto_en(a, b, pc, hijo1, hijo2, rng=random):
+    """
+    Como cruce_un_punto, pero escribe los hijos en las listas ya reservadas hijo1 e hijo2.
+    Devuelve el punto de corte, o None si no hubo cruce.
+    """
+    hijo1[:] = a
+    hijo2[:] = b
+    if rng.random() > pc:
+        return None
+    punto = rng.randint(1, len(a)-1)
+    hijo1[punto:] = b[punto:]
+    hijo2[punto:] = a[punto:]
+    return punto
+
+def cruce_un_punto(a, b, pc, rng=random):
+    hijo1, hijo2 = [], []
+    cruce_un_punto_en(a, b, pc, hijo1, hijo2, rng)
     return hijo1, hijo2
 
-def mutacion(ind, catalogo, pm):
+def mutacion(ind, stocks, pm, rng=random):
+    """`stocks` por artículo, de columnas_catalogo (sin buscar en el catálogo gen por gen)."""
     for i in range(len(ind)):
-        if random.random() < pm:
+        if rng.random() < pm:
             # mutar la cantidad: nueva cantidad aleatoria en rango 0..stock
-            ind[i] = random.randint(0, catalogo[i].get('stock', 1))
+            ind[i] = rng.randint(0, stocks[i])
     return ind
 
-# empaquetado simple (shelf / filas) para obtener placements (sin solapamiento)
+def mutacion_incremental(ind, stocks, areas, ganancias, pm, rng=random):
+    """
+    Mutación equivalente en distribución a `mutacion`, pero salta directamente al siguiente gen
+    mutado (distancia geométrica) y devuelve el cambio (d_area, d_ganancia) que produce, así el
+    coste es O(genes mutados) en vez de O(catálogo).
+    """
+    d_area = d_gan = 0.0
+    if pm <= 0:
+        return d_area, d_gan
+    log_q = math.log1p(-pm) if pm < 1 else None
+    i = -1
+    largo = len(ind)
+    while True:
+        i += 1 if log_q is None else 1 + int(math.log(1.0 - rng.random()) / log_q)
+        if i >= largo:
+            return d_area, d_gan
+        nuevo = rng.randint(0, stocks[i])
+        delta = nuevo - ind[i]
+        if delta:
+            ind[i] = nuevo
+            d_area += delta * areas[i]
+            d_gan += delta * ganancias[i]
+
+# empaquetado simple (shelf / filas) para obtener placements (sin solapamiento);
+# cada placement guarda en 'articulo' el índice del artículo en el catálogo
 def empaquetar_con_individuo(ind, catalogo):
     placements = []
     lado_plano = LADO_PLANO
@@ -98,102 +393,728 @@ def empaquetar_con_individuo(ind, catalogo):
                 fila_alto = 0.0
             if y + h > lado_plano + 1e-9:
                 # no cabe, marcar fuera (no incluido)
-                placements.append({'nombre': art['nombre'], 'ancho': w, 'largo': h, 'x': 0.0, 'y': 0.0, 'incluido': False})
+                placements.append({'nombre': art['nombre'], 'ancho': w, 'largo': h, 'x': 0.0, 'y': 0.0, 'incluido': False,
+                                   'articulo': i})
                 continue
-            placements.append({'nombre': art['nombre'], 'ancho': w, 'largo': h, 'x': x, 'y': y, 'incluido': True})
+            placements.append({'nombre': art['nombre'], 'ancho': w, 'largo': h, 'x': x, 'y': y, 'incluido': True,
+                               'articulo': i})
             x += w + margen
             fila_alto = max(fila_alto, h)
     return placements
 
+def empaquetar(ind, catalogo, params=None):
+    """
+    Placements del individuo con el empaquetado elegido en params['empaquetado']:
+    'estanteria' (por defecto, empaquetar_con_individuo) o 'skyline' (empaquetado.py,
+    con params['rotacion'] para permitir giros de 90°).
+    """
+    params = params or {}
+    if params.get('empaquetado', 'estanteria') == 'skyline':
+        from empaquetado import empaquetar_skyline
+        return empaquetar_skyline(ind, catalogo, rotacion=bool(params.get('rotacion', True)))
+    return empaquetar_con_individuo(ind, catalogo)
+
+def construir_resultado(mejor_ind, catalogo, historial, params=None):
+    """Arma el dict de resultado que consume el frontend (común a todos los motores)."""
+    area_total, gan_total = totales_individuo(mejor_ind, catalogo)
+    detalle = []
+    for q, a in zip(mejor_ind, catalogo):
+        detalle.append({
+            'nombre': a['nombre'],
+            'cantidad': int(q),
+            'area_unit': area_item(a),
+            'ganancia_unit': a['ganancia'],
+            'total': int(q) * a['ganancia']
+        })
+
+    placements = empaquetar(mejor_ind, catalogo, params)
+    # lo que de verdad queda en el plano (puede ser menos que mejor_ganancia)
+    gan_colocada = gan_total - sum(catalogo[p['articulo']]['ganancia'] for p in placements if not p['incluido'])
+
+    return {
+        'mejor_individuo': mejor_ind,
+        'mejor_area': area_total,
+        'mejor_ganancia': gan_total,
+        'ganancia_colocada': gan_colocada,
+        'historial': historial,
+        'placements': placements,
+        'detalle': detalle
+    }
+
+def diversidad_poblacion(filas):
+    """Fracción de genotipos distintos en la población."""
+    return len(set(map(tuple, filas))) / len(filas)
+
+def instantanea(generacion, fitnesses, filas, mejor_ind, mejor_fit):
+    """Resumen de una generación para seguir la corrida en vivo (ver iterar_algoritmo_genetico)."""
+    n = len(fitnesses)
+    return {
+        'generacion': generacion,
+        'mejor_fitness': max(fitnesses),
+        'promedio_fitness': sum(fitnesses) / n,
+        'peor_fitness': min(fitnesses),
+        'mejor_global': mejor_fit,
+        'mejor_individuo': list(mejor_ind),
+        'diversidad': diversidad_poblacion(filas),
+    }
+
+# ----------------------------
+# perfilado por fases
+# ----------------------------
+class Perfilador:
+    """
+    Tiempo acumulado y número de llamadas por fase (inicializacion, evaluacion, ordenamiento,
+    estadisticas, seleccion, cruce, mutacion, reparacion, migracion, empaquetado), en total y
+    por generación. Se activa con params['perfilado']; sin él los motores no crean ninguno y
+    no miden nada. Los operadores se miden envolviéndolos (envolver) y los bloques con sumar.
+    """
+    def __init__(self):
+        self.tiempos = {}
+        self.llamadas = {}
+        self.por_generacion = []
+        self._generacion = None
+
+    def nueva_generacion(self):
+        self._generacion = {}
+        self.por_generacion.append(self._generacion)
+
+    def sumar(self, fase, segundos, llamadas=1, en_generacion=True):
+        self.tiempos[fase] = self.tiempos.get(fase, 0.0) + segundos
+        self.llamadas[fase] = self.llamadas.get(fase, 0) + llamadas
+        if en_generacion and self._generacion is not None:
+            self._generacion[fase] = self._generacion.get(fase, 0.0) + segundos
+
+    def envolver(self, fase, funcion):
+        """`funcion` con el tiempo de cada llamada sumado a `fase`."""
+        reloj = time.perf_counter
+        sumar = self.sumar
+        def medida(*args, **kwargs):
+            t0 = reloj()
+            resultado = funcion(*args, **kwargs)
+            sumar(fase, reloj() - t0)
+            return resultado
+        return medida
+
+    def absorber(self, perfil, desde=0):
+        """Suma un perfil (ver resumen) de otro perfilador cuyas generaciones empiezan en `desde`."""
+        for fase, segundos in perfil['tiempos'].items():
+            self.tiempos[fase] = self.tiempos.get(fase, 0.0) + segundos
+        for fase, n in perfil['llamadas'].items():
+            self.llamadas[fase] = self.llamadas.get(fase, 0) + n
+        for k, generacion in enumerate(perfil['por_generacion'], desde):
+            while len(self.por_generacion) <= k:
+                self.por_generacion.append({})
+            for fase, segundos in generacion.items():
+                self.por_generacion[k][fase] = self.por_generacion[k].get(fase, 0.0) + segundos
+
+    def resumen(self):
+        return {'tiempos': dict(self.tiempos), 'llamadas': dict(self.llamadas),
+                'por_generacion': [dict(g) for g in self.por_generacion]}
+
+# ----------------------------
+# parada temprana y mutación adaptativa
+# ----------------------------
+# params de parada: los motores que reparten la población (islas) los evalúan sobre el
+# conjunto y no los pasan a cada subpoblación
+PARAMS_PARADA = ('parada_estancamiento', 'fitness_objetivo', 'tiempo_max', 'diversidad_min')
+
+class CriteriosParada:
+    """
+    Estado de los criterios de parada de una corrida (todos opcionales):
+      - parada_estancamiento: generaciones seguidas sin mejorar el mejor global
+      - fitness_objetivo: parar al alcanzar este fitness
+      - tiempo_max: segundos de reloj desde el inicio
+      - diversidad_min: parar si la fracción de genotipos distintos baja de este valor
+      - cancelar: objeto con is_set() (ver ejecutar_algoritmo_genetico)
+    y de la mutación adaptativa (pm_adaptativa): mientras la diversidad esté por debajo de
+    diversidad_objetivo (0.5) pm se multiplica por 1.5 cada generación hasta pm_max (0.5), y
+    cuando se recupera vuelve gradualmente a la pm de params. `pm` es la tasa a usar en la
+    siguiente generación; `pm_inicial` permite continuar una adaptación ya empezada (islas).
+    """
+    def __init__(self, params, pm_inicial=None):
+        self.estancamiento = int(params.get('parada_estancamiento') or 0)
+        self.objetivo = params.get('fitness_objetivo')
+        self.tiempo_max = params.get('tiempo_max')
+        self.diversidad_min = float(params.get('diversidad_min') or 0.0)
+        self.cancelar = params.get('cancelar')
+        self.adaptativa = bool(params.get('pm_adaptativa', False))
+        self.pm_base = float(params.get('pm', 0.1))
+        self.pm = self.pm_base if pm_inicial is None else pm_inicial
+        self.pm_max = float(params.get('pm_max', 0.5))
+        self.diversidad_objetivo = float(params.get('diversidad_objetivo', 0.5))
+        self.inicio = time.perf_counter()
+        self.mejor = -math.inf
+        self.sin_mejora = 0
+        self.motivo = None
+
+    @property
+    def necesita_diversidad(self):
+        return self.adaptativa or self.diversidad_min > 0
+
+    def cancelada(self):
+        if self.cancelar is not None and self.cancelar.is_set():
+            self.motivo = 'cancelado'
+        return self.motivo == 'cancelado'
+
+    def actualizar(self, mejor_global, diversidad=None):
+        """Registra una generación evaluada; devuelve el motivo de parada o None para seguir."""
+        if self.motivo is not None:
+            return self.motivo
+        if mejor_global > self.mejor:
+            self.mejor = mejor_global
+            self.sin_mejora = 0
+        else:
+            self.sin_mejora += 1
+        if self.adaptativa and diversidad is not None:
+            if diversidad < self.diversidad_objetivo:
+                self.pm = min(self.pm_max, self.pm * 1.5 if self.pm > 0 else 0.01)
+            else:
+                self.pm = max(self.pm_base, self.pm / 1.5)
+
+        if self.objetivo is not None and mejor_global >= self.objetivo:
+            self.motivo = 'objetivo'
+        elif self.estancamiento and self.sin_mejora >= self.estancamiento:
+            self.motivo = 'estancamiento'
+        elif diversidad is not None and diversidad < self.diversidad_min:
+            self.motivo = 'diversidad'
+        elif self.tiempo_max is not None and time.perf_counter() - self.inicio >= self.tiempo_max:
+            self.motivo = 'tiempo'
+        return self.motivo
+
+    def estado(self):
+        """Lo necesario para continuar la corrida desde un punto de control (ver restaurar)."""
+        return {'pm': self.pm, 'mejor': self.mejor, 'sin_mejora': self.sin_mejora,
+                'transcurrido': time.perf_counter() - self.inicio}
+
+    def restaurar(self, estado):
+        self.pm = estado['pm']
+        self.mejor = estado['mejor']
+        self.sin_mejora = estado['sin_mejora']
+        # tiempo_max cuenta también el tiempo corrido antes de la interrupción
+        self.inicio = time.perf_counter() - estado['transcurrido']
+
+    def resumen(self, generaciones):
+        """Claves del resultado: motivo_parada ('generaciones' si se completaron), generación alcanzada."""
+        resumen = {
+            'motivo_parada': self.motivo or 'generaciones',
+            'generacion_final': generaciones,
+            'cancelado': self.motivo == 'cancelado',
+        }
+        if self.adaptativa:
+            resumen['pm_final'] = self.pm
+        return resumen
+
+# ----------------------------
+# puntos de control
+# ----------------------------
+def abrir_puntos_control(params, catalogo, desde=0):
+    """EscritorPuntosControl de la corrida si params['punto_control'] (ruta) está definido, o None."""
+    ruta = params.get('punto_control')
+    if not ruta:
+        return None
+    base = {'motor': params.get('motor', 'listas').lower(), 'catalogo': huella_catalogo(catalogo),
+            'params': params_serializables(params)}
+    return EscritorPuntosControl(ruta, params.get('intervalo_punto_control', 10), base, desde)
+
+def filas_punto_control(columna, n, largo):
+    """Las n filas (listas) de una matriz n x largo guardada aplanada en un punto de control."""
+    if len(columna) != n * largo:
+        raise ValueError("la población del punto de control no coincide con tam_poblacion y el catálogo")
+    return [columna[i * largo:(i + 1) * largo].tolist() for i in range(n)]
+
+def consumir(generador, callback=None):
+    """Recorre un generador iterar_*, pasa cada instantánea a `callback` y devuelve su resultado final."""
+    while True:
+        try:
+            paso = next(generador)
+        except StopIteration as fin:
+            return fin.value
+        if callback is not None:
+            callback(paso)
+
+def sin_instantaneas(params):
+    """Los params de una corrida que nadie sigue en vivo (sin callback): no se arman instantáneas."""
+    if params.get('callback') is not None:
+        return params
+    return dict(params, instantaneas=False)
+
+def iterar_evolucion(poblacion, catalogo, params, generaciones, rng, fitnesses=None, evaluar=None,
+                     instantaneas=True, criterios=None, perfilador=None, estado=None, punto_control=None):
+    """
+    Evoluciona `poblacion` durante `generaciones` con los operadores indicados en params
+    (pc, pm, seleccion, elitismo, torneo_k). Es un generador: tras evaluar cada generación
+    produce su instantánea (o solo el número de generación si instantaneas=False) y al terminar
+    devuelve (poblacion, historial, mejor_ind, mejor_fit); la población devuelta es la última
+    generada, todavía sin evaluar (la última evaluada si se para antes). `criterios` es el
+    CriteriosParada de la corrida (por defecto uno nuevo con los params): decide la parada temprana
+    y, con pm_adaptativa, la pm de cada generación; su `motivo` dice por qué se paró.
+    Con un `perfilador` (Perfilador) se mide el tiempo de cada fase por generación.
+    Si se pasan los `fitnesses` de la población de entrada no se vuelve a evaluar; `evaluar` es la
+    función de fitness (por defecto evaluar_individuo, ver preparar_evaluacion).
+    Con params['evaluacion_incremental'] cada individuo lleva sus totales de área y ganancia:
+    los hijos de un cruce se puntúan con las sumas prefijas de los padres en O(1) y la mutación
+    solo suma el efecto de los genes que cambia. Con fitness 'empaquetado' los totales sirven de
+    filtro: solo se llama a `evaluar` para los individuos que caben por área.
+    Con params['reparacion'] los hijos que no caben se reparan con _reparar (y se rellenan si
+    params['rellenar']) en lugar de depender solo de la penalización.
+    `estado` continúa una corrida reanudada: dict con las generaciones ya hechas ('generacion'),
+    'historial', 'mejor_ind', 'mejor_fit' y, si había evaluación incremental, 'totales' (áreas y
+    ganancias de la población). `punto_control(generacion, filas, totales, historial, mejor_ind,
+    mejor_fit, final=False)` se llama al comienzo de cada generación salvo la primera, con la
+    población aún sin evaluar, y al terminar (final=True) si no paró un criterio.
+    """
+    N = len(poblacion)
+    pc = float(params.get('pc', 0.8))
+    pm = float(params.get('pm', 0.1))
+    seleccion = params.get('seleccion', 'torneo').lower()
+    elitismo = bool(params.get('elitismo', True))
+    torneo_k = int(params.get('torneo_k', 3))
+    incremental = bool(params.get('evaluacion_incremental', False))
+    geometrico = params.get('fitness', 'area') == 'empaquetado'
+    reparacion = bool(params.get('reparacion', False))
+    rellenar = bool(params.get('rellenar', False))
+    if reparacion:
+        datos_reparacion = preparar_reparacion(catalogo)
+    if criterios is None:
+        criterios = CriteriosParada(params)
+    pm = criterios.pm
+    desde = estado['generacion'] if estado is not None else 0
+
+    # dos buffers de población que se intercambian en cada generación; la fila extra
+    # recibe el segundo hijo del último par cuando no cabe en la población
+    largo = len(poblacion[0]) if poblacion else 0
+    actual = [list(ind) for ind in poblacion] + [[0] * largo]
+    siguiente = [[0] * largo for _ in range(N + 1)]
+
+    evaluar = evaluar or evaluar_individuo
+
+    # operadores como variables locales; con perfilado se envuelven para medir cada fase
+    sel_torneo, sel_ruleta, sel_sus, acumular = (seleccion_torneo_idx, seleccion_ruleta_idx,
+                                                 seleccion_sus_idx, indice_ruleta)
+    cruzar, prefijos_de = cruce_un_punto_en, prefijos_individuo
+    mutar, mutar_incremental, reparar = mutacion, mutacion_incremental, _reparar
+    if perfilador is not None:
+        reloj = time.perf_counter
+        envolver = perfilador.envolver
+        sel_torneo, sel_ruleta, sel_sus, acumular = (envolver('seleccion', f) for f in
+                                                     (sel_torneo, sel_ruleta, sel_sus, acumular))
+        cruzar = envolver('cruce', cruzar)
+        prefijos_de = envolver('evaluacion', prefijos_de)
+        mutar, mutar_incremental = envolver('mutacion', mutar), envolver('mutacion', mutar_incremental)
+        reparar = envolver('reparacion', reparar)
+
+    areas, ganancias, stocks = columnas_catalogo(catalogo)
+    if incremental:
+        # totales por fila, con los mismos dos buffers que la población; al reanudar se usan los
+        # guardados, que arrastran el mismo redondeo que la corrida original
+        if estado is not None and estado.get('totales'):
+            area_act = list(estado['totales'][0]) + [0.0]
+            gan_act = list(estado['totales'][1]) + [0.0]
+        else:
+            area_act = [0.0] * (N + 1)
+            gan_act = [0.0] * (N + 1)
+            for i in range(N):
+                area_act[i] = sum(map(operator.mul, actual[i], areas))
+                gan_act[i] = sum(map(operator.mul, actual[i], ganancias))
+        area_sig = [0.0] * (N + 1)
+        gan_sig = [0.0] * (N + 1)
+
+    mejor_ind = None
+    mejor_fit = -1e18
+    historial = []
+    if estado is not None:
+        historial = list(estado['historial'])
+        mejor_fit = estado['mejor_fit']
+        if estado['mejor_ind'] is not None:
+            mejor_ind = list(estado['mejor_ind'])
+
+    for g in range(generaciones):
+        if g and punto_control is not None:
+            punto_control(desde + g, actual, (area_act, gan_act) if incremental else None,
+                          historial, mejor_ind, mejor_fit)
+        if criterios.cancelada():
+            break
+        if perfilador is not None:
+            perfilador.nueva_generacion()
+            t0 = reloj()
+        # evaluar (la población de entrada puede llegar ya evaluada)
+        if incremental and geometrico:
+            fitnesses = [evaluar(actual[i], catalogo) if area_act[i] <= AREA_MAXIMA
+                         else fitness_desde_totales(area_act[i], gan_act[i]) for i in range(N)]
+        elif incremental:
+            fitnesses = [fitness_desde_totales(area_act[i], gan_act[i]) for i in range(N)]
+        elif g or fitnesses is None:
+            fitnesses = [evaluar(actual[i], catalogo) for i in range(N)]
+        if perfilador is not None:
+            t1 = reloj()
+            perfilador.sumar('evaluacion', t1 - t0, N)
+        if not N:
+            historial.append(0.0)
+            yield desde + g + 1
+            continue
+        i_mejor = max(range(N), key=fitnesses.__getitem__)
+        if fitnesses[i_mejor] > mejor_fit:
+            mejor_fit = fitnesses[i_mejor]
+            if mejor_ind is None:
+                mejor_ind = [0] * largo
+            mejor_ind[:] = actual[i_mejor]
+        historial.append(fitnesses[i_mejor])
+        if perfilador is not None:
+            t2 = reloj()
+            perfilador.sumar('ordenamiento', t2 - t1)
+        diversidad = None
+        if instantaneas:
+            paso = instantanea(desde + g + 1, fitnesses, actual[:N], mejor_ind, mejor_fit)
+            diversidad = paso['diversidad']
+        elif criterios.necesita_diversidad:
+            diversidad = diversidad_poblacion(actual[:N])
+        if perfilador is not None:
+            perfilador.sumar('estadisticas', reloj() - t2)
+        yield paso if instantaneas else desde + g + 1
+        if criterios.actualizar(mejor_fit, diversidad):
+            break
+        pm = criterios.pm
+
+        pos = 0
+        # elitismo
+        if elitismo:
+            siguiente[0][:] = actual[i_mejor]
+            if incremental:
+                area_sig[0] = area_act[i_mejor]
+                gan_sig[0] = gan_act[i_mejor]
+            pos = 1
+
+        # sumas prefijas de los padres de esta generación, calculadas solo si hacen falta
+        prefijos = {}
+
+        # reproducir
+        if seleccion == 'sus' or seleccion.startswith('r'):
+            acumulado = acumular(fitnesses)
+        if seleccion == 'sus':
+            # todos los padres de la generación en una sola pasada
+            padres = iter(sel_sus(acumulado, 2 * ((N - pos + 1) // 2), rng))
+        while pos < N:
+            if seleccion == 'sus':
+                i1 = next(padres)
+                i2 = next(padres)
+            elif seleccion.startswith('r'):
+                i1 = sel_ruleta(acumulado, rng)
+                i2 = sel_ruleta(acumulado, rng)
+            else:
+                i1 = sel_torneo(fitnesses, k=torneo_k, rng=rng)
+                i2 = sel_torneo(fitnesses, k=torneo_k, rng=rng)
+            c1, c2 = siguiente[pos], siguiente[pos + 1]
+            punto = cruzar(actual[i1], actual[i2], pc, c1, c2, rng)
+            if incremental:
+                if punto is None:
+                    a1, g1 = area_act[i1], gan_act[i1]
+                    a2, g2 = area_act[i2], gan_act[i2]
+                else:
+                    # hijo1 = prefijo de p1 + sufijo de p2 (y al revés para hijo2)
+                    for i in (i1, i2):
+                        if i not in prefijos:
+                            prefijos[i] = prefijos_de(actual[i], areas, ganancias)
+                    (pa1, pg1), (pa2, pg2) = prefijos[i1], prefijos[i2]
+                    a1 = pa1[punto] + area_act[i2] - pa2[punto]
+                    g1 = pg1[punto] + gan_act[i2] - pg2[punto]
+                    a2 = pa2[punto] + area_act[i1] - pa1[punto]
+                    g2 = pg2[punto] + gan_act[i1] - pg1[punto]
+                da1, dg1 = mutar_incremental(c1, stocks, areas, ganancias, pm, rng)
+                da2, dg2 = mutar_incremental(c2, stocks, areas, ganancias, pm, rng)
+                area_sig[pos], gan_sig[pos] = a1 + da1, g1 + dg1
+                area_sig[pos + 1], gan_sig[pos + 1] = a2 + da2, g2 + dg2
+            else:
+                mutar(c1, stocks, pm, rng)
+                mutar(c2, stocks, pm, rng)
+            # reparar si sobrepasa: quitar unidades de menor ganancia/área
+            if reparacion:
+                for p in (pos, pos + 1):
+                    if incremental:
+                        area_sig[p], d_gan = reparar(siguiente[p], datos_reparacion, area_sig[p], rellenar)
+                        gan_sig[p] += d_gan
+                    else:
+                        area = sum(map(operator.mul, siguiente[p], datos_reparacion[0]))
+                        reparar(siguiente[p], datos_reparacion, area, rellenar)
+            pos += 2
+
+        actual, siguiente = siguiente, actual
+        if incremental:
+            area_act, area_sig = area_sig, area_act
+            gan_act, gan_sig = gan_sig, gan_act
+
+    if punto_control is not None and criterios.motivo in (None, 'cancelado'):
+        punto_control(len(historial), actual, (area_act, gan_act) if incremental else None,
+                      historial, mejor_ind, mejor_fit, final=True)
+
+    poblacion = actual[:N]
+    return poblacion, historial, mejor_ind, mejor_fit
+
 # ----------------------------
 # Ejecutar GA (expuesto)
 # ----------------------------
 def ejecutar_algoritmo_genetico(params):
     """
+    Ejecuta el GA completo y devuelve el dict de resultado (ver iterar_algoritmo_genetico).
     params dict:
-      - catalogo: list of items (each: nombre, ancho, largo, ganancia, stock)
+      - catalogo: list of items (each: nombre, ancho, largo, ganancia, stock) o un
+        catalogo.CatalogoColumnar (ver catalogo.cargar_catalogo)
       - tam_poblacion
       - generaciones
       - pc
       - pm
-      - seleccion: 'torneo' or 'ruleta'
+      - seleccion: 'torneo', 'ruleta' or 'sus' (muestreo universal estocástico)
       - elitismo: bool
       - torneo_k (int)
+      - motor: 'listas' (por defecto), 'numpy' (población como matriz, ver motor_numpy.py)
+        o 'islas' (modelo de islas en varios procesos, ver islas.py); 'dp' devuelve el óptimo
+        exacto de la mochila acotada (solver_dp.py) en el mismo formato; 'nsga2' optimiza varios
+        objetivos a la vez (params['objetivos']) y añade resultado['frente_pareto'] (ver nsga2.py)
+      - semilla: int opcional para resultados reproducibles
+      - evaluacion_incremental: bool, puntúa a los hijos a partir de los totales de sus padres
+        (ver iterar_evolucion)
+      - empaquetado: 'estanteria' (por defecto) o 'skyline'; rotacion: bool (solo skyline)
+      - reparacion: bool, repara los hijos que exceden AREA_MAXIMA; rellenar: bool, ocupa el hueco
+        que queda con los artículos de mayor ganancia/área
+      - fraccion_greedy: fracción de la población inicial sembrada con soluciones voraces
+        (ruido_greedy controla cuánto difieren entre sí)
+      - inyectar_dp: bool, incluye en la población inicial la solución exacta de solver_dp.py
+      - fitness: 'area' (por defecto, ganancia penalizada por exceso de área) o 'empaquetado'
+        (ganancia de lo que el empaquetador coloca; tiempos en resultado['tiempos_evaluacion'])
+      - cache_fitness: tamaño máximo de la caché LRU de fitness (0 = sin caché); sus
+        contadores se devuelven en resultado['cache_fitness']
+      (evaluacion_incremental, reparacion, fraccion_greedy, inyectar_dp, fitness y cache_fitness
+      aplican a los motores 'listas' e 'islas')
+      - callback: función opcional que recibe la instantánea de cada generación; sin callback
+        no se arman instantáneas (ver iterar_algoritmo_genetico)
+      - cancelar: objeto con is_set() (p. ej. threading.Event) para detener la corrida; el
+        resultado se arma con lo mejor encontrado y lleva 'cancelado': True
+      - parada temprana (opcional): parada_estancamiento, fitness_objetivo, tiempo_max,
+        diversidad_min; y pm_adaptativa (con diversidad_objetivo, pm_max). Ver CriteriosParada.
+      - perfilado: si es True, resultado['perfil'] trae el tiempo y las llamadas por fase, en
+        total y por generación (ver Perfilador), y el tiempo total de la corrida
+      - cache_resultados: True (directorio .cache_resultados) o un directorio donde guardar los
+        resultados de las corridas con semilla; una corrida idéntica (mismo catálogo, params y
+        semilla) devuelve el guardado sin ejecutar el GA. cache_max_mb acota su tamaño en disco
+        (256 por defecto, se desalojan las menos usadas). Con arranque_en_caliente, si solo cambia
+        'generaciones' se continúa la corrida guardada más larga que no llegue a ellas, con el
+        mismo resultado que empezando de cero. resultado['cache_resultados'] dice 'acierto',
+        'continuacion' o 'nuevo'; con perfilado o punto_control la corrida se ejecuta siempre
+        (ver _iterar_con_cache)
+      - punto_control: ruta de un archivo donde guardar el estado de la corrida cada
+        intervalo_punto_control generaciones (por defecto 10) y al terminar, para continuarla con
+        reanudar_algoritmo_genetico; resultado['punto_control'] resume lo escrito (motores
+        'listas', 'numpy' e 'islas'; en islas se guarda al final de la época que cruza el intervalo)
+        El resultado indica 'motivo_parada' ('generaciones', 'estancamiento', 'objetivo',
+        'tiempo', 'diversidad' o 'cancelado') y 'generacion_final'.
+    """
+    return consumir(iterar_algoritmo_genetico(sin_instantaneas(params)), params.get('callback'))
+
+def iterar_algoritmo_genetico(params, estado=None):
     """
+    Generador con los mismos params que ejecutar_algoritmo_genetico. Produce una instantánea por
+    generación (generacion, mejor_fitness, promedio_fitness, peor_fitness, mejor_global,
+    mejor_individuo, diversidad) y devuelve el dict de resultado como valor de retorno
+    (StopIteration.value, o `resultado = yield from ...`). Ver consumir().
+    Con params['instantaneas'] = False solo produce el número de cada generación: se ahorra
+    armar las instantáneas (y medir la diversidad, salvo que la pidan los criterios de parada).
+    `estado` es un punto de control leído (meta, columnas) desde el que continuar la corrida en
+    lugar de empezarla (ver iterar_reanudacion).
+    """
+    if params.get('cache_resultados') and estado is None:
+        return (yield from _iterar_con_cache(params))
+    motor = params.get('motor', 'listas').lower()
+    if motor == 'numpy':
+        from motor_numpy import iterar_algoritmo_genetico_numpy
+        return (yield from iterar_algoritmo_genetico_numpy(params, estado))
+    if motor == 'islas':
+        from islas import iterar_algoritmo_genetico_islas
+        return (yield from iterar_algoritmo_genetico_islas(params, estado))
+    if motor == 'nsga2':
+        from nsga2 import iterar_nsga2
+        return (yield from iterar_nsga2(params))
+    if motor == 'dp':
+        from solver_dp import resolver_knapsack_dp
+        return resolver_knapsack_dp(params)
+
     catalogo = params.get('catalogo', CATALOGO_POR_DEFECTO)
     N = int(params.get('tam_poblacion', 60))
     gen_max = int(params.get('generaciones', 40))
-    pc = float(params.get('pc', 0.8))
-    pm = float(params.get('pm', 0.1))
-    seleccion = params.get('seleccion', 'torneo').lower()
-    elitismo = bool(params.get('elitismo', True))
-    torneo_k = int(params.get('torneo_k', 3))
+    perfilador = Perfilador() if params.get('perfilado') else None
+    inicio = time.perf_counter()
 
-    # inicializar poblacion
-    poblacion = [crear_individuo_aleatorio(catalogo) for _ in range(N)]
-    fitnesses = [evaluar_individuo(ind, catalogo) for ind in poblacion]
+    if estado is None:
+        rng = random.Random(params.get('semilla'))
+        # inicializar poblacion
+        poblacion = poblacion_inicial(catalogo, N, params, rng)
+        previo = None
+    else:
+        meta, columnas = estado
+        rng = restaurar_random(meta['rng'], columnas['rng'])
+        poblacion = filas_punto_control(columnas['poblacion'], N, len(catalogo))
+        previo = {'generacion': meta['generacion'], 'historial': columnas['historial'].tolist(),
+                  'mejor_ind': columnas['mejor_individuo'].tolist() or None, 'mejor_fit': meta['mejor_fit'],
+                  'totales': (columnas['area'], columnas['ganancia']) if 'area' in columnas else None}
 
-    mejor_ind = None
-    mejor_fit = -1e18
-    historial = []
+    evaluar, cache, evaluador = preparar_evaluacion(params)
+    if perfilador is not None:
+        perfilador.sumar('inicializacion', time.perf_counter() - inicio, en_generacion=False)
 
-    for g in range(gen_max):
-        # evaluar
-        fitnesses = [evaluar_individuo(ind, catalogo) for ind in poblacion]
-        # ordenar
-        pares = sorted(zip(poblacion, fitnesses), key=lambda x: x[1], reverse=True)
-        if pares and pares[0][1] > mejor_fit:
-            mejor_fit = pares[0][1]
-            mejor_ind = copy.deepcopy(pares[0][0])
-        historial.append(pares[0][1] if pares else 0.0)
-
-        nueva = []
-        # elitismo
-        if elitismo and pares:
-            nueva.append(copy.deepcopy(pares[0][0]))
+    criterios = CriteriosParada(params)
+    if estado is not None:
+        criterios.restaurar(meta['criterios'])
 
-        # reproducir
-        while len(nueva) < N:
-            if seleccion.startswith('r'):
-                p1 = seleccion_ruleta(poblacion, fitnesses)
-                p2 = seleccion_ruleta(poblacion, fitnesses)
-            else:
-                p1 = seleccion_torneo(poblacion, fitnesses, k=torneo_k)
-                p2 = seleccion_torneo(poblacion, fitnesses, k=torneo_k)
-            c1, c2 = cruce_un_punto(p1, p2, pc)
-            c1 = mutacion(c1, catalogo, pm)
-            c2 = mutacion(c2, catalogo, pm)
-            # reparar si sobrepasa (heurística simple: decrementar elementos con baja eficacia)
-            # aquí usamos evaluar_individuo con penalización alta en vez de reparación complicada
-            nueva.extend([c1, c2])
+    escritor = abrir_puntos_control(params, catalogo, previo['generacion'] if previo else 0)
+    guardar = None
+    if escritor is not None:
+        def guardar(generacion, filas, totales, historial, mejor_ind, mejor_fit, final=False):
+            if not (escritor.toca(generacion) or (final and generacion != escritor.ultima)):
+                return
+            # copia compacta del estado; la escritura del archivo queda para el hilo del escritor
+            meta_rng, interno = estado_random(rng)
+            columnas = {'poblacion': array('q', itertools.chain.from_iterable(filas[:N])),
+                        'mejor_individuo': array('q', mejor_ind or ()),
+                        'historial': array('d', historial), 'rng': interno}
+            if totales is not None:
+                columnas['area'] = array('d', totales[0][:N])
+                columnas['ganancia'] = array('d', totales[1][:N])
+            escritor.enviar(generacion, {'filas': N, 'mejor_fit': mejor_fit, 'criterios': criterios.estado(),
+                                         'rng': meta_rng}, columnas)
 
-        poblacion = nueva[:N]
+    try:
+        poblacion, historial, mejor_ind, mejor_fit = yield from iterar_evolucion(
+            poblacion, catalogo, params, gen_max - (previo['generacion'] if previo else 0), rng,
+            evaluar=evaluar, instantaneas=params.get('instantaneas', True), criterios=criterios,
+            perfilador=perfilador, estado=previo, punto_control=guardar)
+    finally:
+        if escritor is not None:
+            escritor.cerrar()
 
     # resultado final
     if mejor_ind is None:
         mejor_ind = poblacion[0]
-    area_total = sum(q * area_item(a) for q, a in zip(mejor_ind, catalogo))
-    gan_total = sum(q * a['ganancia'] for q, a in zip(mejor_ind, catalogo))
-    detalle = []
-    for q, a in zip(mejor_ind, catalogo):
-        detalle.append({
-            'nombre': a['nombre'],
-            'cantidad': int(q),
-            'area_unit': area_item(a),
-            'ganancia_unit': a['ganancia'],
-            'total': int(q) * a['ganancia']
-        })
+    t0 = time.perf_counter()
+    resultado = construir_resultado(mejor_ind, catalogo, historial, params)
+    resultado.update(criterios.resumen(len(historial)))
+    resultado.update(estadisticas_evaluacion(cache, evaluador))
+    if escritor is not None:
+        resultado['punto_control'] = escritor.resumen()
+    if perfilador is not None:
+        perfilador.sumar('empaquetado', time.perf_counter() - t0, en_generacion=False)
+        resultado['perfil'] = dict(perfilador.resumen(), total=time.perf_counter() - inicio)
+    return resultado
 
-    placements = empaquetar_con_individuo(mejor_ind, catalogo)
+# ----------------------------
+# caché de resultados
+# ----------------------------
+# valores por defecto de los params principales: pedirlos explícitamente u omitirlos da la misma clave
+PARAMS_POR_DEFECTO = {'motor': 'listas', 'tam_poblacion': 60, 'generaciones': 40, 'pc': 0.8, 'pm': 0.1,
+                      'seleccion': 'torneo', 'elitismo': True, 'torneo_k': 3}
+# params que no cambian el resultado de una corrida
+PARAMS_SIN_EFECTO = ('perfilado', 'punto_control', 'intervalo_punto_control', 'cache_resultados', 'cache_max_mb',
+                     'arranque_en_caliente', 'cache_fitness', 'trabajadores')
+MOTORES_CON_PUNTO_CONTROL = ('listas', 'numpy', 'islas')
 
-    return {
-        'mejor_individuo': mejor_ind,
-        'mejor_area': area_total,
-        'mejor_ganancia': gan_total,
-        'historial': historial,
-        'placements': placements,
-        'detalle': detalle
-    }
+def params_canonicos(params):
+    """Params que determinan el resultado, con los valores por defecto explícitos y normalizados."""
+    canonicos = dict(PARAMS_POR_DEFECTO)
+    canonicos.update((k, v) for k, v in params_serializables(params).items() if k not in PARAMS_SIN_EFECTO)
+    canonicos['motor'] = str(canonicos['motor']).lower()
+    canonicos['seleccion'] = str(canonicos['seleccion']).lower()
+    for clave, tipo in (('tam_poblacion', int), ('generaciones', int), ('torneo_k', int), ('pc', float),
+                        ('pm', float), ('elitismo', bool)):
+        canonicos[clave] = tipo(canonicos[clave])
+    return canonicos
+
+def _iterar_con_cache(params):
+    """
+    iterar_algoritmo_genetico a través de la caché de resultados (ver ejecutar_algoritmo_genetico).
+    Las corridas sin semilla no son reproducibles y no se guardan; tampoco las canceladas o
+    paradas por tiempo_max. Para los motores con puntos de control se guarda también el estado
+    final de las corridas que completan sus generaciones, que es lo que permite continuarlas.
+    Con perfilado o punto_control se pide algo que un resultado guardado no trae (los tiempos de
+    esta corrida, el archivo escrito): la corrida se ejecuta entera, sin buscarla en la caché ni
+    arrancar en caliente, y se guarda como cualquier otra.
+    """
+    sin_cache = dict(params, cache_resultados=None)
+    canonicos = params_canonicos(params)
+    motor = canonicos['motor']
+    if canonicos.get('semilla') is None and motor != 'dp':
+        return (yield from iterar_algoritmo_genetico(sin_cache))
+
+    directorio = params['cache_resultados']
+    cache = CacheResultados(None if directorio is True else directorio, params.get('cache_max_mb', TAM_MAX_MB))
+    generaciones = canonicos.pop('generaciones')
+    clave = clave_corrida(huella_catalogo(params.get('catalogo', CATALOGO_POR_DEFECTO)), canonicos)
+    propio = params.get('punto_control')
+    completa = bool(params.get('perfilado') or propio)
+    resultado = None if completa else cache.obtener(clave, generaciones)
+    if resultado is not None:
+        resultado['cache_resultados'] = 'acierto'
+        return resultado
+
+    temporal = None
+    if motor in MOTORES_CON_PUNTO_CONTROL and not propio:
+        # solo el estado final: el intervalo no se alcanza nunca
+        temporal = cache.ruta_temporal()
+        sin_cache.update(punto_control=temporal, intervalo_punto_control=generaciones + 1)
+    origen = None
+    if motor in MOTORES_CON_PUNTO_CONTROL and params.get('arranque_en_caliente') and not completa:
+        ruta = cache.continuacion(clave, generaciones)
+        try:
+            origen = leer_punto_control(ruta) if ruta else None
+        except (OSError, ValueError):
+            pass  # entrada dañada o desalojada entre tanto: se empieza de cero
+    try:
+        if origen is not None:
+            # misma clave: el catálogo y los params que fijan la población son los guardados
+            resultado = yield from iterar_algoritmo_genetico(dict(origen[0]['params'], **sin_cache), origen)
+        else:
+            resultado = yield from iterar_algoritmo_genetico(sin_cache)
+        if temporal is not None:
+            del resultado['punto_control']
+        if resultado.get('motivo_parada') not in ('cancelado', 'tiempo'):
+            estado_final = None
+            if resultado.get('motivo_parada') == 'generaciones' and motor in MOTORES_CON_PUNTO_CONTROL:
+                estado_final = temporal or propio
+            # sin lo que es propio de esta ejecución
+            guardado = {k: v for k, v in resultado.items() if k not in ('perfil', 'punto_control')}
+            cache.guardar(clave, generaciones, guardado, estado_final, mover=temporal is not None)
+    finally:
+        if temporal is not None and os.path.exists(temporal):
+            os.remove(temporal)
+    resultado['cache_resultados'] = 'continuacion' if origen is not None else 'nuevo'
+    return resultado
+
+# params que fijan la forma de la población guardada: no se pueden cambiar al reanudar
+PARAMS_FIJOS_REANUDACION = ('motor', 'tam_poblacion', 'islas')
+
+def reanudar_algoritmo_genetico(ruta, params=None):
+    """
+    Continúa la corrida guardada en el punto de control `ruta` (ver params['punto_control']) y
+    devuelve su dict de resultado: para una semilla dada es el mismo que el de la corrida sin
+    interrumpir. Ver iterar_reanudacion.
+    """
+    params = params or {}
+    return consumir(iterar_reanudacion(ruta, sin_instantaneas(params)), params.get('callback'))
+
+def iterar_reanudacion(ruta, params=None):
+    """
+    Generador como iterar_algoritmo_genetico a partir del punto de control `ruta`. Se usan los
+    params guardados, actualizados con `params`: el catálogo (obligatorio si no era el por defecto,
+    y tiene que ser el mismo), callback, cancelar y lo que se quiera cambiar, p. ej. un número
+    mayor de generaciones para prolongar una corrida ya terminada. Sigue escribiendo en el mismo
+    punto de control salvo que `params` indique otro.
+    """
+    meta, columnas = leer_punto_control(ruta)
+    cambios = params or {}
+    for clave in PARAMS_FIJOS_REANUDACION:
+        if clave in cambios and cambios[clave] != meta['params'].get(clave, cambios[clave]):
+            raise ValueError(f"'{clave}' no se puede cambiar al reanudar una corrida")
+    params = dict(meta['params'], **cambios)
+    catalogo = params.get('catalogo', CATALOGO_POR_DEFECTO)
+    if huella_catalogo(catalogo) != meta['catalogo']:
+        raise ValueError(f"{ruta}: el catálogo no es el de la corrida guardada")
+    return (yield from iterar_algoritmo_genetico(params, (meta, columnas)))
 
 # prueba rápida
 if __name__ == "__main__":
@@ -0,0 +1,31 @@
+# bench_brecha.py
+# Brecha de optimalidad del GA frente al óptimo exacto de solver_dp.py y tiempo de la DP.
+#   python benchmarks/bench_brecha.py
+from comun import catalogo_sintetico, cronometrar
+
+from backend import ejecutar_algoritmo_genetico
+from solver_dp import brecha_optimalidad, resolver_knapsack_dp
+
+VARIANTES = [
+    ("GA penalización", {}),
+    ("GA reparación", {"reparacion": True, "rellenar": True}),
+    ("GA + semilla DP", {"reparacion": True, "rellenar": True, "inyectar_dp": True}),
+]
+
+
+def main():
+    print(f"{'artículos':>9} {'DP (s)':>8} {'óptimo':>8} {'variante':>16} {'brecha':>8} {'GA (s)':>8}")
+    for n_art in (12, 100, 1000):
+        catalogo = catalogo_sintetico(n_art)
+        # las dimensiones sintéticas tienen 2 decimales: con rejilla de 1e-4 m² la DP es exacta
+        # (salvo que memoria_max_mb obligue a engrosarla)
+        t_dp, res_dp = cronometrar(resolver_knapsack_dp, {"catalogo": catalogo, "resolucion_area": 1e-4})
+        for nombre, extra in VARIANTES:
+            params = dict({"catalogo": catalogo, "tam_poblacion": 80, "generaciones": 60, "semilla": 0}, **extra)
+            t_ga, res_ga = cronometrar(ejecutar_algoritmo_genetico, params)
+            print(f"{n_art:>9} {t_dp:>8.2f} {res_dp['mejor_ganancia']:>8.0f} {nombre:>16} "
+                  f"{100 * brecha_optimalidad(res_ga, res_dp):>7.2f}% {t_ga:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
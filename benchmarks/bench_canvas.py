@@ -0,0 +1,75 @@
+# bench_canvas.py
+# Tiempo de redibujado del plano 2D según el número de placements: dibujo inicial, redibujado
+# reutilizando items, plano alejado (agregación por celdas) y, como referencia, borrar y
+# recrear todo en cada pasada con el color MD5 recalculado (el dibujo anterior).
+# Necesita una pantalla (o Xvfb), porque mide el Canvas real de Tk.
+#   python benchmarks/bench_canvas.py
+import hashlib
+import random
+import time
+import tkinter as tk
+
+import comun  # noqa: F401  (sys.path)
+
+from backend import AREA_MAXIMA
+from frontend import RenderizadorPlano
+
+TAM = 640
+CANTIDADES = (100, 1000, 5000, 20000)
+
+
+def placements_sinteticos(n, n_articulos=50, semilla=0):
+    """Rejilla de n rectángulos que cubre el plano, con nombres de `n_articulos` artículos."""
+    rnd = random.Random(semilla)
+    lado = AREA_MAXIMA ** 0.5
+    columnas = int(n ** 0.5) + 1
+    celda = lado / columnas
+    return [{"nombre": f"SKU {rnd.randrange(n_articulos)}", "ancho": celda * 0.9, "largo": celda * 0.9,
+             "x": (i % columnas) * celda, "y": (i // columnas) * celda, "incluido": True} for i in range(n)]
+
+
+def pintar_recreando(canvas, placements):
+    """Dibujo sin reutilización: delete("all") y un MD5 por placement."""
+    canvas.delete("all")
+    escala = (TAM - 40) / AREA_MAXIMA ** 0.5
+    for p in placements:
+        x, y = 20 + p["x"] * escala, 20 + p["y"] * escala
+        w, h = p["ancho"] * escala, p["largo"] * escala
+        c = int(hashlib.md5(p["nombre"].encode()).hexdigest(), 16)
+        color = f"#{(100 + c % 130):02x}{(100 + (c >> 8) % 130):02x}{(100 + (c >> 16) % 130):02x}"
+        canvas.create_rectangle(x, y, x + w, y + h, fill=color, outline="black", width=1.2)
+        canvas.create_text(x + w / 2, y + h / 2, text=p["nombre"], font=("Arial", 8, "bold"), fill="black")
+
+
+def medir(root, fn, *args):
+    """Segundos de la llamada más el repintado de Tk que provoca."""
+    t0 = time.perf_counter()
+    fn(*args)
+    root.update_idletasks()
+    return time.perf_counter() - t0
+
+
+def main():
+    root = tk.Tk()
+    root.withdraw()
+    print(f"{'placements':>10} {'recrear':>9} {'inicial':>9} {'redibujo':>9} {'alejado':>9}")
+    for n in CANTIDADES:
+        a, b = placements_sinteticos(n, semilla=1), placements_sinteticos(n, semilla=2)
+
+        canvas = tk.Canvas(root, width=TAM, height=TAM)
+        t_recrear = min(medir(root, pintar_recreando, canvas, pl) for pl in (a, b))
+        canvas.destroy()
+
+        canvas = tk.Canvas(root, width=TAM, height=TAM)
+        render = RenderizadorPlano(canvas, TAM)
+        t_inicial = medir(root, render.pintar, a)
+        t_redibujo = medir(root, render.pintar, b)
+        t_alejado = medir(root, render.acercar, 0.2)
+        canvas.destroy()
+        print(f"{n:>10} {t_recrear * 1e3:>7.1f}ms {t_inicial * 1e3:>7.1f}ms "
+              f"{t_redibujo * 1e3:>7.1f}ms {t_alejado * 1e3:>7.1f}ms")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# bench_empaquetado.py
+# Throughput (individuos empaquetados por segundo) y aprovechamiento del plano del empaquetado
+# por estanterías (backend.py) frente al skyline (empaquetado.py).
+#   python benchmarks/bench_empaquetado.py
+import random
+import time
+
+from comun import catalogo_sintetico
+
+from backend import AREA_MAXIMA, area_item, empaquetar_con_individuo
+from empaquetado import empaquetar_skyline
+
+N_INDIVIDUOS = 200
+
+EMPAQUETADORES = [
+    ("estanteria", empaquetar_con_individuo),
+    ("skyline", lambda ind, cat: empaquetar_skyline(ind, cat, rotacion=False)),
+    ("skyline+rot", empaquetar_skyline),
+]
+
+
+def individuos_factibles(catalogo, n, semilla=0):
+    """Individuos aleatorios recortados hasta cumplir el área máxima (factibles según el GA)."""
+    rnd = random.Random(semilla)
+    inds = []
+    for _ in range(n):
+        ind = [rnd.randint(0, a["stock"]) for a in catalogo]
+        area = sum(q * area_item(a) for q, a in zip(ind, catalogo))
+        while area > AREA_MAXIMA:
+            i = rnd.randrange(len(ind))
+            if ind[i]:
+                ind[i] -= 1
+                area -= area_item(catalogo[i])
+        inds.append(ind)
+    return inds
+
+
+def main():
+    print(f"{'artículos':>9} {'empaquetado':>12} {'ind/s':>9} {'área colocada':>14} {'unidades fuera':>15}")
+    for n_art in (12, 50, 200):
+        catalogo = catalogo_sintetico(n_art)
+        inds = individuos_factibles(catalogo, N_INDIVIDUOS)
+        for nombre, fn in EMPAQUETADORES:
+            t0 = time.perf_counter()
+            resultados = [fn(ind, catalogo) for ind in inds]
+            dt = time.perf_counter() - t0
+            area = sum(p["ancho"] * p["largo"] for pl in resultados for p in pl if p["incluido"])
+            fuera = sum(1 for pl in resultados for p in pl if not p["incluido"])
+            total = sum(len(pl) for pl in resultados)
+            print(f"{n_art:>9} {nombre:>12} {len(inds) / dt:>9.0f} "
+                  f"{100 * area / (AREA_MAXIMA * len(inds)):>13.1f}% {100 * fuera / max(total, 1):>14.1f}%")
+
+
+if __name__ == "__main__":
+    main()
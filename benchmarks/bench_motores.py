@@ -0,0 +1,40 @@
+# bench_motores.py
+# Compara el motor de listas (backend.py), con y sin evaluación incremental, con el motor
+# vectorizado (motor_numpy.py)
+#   python benchmarks/bench_motores.py
+from comun import catalogo_sintetico, cronometrar
+
+from backend import ejecutar_algoritmo_genetico
+
+ESCENARIOS = [
+    # (artículos, población, generaciones)
+    (12, 60, 40),
+    (100, 500, 30),
+    (300, 2000, 20),
+]
+REPETICIONES = 3  # mejor de N para todos los motores, así la razón compara lo mismo
+
+
+def main():
+    print(f"{'artículos':>9} {'población':>9} {'gen':>4} {'listas (s)':>11} {'incremental (s)':>15} "
+          f"{'numpy (s)':>10} {'speedup':>8}")
+    for n_art, n_pob, n_gen in ESCENARIOS:
+        params = {
+            "catalogo": catalogo_sintetico(n_art),
+            "tam_poblacion": n_pob,
+            "generaciones": n_gen,
+            "semilla": 1,
+        }
+        t_listas, _ = cronometrar(ejecutar_algoritmo_genetico, dict(params, motor="listas"),
+                                  repeticiones=REPETICIONES)
+        t_incr, _ = cronometrar(ejecutar_algoritmo_genetico,
+                                dict(params, motor="listas", evaluacion_incremental=True),
+                                repeticiones=REPETICIONES)
+        t_numpy, _ = cronometrar(ejecutar_algoritmo_genetico, dict(params, motor="numpy"),
+                                 repeticiones=REPETICIONES)
+        print(f"{n_art:>9} {n_pob:>9} {n_gen:>4} {t_listas:>11.3f} {t_incr:>15.3f} "
+              f"{t_numpy:>10.3f} {t_listas / t_numpy:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
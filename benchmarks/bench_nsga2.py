@@ -0,0 +1,74 @@
+# bench_nsga2.py
+# Ordenamiento no dominado y crowding del modo multiobjetivo (nsga2.py) frente al ordenamiento
+# rápido no dominado clásico de NSGA-II en Python puro, por tamaño de población (padres + hijos).
+#   python benchmarks/bench_nsga2.py
+from comun import catalogo_sintetico, cronometrar
+
+import numpy as np
+
+from motor_numpy import crear_poblacion_aleatoria, vectores_catalogo
+from nsga2 import distancia_crowding, matriz_objetivos, ordenar_no_dominados
+
+TAMANOS = (200, 500, 1000, 2000, 4000)
+REFERENCIA_MAX = 1000  # la referencia en Python puro es O(M·N²) con bucles: solo hasta este tamaño
+
+
+def domina(a, b, exceso_a, exceso_b):
+    if exceso_a == 0.0 and exceso_b == 0.0:
+        return all(x <= y for x, y in zip(a, b)) and any(x < y for x, y in zip(a, b))
+    return exceso_a < exceso_b
+
+
+def ordenar_referencia(F, exceso):
+    """Ordenamiento rápido no dominado de Deb et al. (listas de dominados y contadores)."""
+    n = len(F)
+    filas = F.tolist()
+    excesos = exceso.tolist()
+    dominados = [[] for _ in range(n)]
+    contador = [0] * n
+    for i in range(n):
+        for j in range(i + 1, n):
+            if domina(filas[i], filas[j], excesos[i], excesos[j]):
+                dominados[i].append(j)
+                contador[j] += 1
+            elif domina(filas[j], filas[i], excesos[j], excesos[i]):
+                dominados[j].append(i)
+                contador[i] += 1
+    rango = [-1] * n
+    frente = [i for i in range(n) if contador[i] == 0]
+    r = 0
+    while frente:
+        siguiente = []
+        for i in frente:
+            rango[i] = r
+            for j in dominados[i]:
+                contador[j] -= 1
+                if contador[j] == 0:
+                    siguiente.append(j)
+        frente = siguiente
+        r += 1
+    return np.array(rango)
+
+
+def main():
+    areas, ganancias, stocks = vectores_catalogo(catalogo_sintetico(30))
+    # existencias recortadas para que haya individuos que caben y otros que no, como a mitad de corrida
+    stocks = np.minimum(stocks, 4)
+    rng = np.random.default_rng(1)
+    print(f"{'población':>10} {'frentes':>8} {'orden (s)':>10} {'crowding (s)':>13} {'referencia (s)':>15}")
+    for n in TAMANOS:
+        F, exceso = matriz_objetivos(crear_poblacion_aleatoria(n, stocks, rng), areas, ganancias,
+                                     ("ganancia", "area"))
+        t_orden, rango = cronometrar(ordenar_no_dominados, F, exceso, repeticiones=3)
+        t_crowding, _ = cronometrar(distancia_crowding, F, rango, repeticiones=3)
+        referencia = "-"
+        if n <= REFERENCIA_MAX:
+            t_ref, rango_ref = cronometrar(ordenar_referencia, F, exceso)
+            if not np.array_equal(rango, rango_ref):
+                raise AssertionError(f"rangos distintos para población {n}")
+            referencia = f"{t_ref:.3f}"
+        print(f"{n:>10} {rango.max() + 1:>8} {t_orden:>10.3f} {t_crowding:>13.4f} {referencia:>15}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# bench_reparacion.py
+# Generaciones hasta alcanzar el objetivo y tiempo total: penalización 1000×exceso (actual)
+# frente a reparación voraz, relleno y siembra por ganancia/área.
+#   python benchmarks/bench_reparacion.py
+from comun import catalogo_sintetico, cronometrar
+
+from backend import AREA_MAXIMA, crear_individuo_greedy, evaluar_individuo, ejecutar_algoritmo_genetico
+
+SEMILLAS = range(5)
+VARIANTES = [
+    ("penalización", {}),
+    ("reparación", {"reparacion": True}),
+    ("reparación+relleno", {"reparacion": True, "rellenar": True}),
+    ("rep+relleno+siembra", {"reparacion": True, "rellenar": True, "fraccion_greedy": 0.2}),
+]
+
+
+def generaciones_hasta(historial, objetivo):
+    for g, f in enumerate(historial, start=1):
+        if f >= objetivo:
+            return g
+    return None
+
+
+def main():
+    for n_art in (50, 200):
+        catalogo = catalogo_sintetico(n_art)
+        # objetivo: 98% de la solución voraz (referencia barata y factible)
+        referencia = evaluar_individuo(crear_individuo_greedy(catalogo), catalogo)
+        objetivo = 0.98 * referencia
+        print(f"\n{n_art} artículos, área máx. {AREA_MAXIMA} m², objetivo {objetivo:.0f}")
+        print(f"{'variante':>20} {'gen. al objetivo':>17} {'alcanzado':>10} {'mejor final':>12} {'tiempo (s)':>11}")
+        for nombre, extra in VARIANTES:
+            gens, finales, tiempos = [], [], []
+            for semilla in SEMILLAS:
+                params = dict({"catalogo": catalogo, "tam_poblacion": 80, "generaciones": 100,
+                               "semilla": semilla}, **extra)
+                t, res = cronometrar(ejecutar_algoritmo_genetico, params)
+                tiempos.append(t)
+                finales.append(max(res["historial"]))
+                g = generaciones_hasta(res["historial"], objetivo)
+                if g is not None:
+                    gens.append(g)
+            media_gen = f"{sum(gens) / len(gens):.1f}" if gens else "-"
+            print(f"{nombre:>20} {media_gen:>17} {len(gens):>6}/{len(SEMILLAS)} "
+                  f"{sum(finales) / len(finales):>12.0f} {sum(tiempos) / len(tiempos):>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# comprobar_reanudacion.py
+# Comprueba que prolongar una corrida desde su punto de control da el mismo resultado que
+# ejecutarla entera de una vez, en cada motor con puntos de control. En el modelo de islas el
+# punto de control cae a mitad de una época (25 generaciones con intervalo_migracion 7). Lo
+# mismo para el arranque en caliente de la caché de resultados: la corrida continuada y el
+# acierto que se obtiene después tienen que ser iguales a la corrida entera.
+#   python benchmarks/comprobar_reanudacion.py
+import os
+import sys
+import tempfile
+
+from comun import catalogo_sintetico
+
+from backend import ejecutar_algoritmo_genetico, reanudar_algoritmo_genetico
+
+SEMILLAS = (1, 2, 3)
+GEN_CORTA, GEN_LARGA = 25, 60
+CASOS = {
+    "listas": {"motor": "listas"},
+    "listas incremental": {"motor": "listas", "evaluacion_incremental": True},
+    "numpy": {"motor": "numpy"},
+    "islas": {"motor": "islas", "intervalo_migracion": 7, "trabajadores": 1},
+    "islas incremental": {"motor": "islas", "intervalo_migracion": 7, "trabajadores": 1,
+                          "evaluacion_incremental": True},
+    "islas pm adaptativa": {"motor": "islas", "intervalo_migracion": 7, "trabajadores": 2,
+                            "pm_adaptativa": True},
+}
+CLAVES = ("historial", "mejor_individuo", "mejor_ganancia", "motivo_parada", "generacion_final")
+
+
+def diferencias(a, b):
+    return [clave for clave in CLAVES if a.get(clave) != b.get(clave)]
+
+
+def main():
+    catalogo = catalogo_sintetico(200, 1)
+    fallos = 0
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "corrida.gapc")
+        for nombre, extra in CASOS.items():
+            for semilla in SEMILLAS:
+                params = dict(extra, catalogo=catalogo, semilla=semilla)
+                entera = ejecutar_algoritmo_genetico(dict(params, generaciones=GEN_LARGA))
+                ejecutar_algoritmo_genetico(dict(params, generaciones=GEN_CORTA, punto_control=ruta))
+                prolongada = reanudar_algoritmo_genetico(ruta, {"catalogo": catalogo, "generaciones": GEN_LARGA})
+
+                cache = dict(params, cache_resultados=os.path.join(directorio, f"cache-{semilla}"),
+                             arranque_en_caliente=True)
+                ejecutar_algoritmo_genetico(dict(cache, generaciones=GEN_CORTA))
+                continuada = ejecutar_algoritmo_genetico(dict(cache, generaciones=GEN_LARGA))
+                acierto = ejecutar_algoritmo_genetico(dict(cache, generaciones=GEN_LARGA))
+                if (continuada["cache_resultados"], acierto["cache_resultados"]) != ("continuacion", "acierto"):
+                    raise AssertionError(f"{nombre}: la caché no continuó la corrida guardada")
+
+                for como, resultado in (("reanudada", prolongada), ("en caliente", continuada),
+                                        ("de la caché", acierto)):
+                    distintas = diferencias(entera, resultado)
+                    fallos += bool(distintas)
+                    estado = f"distinta en {', '.join(distintas)}" if distintas else "igual"
+                    print(f"{nombre:<22} semilla {semilla} {como:<12}: {estado}", flush=True)
+    print("ok" if not fallos else f"{fallos} corridas distintas")
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+# comun.py
+# Utilidades compartidas por los scripts de benchmark (catálogos sintéticos y cronómetro)
+import os
+import random
+import sys
+import time
+
+# permitir "python benchmarks/xxx.py" desde la raíz del repo
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def catalogo_sintetico(n_articulos, semilla=0):
+    """Catálogo aleatorio con dimensiones y ganancias del orden del catálogo por defecto."""
+    rnd = random.Random(semilla)
+    catalogo = []
+    for i in range(n_articulos):
+        ancho = round(rnd.uniform(0.15, 0.9), 2)
+        largo = round(rnd.uniform(0.15, 0.8), 2)
+        catalogo.append({
+            "id": i + 1,
+            "nombre": f"SKU {i + 1}",
+            "ancho": ancho,
+            "largo": largo,
+            "ganancia": round(ancho * largo * rnd.uniform(100, 400)),
+            "stock": rnd.randint(1, 20),
+        })
+    return catalogo
+
+
+def cronometrar(fn, *args, repeticiones=1):
+    """Devuelve (mejor tiempo en segundos, resultado de la última llamada)."""
+    mejor = float("inf")
+    res = None
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        res = fn(*args)
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor, res
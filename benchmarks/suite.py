@@ -0,0 +1,131 @@
+# suite.py
+# Suite de rendimiento reproducible: catálogos sintéticos de varios tamaños × tamaños de población
+# × motores, con semillas fijas y perfilado por fase. Escribe un JSON con los metadatos del entorno
+# y, para cada caso, tiempo mínimo y mediano, mejor fitness y tiempos por fase; con --comparar
+# imprime la razón frente a una corrida anterior para detectar regresiones.
+#   python benchmarks/suite.py --salida base.json
+#   python benchmarks/suite.py --salida nuevo.json --comparar base.json
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from comun import catalogo_sintetico
+
+import numpy as np
+
+from backend import ejecutar_algoritmo_genetico
+
+TAMANOS = {
+    # nombre: (artículos, poblaciones, generaciones)
+    "chico": (50, (60, 200), 40),
+    "mediano": (500, (200, 1000), 30),
+    "enorme": (5000, (200, 1000), 15),
+}
+MOTORES = {
+    "listas": {"motor": "listas"},
+    "incremental": {"motor": "listas", "evaluacion_incremental": True},
+    "numpy": {"motor": "numpy"},
+}
+SEMILLA = 1
+
+
+def metadatos():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "procesador": platform.processor() or platform.machine(),
+        "commit": commit,
+    }
+
+
+def medir(params, repeticiones):
+    """Tiempos de `repeticiones` corridas y resultado (con perfil) de la última."""
+    tiempos = []
+    resultado = None
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        resultado = ejecutar_algoritmo_genetico(dict(params))
+        tiempos.append(time.perf_counter() - t0)
+    return tiempos, resultado
+
+
+def ejecutar_suite(tamanos, motores, repeticiones):
+    casos = {}
+    for nombre_tam in tamanos:
+        n_art, poblaciones, n_gen = TAMANOS[nombre_tam]
+        catalogo = catalogo_sintetico(n_art, SEMILLA)
+        for n_pob in poblaciones:
+            for nombre_motor in motores:
+                clave = f"{nombre_tam}/{n_pob}/{nombre_motor}"
+                params = dict(MOTORES[nombre_motor], catalogo=catalogo, tam_poblacion=n_pob,
+                              generaciones=n_gen, semilla=SEMILLA, perfilado=True)
+                tiempos, resultado = medir(params, repeticiones)
+                casos[clave] = {
+                    "articulos": n_art,
+                    "poblacion": n_pob,
+                    "generaciones": n_gen,
+                    "tiempo_min": min(tiempos),
+                    "tiempo_mediana": statistics.median(tiempos),
+                    "mejor_fitness": max(resultado["historial"]),
+                    "fases": resultado["perfil"]["tiempos"],
+                }
+                print(f"{clave:<28} {min(tiempos):>9.3f} s  {statistics.median(tiempos):>9.3f} s  "
+                      f"fitness {max(resultado['historial']):.2f}", flush=True)
+    return casos
+
+
+def comparar(casos, previo):
+    """Razón tiempo_mediana actual / previo por caso (>1 = más lento) y cambios de fitness."""
+    print(f"\n{'caso':<28} {'previo (s)':>10} {'actual (s)':>10} {'razón':>7}")
+    for clave, caso in casos.items():
+        anterior = previo["casos"].get(clave)
+        if anterior is None:
+            continue
+        razon = caso["tiempo_mediana"] / anterior["tiempo_mediana"] if anterior["tiempo_mediana"] else float("inf")
+        aviso = "" if caso["mejor_fitness"] == anterior["mejor_fitness"] else "  (fitness distinto)"
+        print(f"{clave:<28} {anterior['tiempo_mediana']:>10.3f} {caso['tiempo_mediana']:>10.3f} "
+              f"{razon:>6.2f}x{aviso}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Suite de rendimiento del GA")
+    parser.add_argument("--salida", default="suite.json", help="JSON de resultados (por defecto suite.json)")
+    parser.add_argument("--tamanos", default=",".join(TAMANOS),
+                        help=f"tamaños de catálogo separados por comas ({', '.join(TAMANOS)})")
+    parser.add_argument("--motores", default=",".join(MOTORES),
+                        help=f"motores separados por comas ({', '.join(MOTORES)})")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--comparar", metavar="PREVIO", help="JSON de una corrida anterior de la suite")
+    args = parser.parse_args(argv)
+
+    tamanos = [t for t in args.tamanos.split(",") if t]
+    motores = [m for m in args.motores.split(",") if m]
+    for nombres, validos in ((tamanos, TAMANOS), (motores, MOTORES)):
+        desconocidos = [n for n in nombres if n not in validos]
+        if desconocidos:
+            parser.error(f"desconocido: {', '.join(desconocidos)}")
+
+    informe = {"metadatos": metadatos(), "repeticiones": args.repeticiones,
+               "casos": ejecutar_suite(tamanos, motores, max(1, args.repeticiones))}
+    with open(args.salida, "w", encoding="utf-8") as f:
+        json.dump(informe, f, indent=2)
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            comparar(informe["casos"], json.load(f))
+
+
+if __name__ == "__main__":
+    main()
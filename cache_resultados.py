@@ -0,0 +1,133 @@
+# cache_resultados.py
+# Caché persistente de resultados del GA entre sesiones. Cada corrida reproducible (mismo
+# catálogo, params y semilla) se guarda como un archivo JSON con su dict de resultado y, si el
+# motor admite puntos de control, el punto de control de su estado final: con él, una corrida
+# que solo pide más generaciones continúa la guardada en lugar de empezar de cero (ver
+# backend.iterar_algoritmo_genetico). El tamaño en disco se acota desalojando las entradas
+# usadas hace más tiempo.
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+
+DIR_CACHE = '.cache_resultados'
+TAM_MAX_MB = 256
+# forma parte de la clave: al cambiar cómo se calcula o continúa una corrida se sube, y las
+# entradas guardadas con la versión anterior dejan de encontrarse (y se desalojan con el tiempo)
+VERSION = 2
+# <clave>-<generaciones>.json / .gapc; los temporales de corridas en curso empiezan por '.'
+_ENTRADA = re.compile(r'^([0-9a-f]{40})-(\d+)\.(json|gapc)$')
+
+
+def clave_corrida(huella, params):
+    """Hash de la versión, la huella del catálogo y los params canónicos (sin 'generaciones')."""
+    texto = json.dumps({'version': VERSION, 'catalogo': huella, 'params': params}, sort_keys=True)
+    return hashlib.sha1(texto.encode('utf-8')).hexdigest()
+
+
+class CacheResultados:
+    """
+    Resultados guardados en `directorio` (por defecto .cache_resultados en el directorio actual).
+    La antigüedad de una entrada es la fecha de modificación de sus archivos, que se renueva en
+    cada acierto; al guardar, si el total supera `tam_max_mb` se borran las más antiguas.
+    """
+    def __init__(self, directorio=None, tam_max_mb=TAM_MAX_MB):
+        self.directorio = directorio or DIR_CACHE
+        self.tam_max = int(float(tam_max_mb) * 1024 * 1024)
+
+    def _ruta(self, clave, generaciones, extension):
+        return os.path.join(self.directorio, f"{clave}-{int(generaciones)}.{extension}")
+
+    def obtener(self, clave, generaciones):
+        """Dict de resultado guardado, o None."""
+        ruta = self._ruta(clave, generaciones, 'json')
+        try:
+            with open(ruta, encoding='utf-8') as f:
+                resultado = json.load(f)
+        except (OSError, ValueError):
+            return None
+        for extension in ('json', 'gapc'):
+            try:
+                os.utime(self._ruta(clave, generaciones, extension))
+            except OSError:
+                pass
+        return resultado
+
+    def continuacion(self, clave, generaciones):
+        """Punto de control de la corrida guardada más larga con menos de `generaciones`, o None."""
+        mejor = None
+        try:
+            nombres = os.listdir(self.directorio)
+        except OSError:
+            return None
+        for nombre in nombres:
+            m = _ENTRADA.match(nombre)
+            if m and m.group(1) == clave and m.group(3) == 'gapc':
+                g = int(m.group(2))
+                if g < generaciones and (mejor is None or g > mejor):
+                    mejor = g
+        return None if mejor is None else self._ruta(clave, mejor, 'gapc')
+
+    def ruta_temporal(self):
+        """Archivo para el punto de control de una corrida en curso (no cuenta como entrada)."""
+        os.makedirs(self.directorio, exist_ok=True)
+        fd, ruta = tempfile.mkstemp(prefix='.corrida-', suffix='.gapc', dir=self.directorio)
+        os.close(fd)
+        return ruta
+
+    def guardar(self, clave, generaciones, resultado, punto_control=None, mover=False):
+        """
+        Guarda `resultado` y, si se indica, el punto de control de la corrida (movido si `mover`,
+        copiado si no). Devuelve False si el resultado no es serializable o no se pudo escribir.
+        """
+        try:
+            texto = json.dumps(resultado)
+        except (TypeError, ValueError):
+            return False
+        ruta = self._ruta(clave, generaciones, 'json')
+        try:
+            os.makedirs(self.directorio, exist_ok=True)
+            if punto_control is not None:
+                destino = self._ruta(clave, generaciones, 'gapc')
+                if mover:
+                    os.replace(punto_control, destino)
+                else:
+                    shutil.copyfile(punto_control, destino)
+            temporal = f"{ruta}.{os.getpid()}.tmp"
+            with open(temporal, 'w', encoding='utf-8') as f:
+                f.write(texto)
+            os.replace(temporal, ruta)
+        except OSError:
+            return False
+        self.desalojar()
+        return True
+
+    def desalojar(self):
+        """Borra las entradas menos usadas hasta quedar por debajo del tamaño máximo (deja la última)."""
+        entradas = {}
+        try:
+            with os.scandir(self.directorio) as it:
+                for archivo in it:
+                    m = _ENTRADA.match(archivo.name)
+                    if not m:
+                        continue
+                    try:
+                        info = archivo.stat()
+                    except OSError:
+                        continue
+                    tam, fecha, rutas = entradas.get(m.group(1, 2), (0, 0.0, []))
+                    entradas[m.group(1, 2)] = (tam + info.st_size, max(fecha, info.st_mtime), rutas + [archivo.path])
+        except OSError:
+            return
+        total = sum(tam for tam, _, _ in entradas.values())
+        for tam, _, rutas in sorted(entradas.values(), key=lambda e: e[1])[:-1]:
+            if total <= self.tam_max:
+                break
+            for ruta in rutas:
+                try:
+                    os.remove(ruta)
+                except OSError:
+                    pass
+            total -= tam
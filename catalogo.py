@@ -0,0 +1,281 @@
+# catalogo.py
+# Lectura de catálogos desde archivo (.csv, .json o .jsonl) a un catálogo columnar: arrays
+# tipados por campo y una tabla de nombres, en vez de un dict por artículo. El resultado se
+# guarda en una caché binaria (indexada por el hash del archivo) que las cargas siguientes
+# mapean en memoria sin volver a leer ni validar el archivo original.
+import csv
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+# la versión y el orden de bytes forman parte de la firma: una caché de otra versión o de
+# otra arquitectura se ignora y se regenera
+MAGIA = b'CATCOL2' + (b'L' if sys.byteorder == 'little' else b'B')
+CABECERA = struct.Struct('=8sqq')  # firma, artículos, bytes de nombres
+BLOQUE_LECTURA = 1 << 16
+DIR_CACHE = '.cache_catalogos'
+
+
+class TablaNombres:
+    """Nombres guardados en un único bloque UTF-8 con desplazamientos; se decodifican al pedirlos."""
+
+    def __init__(self, datos, desplazamientos):
+        self.datos = datos
+        self.desplazamientos = desplazamientos
+
+    def __len__(self):
+        return len(self.desplazamientos) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        return str(self.datos[self.desplazamientos[i]:self.desplazamientos[i + 1]], 'utf-8')
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class CatalogoColumnar:
+    """
+    Catálogo por columnas: anchos, largos, areas, ganancias (float), stocks e ids (enteros) y
+    `nombres`. Las columnas son array.array o vistas sobre el archivo de caché mapeado en memoria;
+    en ambos casos al indexarlas se obtienen float/int de Python.
+
+    Se comporta como la lista de dicts habitual (len, catalogo[i], iteración), así que cualquier
+    función del GA o del empaquetado lo acepta; las partes calientes leen las columnas directamente
+    (ver backend.columnas_catalogo).
+    """
+    COLUMNAS = (('anchos', 'd'), ('largos', 'd'), ('areas', 'd'), ('ganancias', 'd'),
+                ('stocks', 'q'), ('ids', 'q'))
+
+    def __init__(self, columnas, nombres):
+        for nombre, _ in self.COLUMNAS:
+            setattr(self, nombre, columnas[nombre])
+        self.nombres = nombres
+
+    # --- interfaz de lista de dicts ---
+    def __len__(self):
+        return len(self.ganancias)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        return {'id': self.ids[i], 'nombre': self.nombres[i], 'ancho': self.anchos[i], 'largo': self.largos[i],
+                'ganancia': self.ganancias[i], 'stock': self.stocks[i]}
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    # --- construcción ---
+    @classmethod
+    def desde_filas(cls, filas):
+        """Construye el catálogo consumiendo `filas` (dicts de artículo) de una en una."""
+        columnas = {nombre: array(codigo) for nombre, codigo in cls.COLUMNAS}
+        datos_nombres = bytearray()
+        desplazamientos = array('q', [0])
+        # los ids identifican al artículo en la interfaz y en los resultados: no pueden repetirse
+        ids = set()
+        for n, fila in enumerate(filas, 1):
+            id_, nombre, ancho, largo, ganancia, stock = validar_fila(fila, n)
+            if id_ in ids:
+                raise ValueError(f"fila {n}: id {id_} repetido")
+            ids.add(id_)
+            columnas['ids'].append(id_)
+            columnas['anchos'].append(ancho)
+            columnas['largos'].append(largo)
+            columnas['areas'].append(ancho * largo)
+            columnas['ganancias'].append(ganancia)
+            columnas['stocks'].append(stock)
+            datos_nombres += nombre.encode('utf-8')
+            desplazamientos.append(len(datos_nombres))
+        return cls(columnas, TablaNombres(bytes(datos_nombres), desplazamientos))
+
+    # --- caché binaria ---
+    def guardar(self, ruta):
+        """Escribe el formato binario de la caché (reemplazo atómico del archivo)."""
+        nombres = bytes(self.nombres.datos)
+        temporal = ruta + '.tmp'
+        with open(temporal, 'wb') as f:
+            f.write(CABECERA.pack(MAGIA, len(self), len(nombres)))
+            for nombre, _ in self.COLUMNAS:
+                f.write(getattr(self, nombre))
+            f.write(self.nombres.desplazamientos)
+            f.write(nombres)
+        os.replace(temporal, ruta)
+
+    @classmethod
+    def abrir(cls, ruta):
+        """Catálogo sobre el archivo de caché mapeado en memoria (solo lectura, sin copiar)."""
+        with open(ruta, 'rb') as f:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        vista = memoryview(mapa)
+        if len(vista) < CABECERA.size:
+            raise ValueError(f"caché de catálogo truncada: {ruta}")
+        magia, n, bytes_nombres = CABECERA.unpack_from(vista)
+        if magia != MAGIA or len(vista) != CABECERA.size + 8 * (len(cls.COLUMNAS) * n + n + 1) + bytes_nombres:
+            raise ValueError(f"caché de catálogo inválida: {ruta}")
+        pos = CABECERA.size
+        columnas = {}
+        for nombre, codigo in cls.COLUMNAS:
+            columnas[nombre] = vista[pos:pos + 8 * n].cast(codigo)
+            pos += 8 * n
+        desplazamientos = vista[pos:pos + 8 * (n + 1)].cast('q')
+        pos += 8 * (n + 1)
+        return cls(columnas, TablaNombres(vista[pos:], desplazamientos))
+
+    def __getstate__(self):
+        # las vistas sobre mmap no se pueden serializar (pools de procesos): se copian a bytes
+        estado = {nombre: bytes(getattr(self, nombre)) for nombre, _ in self.COLUMNAS}
+        estado['nombres'] = bytes(self.nombres.datos)
+        estado['desplazamientos'] = bytes(self.nombres.desplazamientos)
+        return estado
+
+    def __setstate__(self, estado):
+        for nombre, codigo in self.COLUMNAS:
+            columna = array(codigo)
+            columna.frombytes(estado[nombre])
+            setattr(self, nombre, columna)
+        desplazamientos = array('q')
+        desplazamientos.frombytes(estado['desplazamientos'])
+        self.nombres = TablaNombres(estado['nombres'], desplazamientos)
+
+    def huella(self):
+        """Hash del contenido (columnas y nombres)."""
+        h = hashlib.sha1()
+        for nombre, _ in self.COLUMNAS:
+            h.update(getattr(self, nombre))
+        h.update(self.nombres.desplazamientos)
+        h.update(self.nombres.datos)
+        return h.hexdigest()
+
+
+# ----------------------------
+# lectura y validación
+# ----------------------------
+def _numero(fila, campo, n, tipo=float, defecto=None):
+    valor = fila.get(campo, defecto)
+    if valor is None or valor == '':
+        if defecto is None:
+            raise ValueError(f"fila {n}: falta '{campo}'")
+        valor = defecto
+    try:
+        numero = float(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"fila {n}: '{campo}' no es un número ({valor!r})") from None
+    if not math.isfinite(numero):
+        raise ValueError(f"fila {n}: '{campo}' no es finito ({valor!r})")
+    if tipo is int:
+        if numero != int(numero):
+            raise ValueError(f"fila {n}: '{campo}' debe ser entero ({valor!r})")
+        return int(numero)
+    return numero
+
+
+def validar_fila(fila, n):
+    """(id, nombre, ancho, largo, ganancia, stock) de la fila `n`, o ValueError si no es válida."""
+    if not isinstance(fila, dict):
+        raise ValueError(f"fila {n}: se esperaba un objeto con los campos del artículo")
+    nombre = fila.get('nombre')
+    if not nombre:
+        raise ValueError(f"fila {n}: falta 'nombre'")
+    ancho = _numero(fila, 'ancho', n)
+    largo = _numero(fila, 'largo', n)
+    if ancho < 0 or largo < 0:
+        raise ValueError(f"fila {n}: dimensiones negativas")
+    stock = _numero(fila, 'stock', n, int, defecto=1)
+    if stock < 0:
+        raise ValueError(f"fila {n}: stock negativo")
+    id_ = _numero(fila, 'id', n, int, defecto=n)
+    return id_, str(nombre), ancho, largo, _numero(fila, 'ganancia', n), stock
+
+
+def _objetos_json(f):
+    """Elementos de una lista JSON de nivel superior, decodificados uno a uno por bloques."""
+    decodificador = json.JSONDecoder()
+    buffer = f.read(BLOQUE_LECTURA).lstrip()
+    if not buffer.startswith('['):
+        raise ValueError("se esperaba una lista JSON de artículos")
+    pos = 1
+    while True:
+        while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+            pos += 1
+        if pos < len(buffer) and buffer[pos] == ']':
+            return
+        try:
+            if pos == len(buffer):
+                raise json.JSONDecodeError("fin del bloque", buffer, pos)
+            objeto, pos = decodificador.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # objeto partido entre dos bloques: se lee el siguiente y se reintenta
+            bloque = f.read(BLOQUE_LECTURA)
+            if not bloque:
+                raise ValueError("lista JSON incompleta o mal formada") from None
+            buffer = buffer[pos:] + bloque
+            pos = 0
+            continue
+        yield objeto
+
+
+def leer_filas(ruta):
+    """Filas del archivo (dicts) sin cargarlo entero: .csv con cabecera, .json (lista) o .jsonl."""
+    extension = os.path.splitext(ruta)[1].lower()
+    # utf-8-sig: los CSV exportados desde Excel empiezan con BOM, que si no quedaría en la cabecera
+    with open(ruta, newline='', encoding='utf-8-sig') as f:
+        if extension == '.csv':
+            yield from csv.DictReader(f)
+        elif extension == '.json':
+            yield from _objetos_json(f)
+        elif extension == '.jsonl':
+            for linea in f:
+                if linea.strip():
+                    yield json.loads(linea)
+        else:
+            raise ValueError(f"formato de catálogo no soportado: {ruta} (use .csv, .json o .jsonl)")
+
+
+def huella_catalogo(catalogo):
+    """Hash del contenido de un catálogo (columnar o lista de dicts), para reconocerlo entre corridas."""
+    if hasattr(catalogo, 'huella'):
+        return catalogo.huella()
+    return hashlib.sha1(json.dumps(catalogo, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def hash_archivo(ruta):
+    h = hashlib.sha1()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b''):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def cargar_catalogo(ruta, cache=True, dir_cache=None):
+    """
+    CatalogoColumnar desde archivo. Con `cache`, el resultado se guarda en `dir_cache` (por defecto
+    .cache_catalogos junto al archivo) con el hash del contenido en el nombre, y si ya existe se abre
+    mapeado en memoria. Los errores de validación se informan como ValueError con la fila.
+    """
+    ruta_cache = None
+    if cache:
+        dir_cache = dir_cache or os.path.join(os.path.dirname(os.path.abspath(ruta)), DIR_CACHE)
+        ruta_cache = os.path.join(dir_cache, f"{os.path.basename(ruta)}.{hash_archivo(ruta)[:16]}.cat")
+        if os.path.exists(ruta_cache):
+            try:
+                return CatalogoColumnar.abrir(ruta_cache)
+            except (OSError, ValueError):
+                pass  # caché dañada: se regenera
+    try:
+        catalogo = CatalogoColumnar.desde_filas(leer_filas(ruta))
+    except ValueError as e:
+        raise ValueError(f"{ruta}: {e}") from None
+    if ruta_cache is not None:
+        try:
+            os.makedirs(dir_cache, exist_ok=True)
+            catalogo.guardar(ruta_cache)
+        except OSError:
+            pass  # la caché es opcional (p. ej. directorio de solo lectura)
+    return catalogo
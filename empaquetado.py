@@ -0,0 +1,126 @@
+# empaquetado.py
+# Empaquetado 2D tipo skyline (bottom-left) con rotación opcional de 90°.
+# El "horizonte" es la lista de segmentos [x, y, ancho] que forman el perfil superior de lo
+# ya colocado; solo hace falta probar el inicio de cada segmento, así que cada colocación
+# cuesta O(segmentos) y el número de segmentos se mantiene bajo porque los tramos contiguos
+# de igual altura se fusionan.
+from backend import LADO_PLANO
+
+EPS = 1e-9
+MARGEN = 0.02  # mismo espacio entre artículos que el empaquetado por estanterías
+
+
+def _mejor_posicion(horizonte, w, h, ancho_plano, alto_plano, mejor=None):
+    """
+    Posición bottom-left para un rectángulo w x h: (tope, x, indice_segmento, y), o `mejor`
+    si ninguna lo mejora (None si no cabe). Un segmento cuya propia altura ya no mejora el
+    tope actual se descarta sin recorrer los segmentos que cubriría.
+    """
+    n = len(horizonte)
+    for i in range(n):
+        x, y, _ = horizonte[i]
+        if x + w > ancho_plano + EPS:
+            # los segmentos están ordenados por x: los siguientes tampoco caben
+            break
+        if mejor is not None and y + h >= mejor[0] - EPS:
+            continue
+        # altura máxima del horizonte bajo [x, x + w]
+        restante = w - horizonte[i][2]
+        j = i + 1
+        while restante > EPS and j < n:
+            if horizonte[j][1] > y:
+                y = horizonte[j][1]
+            restante -= horizonte[j][2]
+            j += 1
+        tope = y + h
+        if tope > alto_plano + EPS:
+            continue
+        if mejor is None or tope < mejor[0] - EPS:
+            mejor = (tope, x, i, y)
+    return mejor
+
+
+def _colocar(horizonte, i, x, tope, w):
+    """Actualiza el horizonte tras colocar un rectángulo de ancho w con borde superior en `tope`."""
+    horizonte.insert(i, [x, tope, w])
+    fin = x + w
+    j = i + 1
+    # recortar o eliminar los segmentos que quedan debajo del rectángulo nuevo
+    while j < len(horizonte):
+        sx, sy, sw = horizonte[j]
+        if sx >= fin - EPS:
+            break
+        if sx + sw <= fin + EPS:
+            del horizonte[j]
+            continue
+        horizonte[j] = [fin, sy, sx + sw - fin]
+        break
+    # fusionar con los vecinos de igual altura
+    if i + 1 < len(horizonte) and abs(horizonte[i + 1][1] - tope) <= EPS:
+        horizonte[i][2] += horizonte[i + 1][2]
+        del horizonte[i + 1]
+    if i > 0 and abs(horizonte[i - 1][1] - tope) <= EPS:
+        horizonte[i - 1][2] += horizonte[i][2]
+        del horizonte[i]
+
+
+def _clave_orden(orden):
+    if orden == 'area':
+        return lambda u: -(u[1] * u[2])
+    if orden == 'alto':
+        return lambda u: (-max(u[1], u[2]), -min(u[1], u[2]))
+    return None
+
+
+def empaquetar_skyline(ind, catalogo, rotacion=True, orden='alto', lado_plano=LADO_PLANO, margen=MARGEN):
+    """
+    Igual formato de placements que backend.empaquetar_con_individuo (más la clave 'rotado').
+    orden: 'alto' (lado mayor descendente, por defecto), 'area' (descendente) o 'catalogo'.
+    """
+    # cada unidad es (indice, ancho, largo); el margen se suma a cada lado del artículo y al plano
+    unidades = []
+    nombres = {}
+    for i, cantidad in enumerate(ind):
+        cantidad = int(cantidad)
+        if cantidad <= 0:
+            continue
+        art = catalogo[i]
+        nombres[i] = art['nombre']
+        unidades.extend([(i, art.get('ancho', 0.0), art.get('largo', 0.0))] * cantidad)
+    clave = _clave_orden(orden)
+    if clave is not None:
+        unidades.sort(key=clave)
+
+    lado = lado_plano + margen
+    horizonte = [[0.0, 0.0, lado]]
+    # tamaños que ya no cupieron: el horizonte solo sube, así que lo que no cabe
+    # tampoco cabrá después y se descarta sin recorrer el horizonte
+    fallidos = []
+    placements = []
+    for i, w, h in unidades:
+        nombre = nombres[i]
+        wm, hm = w + margen, h + margen
+        descartado = any((wm >= fw - EPS and hm >= fh - EPS) or
+                         (rotacion and hm >= fw - EPS and wm >= fh - EPS) for fw, fh in fallidos)
+        pos = None
+        rotado = False
+        if not descartado:
+            pos = _mejor_posicion(horizonte, wm, hm, lado, lado)
+            if rotacion and abs(wm - hm) > EPS:
+                pos_rot = _mejor_posicion(horizonte, hm, wm, lado, lado, pos)
+                if pos_rot is not pos:
+                    pos = pos_rot
+                    rotado = True
+        if pos is None:
+            if not descartado:
+                fallidos.append((wm, hm))
+            placements.append({'nombre': nombre, 'ancho': w, 'largo': h, 'x': 0.0, 'y': 0.0, 'incluido': False,
+                               'articulo': i})
+            continue
+        tope, x, seg, y = pos
+        if rotado:
+            w, h, wm = h, w, hm
+        _colocar(horizonte, seg, x, tope, wm)
+        placements.append({'nombre': nombre, 'ancho': w, 'largo': h, 'x': x, 'y': y,
+                           'incluido': True, 'rotado': rotado, 'articulo': i})
+    return placements
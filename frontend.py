@@ -1,27 +1,20 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+import hashlib
 import math
-from backend import ejecutar_algoritmo_genetico, AREA_MAXIMA
+import queue
+import threading
+from functools import lru_cache, partial
+from backend import iterar_algoritmo_genetico, empaquetar, construir_resultado, AREA_MAXIMA, CATALOGO_POR_DEFECTO
+from catalogo import cargar_catalogo
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-
-
-# Catálogo inicial
-CATALOGO_INICIAL = [
-    {"id": 1, "nombre": "Mini nevera", "ancho": 0.5, "largo": 0.5, "ganancia": 40, "stock": 20},
-    {"id": 2, "nombre": 'Televisor 32"', "ancho": 0.35, "largo": 0.32, "ganancia": 60, "stock": 6},
-    {"id": 3, "nombre": "Lavadora", "ancho": 0.6, "largo": 0.6, "ganancia": 90, "stock": 3},
-    {"id": 4, "nombre": "Microondas", "ancho": 0.45, "largo": 0.35, "ganancia": 25, "stock": 8},
-    {"id": 5, "nombre": "Aire acondicionado", "ancho": 0.6, "largo": 0.45, "ganancia": 110, "stock": 2},
-    {"id": 6, "nombre": "Licuadora", "ancho": 0.2, "largo": 0.2, "ganancia": 8, "stock": 10},
-    {"id": 7, "nombre": "Nevera grande", "ancho": 0.8, "largo": 0.75, "ganancia": 220, "stock": 2},
-    {"id": 8, "nombre": "Horno eléctrico", "ancho": 0.6, "largo": 0.6, "ganancia": 65, "stock": 3},
-    {"id": 9, "nombre": "Aspiradora", "ancho": 0.35, "largo": 0.25, "ganancia": 28, "stock": 6},
-    {"id": 10, "nombre": "Plancha", "ancho": 0.25, "largo": 0.15, "ganancia": 10, "stock": 12},
-    {"id": 11, "nombre": "Cocina a gas", "ancho": 0.9, "largo": 0.55, "ganancia": 130, "stock": 2},
-    {"id": 12, "nombre": "Extractor cocina", "ancho": 0.5, "largo": 0.35, "ganancia": 45, "stock": 4},
-]
+
+
+# Catálogo inicial: el mismo que usa el backend por defecto
+CATALOGO_INICIAL = CATALOGO_POR_DEFECTO
+FILAS_POR_PAGINA = 200
+MARCA = "✔️"
 
 
 class App:
@@ -30,7 +23,21 @@ class App:
         self.root.title("Optimización GA - Área 50 m²")
         self.root.geometry("1400x760")
 
-        self.catalogo = [dict(x) for x in CATALOGO_INICIAL]
+        # índice id -> artículo: es la fuente de verdad; el Treeview solo muestra una página
+        # de `self.visibles` (ids que pasan el filtro por nombre)
+        self.articulos = {}
+        self.marcados = set()
+        self.visibles = []
+        self.pagina = 0
+        self._filtro_pendiente = None
+        self.cargar_articulos(CATALOGO_INICIAL)
+        # estado de la corrida en curso: el hilo trabajador deja instantáneas en la cola
+        # y el hilo de Tk las recoge cada `refresco` ms
+        self.cola = None
+        self.cancelar = None
+        self.hilo = None
+        # ventana del frente de Pareto de la última corrida multiobjetivo
+        self.ventana_pareto = None
         self._crear_ui()
 
     # -------------------------------------------------------------------------
@@ -40,20 +47,32 @@ class App:
 
         tk.Label(left, text="Catálogo (seleccione y edite):", font=("Arial", 12, "bold")).pack(anchor="w")
 
+        buscar = tk.Frame(left)
+        buscar.pack(fill="x")
+        tk.Label(buscar, text="Buscar:").pack(side="left")
+        self.v_buscar = tk.StringVar()
+        tk.Entry(buscar, textvariable=self.v_buscar, width=24).pack(side="left", padx=4)
+        self.v_buscar.trace_add("write", lambda *_: self._programar_filtro())
+        tk.Button(buscar, text="Cargar catálogo...", command=self.abrir_catalogo).pack(side="right")
+
         cols = ("Sel", "ID", "Nombre", "Área (m²)", "Ganancia", "Stock")
         self.tree = ttk.Treeview(left, columns=cols, show="headings", height=18)
         for c, w in zip(cols, [40, 40, 180, 80, 80, 60]):
             self.tree.heading(c, text=c)
             self.tree.column(c, width=w, anchor="center" if c != "Nombre" else "w")
-        self.tree.pack(side="left", padx=4, pady=4, fill="y")
-
-        for art in self.catalogo:
-            area = art["ancho"] * art["largo"]
-            self.tree.insert("", "end", iid=str(art["id"]),
-                             values=("✔️", art["id"], art["nombre"], f"{area:.3f}", art["ganancia"], art["stock"]))
-
+        self.tree.pack(padx=4, pady=4, fill="y")
         self.tree.bind("<<TreeviewSelect>>", self.cargar_datos_edicion)
 
+        paginas = tk.Frame(left)
+        paginas.pack(fill="x")
+        tk.Button(paginas, text="◀", command=lambda: self.ir_a_pagina(self.pagina - 1)).pack(side="left")
+        self.lbl_pagina = tk.Label(paginas, text="")
+        self.lbl_pagina.pack(side="left", padx=6)
+        tk.Button(paginas, text="▶", command=lambda: self.ir_a_pagina(self.pagina + 1)).pack(side="left")
+        tk.Button(paginas, text="Marcar visibles", command=lambda: self.marcar_visibles(True)).pack(side="right")
+        tk.Button(paginas, text="Desmarcar visibles", command=lambda: self.marcar_visibles(False)).pack(side="right")
+        self.aplicar_filtro()
+
         edit = tk.Frame(left)
         edit.pack(fill="x", pady=8)
         tk.Label(edit, text="Editar artículo seleccionado:").grid(row=0, column=0, columnspan=4, sticky="w")
@@ -97,13 +116,38 @@ class App:
 
         tk.Label(params, text="Selección:").grid(row=2, column=0, sticky="e")
         self.sel_var = tk.StringVar(value="torneo")
-        ttk.Combobox(params, textvariable=self.sel_var, values=["torneo", "ruleta"], width=10).grid(row=2, column=1, padx=6)
+        ttk.Combobox(params, textvariable=self.sel_var, values=["torneo", "ruleta", "sus"], width=10).grid(row=2, column=1, padx=6)
         self.var_elit = tk.BooleanVar(value=True)
-        tk.Checkbutton(params, text="Elitismo", variable=self.var_elit).grid(row=2, column=2, columnspan=2)
-
-        tk.Button(params, text="Ejecutar GA", bg="#4CAF50", fg="white", command=self.ejecutar_ga).grid(
-            row=3, column=0, columnspan=4, pady=8
-        )
+        tk.Checkbutton(params, text="Elitismo", variable=self.var_elit).grid(row=2, column=2)
+        self.var_rep = tk.BooleanVar(value=False)
+        tk.Checkbutton(params, text="Reparar y sembrar", variable=self.var_rep).grid(row=2, column=3)
+
+        tk.Label(params, text="Empaquetado:").grid(row=3, column=0, sticky="e")
+        self.emp_var = tk.StringVar(value="estanteria")
+        ttk.Combobox(params, textvariable=self.emp_var, values=["estanteria", "skyline"], width=10).grid(row=3, column=1, padx=6)
+        self.var_rot = tk.BooleanVar(value=True)
+        tk.Checkbutton(params, text="Rotar 90°", variable=self.var_rot).grid(row=3, column=2)
+        self.var_geo = tk.BooleanVar(value=False)
+        tk.Checkbutton(params, text="Fitness geométrico", variable=self.var_geo).grid(row=3, column=3)
+
+        tk.Label(params, text="Refresco (ms):").grid(row=4, column=0, sticky="e")
+        self.v_refresco = tk.Entry(params, width=8)
+        self.v_refresco.insert(0, "200")
+        self.v_refresco.grid(row=4, column=1, padx=6)
+        # con semilla, repetir una corrida devuelve el resultado guardado (vacía = aleatoria, sin caché)
+        tk.Label(params, text="Semilla:").grid(row=4, column=2, sticky="e")
+        self.v_semilla = tk.Entry(params, width=8)
+        self.v_semilla.insert(0, "1")
+        self.v_semilla.grid(row=4, column=3, padx=6)
+        # NSGA-II: además del mejor resultado muestra el frente ganancia/área para elegir otro punto
+        self.var_pareto = tk.BooleanVar(value=False)
+        tk.Checkbutton(params, text="Multiobjetivo (Pareto)", variable=self.var_pareto).grid(row=5, column=0, columnspan=2, sticky="w")
+        self.btn_ejecutar = tk.Button(params, text="Ejecutar GA", bg="#4CAF50", fg="white", command=self.ejecutar_ga)
+        self.btn_ejecutar.grid(row=5, column=2, pady=8, sticky="ew")
+        self.btn_cancelar = tk.Button(params, text="Cancelar", state="disabled", command=self.cancelar_ga)
+        self.btn_cancelar.grid(row=5, column=3, pady=8, sticky="ew")
+        self.lbl_progreso = tk.Label(params, text="", anchor="w")
+        self.lbl_progreso.grid(row=6, column=0, columnspan=4, sticky="w")
 
         vis_frame = tk.Frame(right)
         vis_frame.pack(fill="both", expand=True)
@@ -114,9 +158,11 @@ class App:
         self.canvas_size = 640
         self.canvas = tk.Canvas(canvas_frame, width=self.canvas_size, height=self.canvas_size, bg="white")
         self.canvas.pack(side="left", padx=6, pady=6, expand=True, fill="both")
+        self.render = RenderizadorPlano(self.canvas, self.canvas_size)
 
         self.frame_grafica = tk.LabelFrame(vis_frame, text="Convergencia del Fitness", padx=8, pady=8)
         self.frame_grafica.pack(side="left", fill="both", expand=True, padx=8, pady=6)
+        self._crear_grafica()
 
         side_info = tk.Frame(canvas_frame)
         side_info.pack(side="left", fill="y", padx=6)
@@ -130,21 +176,156 @@ class App:
             self.tree_res.column(c, width=w, anchor="center")
         self.tree_res.pack(pady=6)
 
+    def _crear_grafica(self):
+        """
+        Figura única para todas las corridas. Las líneas son `animated`: el dibujo normal solo pinta
+        ejes y rejilla, que se guardan como fondo, y en cada actualización se restaura ese fondo y se
+        repintan las líneas (blitting). Solo se redibuja la figura entera cuando cambia la escala.
+        """
+        self.figura = Figure(figsize=(5, 4), dpi=90)
+        self.ax = self.figura.add_subplot(111)
+        self.ax.set_title("Evolución del Fitness", fontsize=12, fontweight="bold")
+        self.ax.set_xlabel("Generación", fontsize=10)
+        self.ax.set_ylabel("Fitness (Ganancia)", fontsize=10)
+        self.ax.grid(True, linestyle="--", alpha=0.6)
+        self.lineas = {
+            "mejor_fitness": self.ax.plot([], [], color="blue", label="Mejor", animated=True)[0],
+            "promedio_fitness": self.ax.plot([], [], color="green", label="Promedio", animated=True)[0],
+            "peor_fitness": self.ax.plot([], [], color="red", label="Peor", animated=True)[0],
+        }
+        self.ax.legend(loc="lower right")
+        # series de la corrida actual; se vacían (no se recrean) al empezar otra
+        self.series = {clave: [] for clave in self.lineas}
+        self.generaciones_grafica = []
+        self.fondo_grafica = None
+        self.canvas_grafica = FigureCanvasTkAgg(self.figura, master=self.frame_grafica)
+        self.canvas_grafica.get_tk_widget().pack(fill="both", expand=True)
+        self.canvas_grafica.mpl_connect("draw_event", self._al_dibujar_grafica)
+
+    def _al_dibujar_grafica(self, event):
+        # tras un dibujo completo (cambio de escala, redimensionado) se guarda el fondo nuevo
+        self.fondo_grafica = self.canvas_grafica.copy_from_bbox(self.figura.bbox)
+        for linea in self.lineas.values():
+            self.ax.draw_artist(linea)
+
+    def reiniciar_grafica(self, generaciones):
+        for serie in self.series.values():
+            serie.clear()
+        self.generaciones_grafica.clear()
+        for linea in self.lineas.values():
+            linea.set_data([], [])
+        self.ax.set_xlim(1, max(2, generaciones))
+        self.ax.set_ylim(0, 1)
+        self.canvas_grafica.draw_idle()
+
+    def agregar_a_grafica(self, instantaneas):
+        """Añade los puntos de las instantáneas nuevas y repinta solo las líneas."""
+        if not instantaneas:
+            return
+        for inst in instantaneas:
+            self.generaciones_grafica.append(inst["generacion"])
+            for clave, serie in self.series.items():
+                serie.append(inst[clave])
+        for clave, linea in self.lineas.items():
+            linea.set_data(self.generaciones_grafica, self.series[clave])
+
+        # ampliar la escala si algún punto nuevo se sale de ella (con un 10% de holgura)
+        y_min, y_max = self.ax.get_ylim()
+        nuevos_min = min(inst["peor_fitness"] for inst in instantaneas)
+        nuevos_max = max(inst["mejor_fitness"] for inst in instantaneas)
+        x_max = self.ax.get_xlim()[1]
+        if nuevos_min < y_min or nuevos_max > y_max or self.generaciones_grafica[-1] > x_max:
+            bajo = min(self.series["peor_fitness"])
+            alto = max(self.series["mejor_fitness"])
+            holgura = 0.1 * (alto - bajo) or 1.0
+            self.ax.set_ylim(bajo - holgura, alto + holgura)
+            self.ax.set_xlim(1, max(x_max, self.generaciones_grafica[-1]))
+            self.canvas_grafica.draw()  # dispara _al_dibujar_grafica
+            return
+        if self.fondo_grafica is None:
+            self.canvas_grafica.draw()
+            return
+        self.canvas_grafica.restore_region(self.fondo_grafica)
+        for linea in self.lineas.values():
+            self.ax.draw_artist(linea)
+        self.canvas_grafica.blit(self.figura.bbox)
+
     # -------------------------------------------------------------------------
     # === Métodos de edición y manejo del catálogo ===
-    def cargar_datos_edicion(self, event):
+    def cargar_articulos(self, articulos):
+        """Reemplaza el índice por `articulos` (dicts o un catálogo columnar), todos marcados."""
+        self.articulos = {}
+        for n, art in enumerate(articulos, 1):
+            art = dict(art)
+            art.setdefault("id", n)
+            self.articulos[art["id"]] = art
+        self.marcados = set(self.articulos)
+        self.siguiente_id = max(self.articulos, default=0) + 1
+
+    def abrir_catalogo(self):
+        ruta = filedialog.askopenfilename(title="Cargar catálogo",
+                                          filetypes=[("Catálogos", "*.csv *.json *.jsonl"), ("Todos", "*.*")])
+        if not ruta:
+            return
+        try:
+            catalogo = cargar_catalogo(ruta)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"No se pudo cargar el catálogo: {e}")
+            return
+        self.cargar_articulos(catalogo)
+        self.aplicar_filtro()
+
+    def _valores_fila(self, art):
+        return (MARCA if art["id"] in self.marcados else "", art["id"], art["nombre"],
+                f"{art['ancho'] * art['largo']:.3f}", art["ganancia"], art["stock"])
+
+    def _programar_filtro(self):
+        # se filtra cuando se deja de escribir, no en cada tecla
+        if self._filtro_pendiente is not None:
+            self.root.after_cancel(self._filtro_pendiente)
+        self._filtro_pendiente = self.root.after(250, self.aplicar_filtro)
+
+    def aplicar_filtro(self):
+        self._filtro_pendiente = None
+        texto = self.v_buscar.get().strip().lower()
+        if texto:
+            self.visibles = [i for i, art in self.articulos.items() if texto in art["nombre"].lower()]
+        else:
+            self.visibles = list(self.articulos)
+        self.ir_a_pagina(0)
+
+    def ir_a_pagina(self, pagina):
+        """Materializa en el Treeview solo las filas de la página pedida."""
+        n_paginas = max(1, -(-len(self.visibles) // FILAS_POR_PAGINA))
+        self.pagina = min(max(0, pagina), n_paginas - 1)
+        self.tree.delete(*self.tree.get_children())
+        inicio = self.pagina * FILAS_POR_PAGINA
+        for id_art in self.visibles[inicio:inicio + FILAS_POR_PAGINA]:
+            self.tree.insert("", "end", iid=str(id_art), values=self._valores_fila(self.articulos[id_art]))
+        self.lbl_pagina.config(text=f"Página {self.pagina + 1}/{n_paginas} ({len(self.visibles)} artículos, "
+                                    f"{len(self.marcados)} marcados)")
+
+    def _refrescar_fila(self, id_art):
+        if self.tree.exists(str(id_art)):
+            self.tree.item(str(id_art), values=self._valores_fila(self.articulos[id_art]))
+
+    def _articulo_seleccionado(self):
         sel = self.tree.selection()
-        if not sel:
+        return int(sel[0]) if sel else None
+
+    def cargar_datos_edicion(self, event):
+        id_art = self._articulo_seleccionado()
+        if id_art is None:
             return
-        vals = self.tree.item(sel[0], "values")
+        art = self.articulos[id_art]
         self.e_gan.delete(0, tk.END)
         self.e_stock.delete(0, tk.END)
-        self.e_gan.insert(0, vals[4])
-        self.e_stock.insert(0, vals[5])
+        self.e_gan.insert(0, art["ganancia"])
+        self.e_stock.insert(0, art["stock"])
 
     def aplicar_edicion(self):
-        sel = self.tree.selection()
-        if not sel:
+        id_art = self._articulo_seleccionado()
+        if id_art is None:
             messagebox.showwarning("Aviso", "Seleccione un artículo para editar.")
             return
         try:
@@ -154,27 +335,30 @@ class App:
             messagebox.showerror("Error", "Ingrese valores numéricos válidos.")
             return
 
-        iid = sel[0]
-        vals = list(self.tree.item(iid, "values"))
-        vals[4] = gan
-        vals[5] = stock
-        self.tree.item(iid, values=vals)
-        for art in self.catalogo:
-            if art["id"] == int(vals[1]):
-                art["ganancia"] = gan
-                art["stock"] = stock
-                break
+        art = self.articulos[id_art]
+        art["ganancia"] = gan
+        art["stock"] = stock
+        self._refrescar_fila(id_art)
         messagebox.showinfo("Éxito", "Artículo actualizado correctamente.")
 
     def marcar_fila(self):
-        sel = self.tree.selection()
-        if not sel:
+        id_art = self._articulo_seleccionado()
+        if id_art is None:
             messagebox.showwarning("Aviso", "Seleccione una fila.")
             return
-        iid = sel[0]
-        vals = list(self.tree.item(iid, "values"))
-        vals[0] = "✔️" if vals[0] != "✔️" else ""
-        self.tree.item(iid, values=vals)
+        if id_art in self.marcados:
+            self.marcados.discard(id_art)
+        else:
+            self.marcados.add(id_art)
+        self._refrescar_fila(id_art)
+
+    def marcar_visibles(self, marcar):
+        """Marca o desmarca todos los artículos que pasan el filtro (no solo la página)."""
+        if marcar:
+            self.marcados.update(self.visibles)
+        else:
+            self.marcados.difference_update(self.visibles)
+        self.ir_a_pagina(self.pagina)
 
     def abrir_agregar(self):
         win = tk.Toplevel(self.root)
@@ -197,52 +381,34 @@ class App:
             except ValueError:
                 messagebox.showerror("Error", "Verifique los valores ingresados.")
                 return
-            nuevo_id = max(a["id"] for a in self.catalogo) + 1
-            self.catalogo.append({"id": nuevo_id, "nombre": nombre, "ancho": ancho, "largo": largo,
-                                  "ganancia": gan, "stock": stock})
-            area = ancho * largo
-            self.tree.insert("", "end", iid=str(nuevo_id),
-                             values=("✔️", nuevo_id, nombre, f"{area:.3f}", gan, stock))
+            nuevo_id = self.siguiente_id
+            self.siguiente_id += 1
+            self.articulos[nuevo_id] = {"id": nuevo_id, "nombre": nombre, "ancho": ancho, "largo": largo,
+                                        "ganancia": gan, "stock": stock}
+            self.marcados.add(nuevo_id)
+            self.visibles.append(nuevo_id)
+            # mostrar la página donde quedó el artículo nuevo
+            self.ir_a_pagina((len(self.visibles) - 1) // FILAS_POR_PAGINA)
             win.destroy()
 
         tk.Button(win, text="Agregar", command=agregar, bg="#4CAF50", fg="white").grid(row=len(labels), column=0, columnspan=2, pady=6)
 
     def eliminar_seleccion(self):
-        sel = self.tree.selection()
-        if not sel:
+        id_art = self._articulo_seleccionado()
+        if id_art is None:
             messagebox.showwarning("Aviso", "Seleccione una fila para eliminar.")
             return
-        iid = sel[0]
-        id_art = int(self.tree.item(iid, "values")[1])
-        self.tree.delete(iid)
-        self.catalogo = [a for a in self.catalogo if a["id"] != id_art]
+        del self.articulos[id_art]
+        self.marcados.discard(id_art)
+        self.visibles.remove(id_art)
+        self.ir_a_pagina(self.pagina)
         messagebox.showinfo("Eliminado", "Artículo eliminado del catálogo.")
 
     # -------------------------------------------------------------------------
     # === Ejecución del algoritmo y visualización ===
-    def mostrar_grafica_fitness(self, historial):
-        """Muestra la gráfica de fitness en una ventana emergente."""
-        if not historial:
-            messagebox.showinfo("Sin datos", "No hay historial disponible para graficar.")
-            return
-
-        generaciones = list(range(1, len(historial) + 1))
-        fitness = historial
-
-        # Crear la figura independiente
-        plt.figure(figsize=(8, 5))
-        plt.plot(generaciones, fitness, marker="o", color="blue", label="Mejor fitness")
-        plt.title("Evolución del Mejor Fitness", fontsize=12, fontweight="bold")
-        plt.xlabel("Generación", fontsize=10)
-        plt.ylabel("Fitness (Ganancia)", fontsize=10)
-        plt.grid(True, linestyle="--", alpha=0.6)
-        plt.legend()
-        plt.tight_layout()
-
-        # Mostrar en ventana emergente
-        plt.show()
-
     def ejecutar_ga(self):
+        if self.hilo is not None and self.hilo.is_alive():
+            return
         catalogo_backend = self.construir_catalogo_para_backend()
         if not catalogo_backend:
             messagebox.showwarning("Aviso", "Marca al menos un artículo para incluir.")
@@ -257,21 +423,125 @@ class App:
                 "seleccion": self.sel_var.get(),
                 "elitismo": bool(self.var_elit.get()),
                 "torneo_k": 3,
+                "empaquetado": self.emp_var.get(),
+                "rotacion": bool(self.var_rot.get()),
+                "fitness": "empaquetado" if self.var_geo.get() else "area",
+                "reparacion": bool(self.var_rep.get()),
+                "rellenar": bool(self.var_rep.get()),
+                "fraccion_greedy": 0.2 if self.var_rep.get() else 0.0,
+                "semilla": int(self.v_semilla.get()) if self.v_semilla.get().strip() else None,
+                "cache_resultados": True,
+                "arranque_en_caliente": True,
             }
+            if self.var_pareto.get():
+                params["motor"] = "nsga2"
+            self.refresco = max(20, int(self.v_refresco.get()))
         except Exception as e:
             messagebox.showerror("Error", f"Parámetros inválidos: {e}")
             return
 
-        resultado = ejecutar_algoritmo_genetico(params)
+        self.cola = queue.Queue()
+        self.cancelar = threading.Event()
+        params["cancelar"] = self.cancelar
+        self.params_corrida = params
+        self.mejor_dibujado = None
+        self.reiniciar_grafica(params["generaciones"])
+        self.btn_ejecutar.config(state="disabled")
+        self.btn_cancelar.config(state="normal")
+        self.lbl_progreso.config(text="Ejecutando...")
+        self.hilo = threading.Thread(target=self._trabajador_ga, args=(params, self.cola), daemon=True)
+        self.hilo.start()
+        self.root.after(self.refresco, self._sondear_ga)
+
+    def cancelar_ga(self):
+        if self.cancelar is not None:
+            self.cancelar.set()
+            self.lbl_progreso.config(text="Cancelando...")
+
+    @staticmethod
+    def _trabajador_ga(params, cola):
+        """Hilo trabajador: recorre el GA y deja en la cola cada instantánea y el resultado final."""
+        try:
+            generador = iterar_algoritmo_genetico(params)
+            while True:
+                try:
+                    cola.put(("generacion", next(generador)))
+                except StopIteration as fin:
+                    cola.put(("fin", fin.value))
+                    return
+        except Exception as e:
+            cola.put(("error", e))
+
+    def _sondear_ga(self):
+        """Vacía la cola en el hilo de Tk; solo se redibuja una vez por sondeo, con lo último recibido."""
+        nuevas = []
+        final = None
+        try:
+            while True:
+                tipo, dato = self.cola.get_nowait()
+                if tipo == "generacion":
+                    nuevas.append(dato)
+                else:
+                    final = (tipo, dato)
+                    break
+        except queue.Empty:
+            pass
+
+        if nuevas:
+            ultima = nuevas[-1]
+            self.lbl_progreso.config(text=f"Generación {ultima['generacion']}/{self.params_corrida['generaciones']} | "
+                                          f"mejor {ultima['mejor_global']:.2f} | promedio {ultima['promedio_fitness']:.2f} | "
+                                          f"diversidad {ultima['diversidad']:.0%}")
+            self.agregar_a_grafica(nuevas)
+            if ultima["mejor_individuo"] != self.mejor_dibujado:
+                self.mejor_dibujado = ultima["mejor_individuo"]
+                self.pintar_distribucion(empaquetar(self.mejor_dibujado, self.params_corrida["catalogo"],
+                                                    self.params_corrida))
+
+        if final is None:
+            self.root.after(self.refresco, self._sondear_ga)
+            return
+        self.btn_ejecutar.config(state="normal")
+        self.btn_cancelar.config(state="disabled")
+        tipo, dato = final
+        if tipo == "error":
+            self.lbl_progreso.config(text="Error en la ejecución")
+            messagebox.showerror("Error", f"Fallo al ejecutar el GA: {dato}")
+            return
+        self.mostrar_resultado(dato)
+
+    def mostrar_resultado(self, resultado):
         placements = resultado.get("placements", [])
         detalle = resultado.get("detalle", [])
         mejor_area = resultado.get("mejor_area", 0.0)
         mejor_gan = resultado.get("mejor_ganancia", 0.0)
+        gan_colocada = resultado.get("ganancia_colocada", mejor_gan)
         historial = resultado.get("historial", [])
 
         self.pintar_distribucion(placements)
-        self.mostrar_grafica_fitness(historial)
-
+        if not self.generaciones_grafica and historial:
+            # sin instantáneas (dp o resultado de la caché): se grafica solo el historial
+            self.agregar_a_grafica([{"generacion": g, "mejor_fitness": f, "promedio_fitness": f, "peor_fitness": f}
+                                    for g, f in enumerate(historial, 1)])
+        motivo = resultado.get("motivo_parada", "generaciones")
+        if resultado.get("cancelado"):
+            texto = "Cancelado"
+        elif motivo != "generaciones":
+            texto = f"Terminado por {motivo} en la generación {resultado.get('generacion_final')}"
+        else:
+            texto = "Terminado"
+        if resultado.get("cache_resultados") == "acierto":
+            texto += " (resultado guardado)"
+        self.lbl_progreso.config(text=texto)
+        self._mostrar_detalle(detalle)
+        if resultado.get("frente_pareto"):
+            self.mostrar_frente_pareto(resultado["frente_pareto"])
+
+        messagebox.showinfo("Resultado", f"Ganancia total: {mejor_gan:.2f} (colocada: {gan_colocada:.2f}) | "
+                                         f"Área total: {mejor_area:.2f} m²")
+
+    def _mostrar_detalle(self, detalle):
+        """Tabla de artículos elegidos y barra de área ocupada."""
         self.tree_res.delete(*self.tree_res.get_children())
         total_gan, total_area = 0.0, 0.0
         for d in detalle:
@@ -287,53 +557,208 @@ class App:
         ancho = int(min(1.0, total_area / AREA_MAXIMA) * 180)
         self.canvas_bar.create_rectangle(0, 0, ancho, 20, fill="steelblue")
 
-        messagebox.showinfo("Resultado", f"Ganancia total: {mejor_gan:.2f} | Área total: {mejor_area:.2f} m²")
+    # -------------------------------------------------------------------------
+    # === Frente de Pareto (modo multiobjetivo) ===
+    def mostrar_frente_pareto(self, frente):
+        """
+        Ventana con el frente ganancia/área y la lista de sus puntos. Al elegir un punto (clic en la
+        gráfica o fila de la lista) se dibuja su distribución en el plano principal.
+        """
+        if self.ventana_pareto is not None:
+            self.ventana_pareto.destroy()
+        self.frente = frente
+        self.ventana_pareto = tk.Toplevel(self.root)
+        self.ventana_pareto.title(f"Frente de Pareto ({len(frente)} puntos)")
+        self.ventana_pareto.protocol("WM_DELETE_WINDOW", self._cerrar_frente_pareto)
+
+        figura = Figure(figsize=(5, 4), dpi=90)
+        ax = figura.add_subplot(111)
+        ax.set_title("Ganancia vs. área ocupada", fontsize=12, fontweight="bold")
+        ax.set_xlabel("Área (m²)", fontsize=10)
+        ax.set_ylabel("Ganancia", fontsize=10)
+        ax.grid(True, linestyle="--", alpha=0.6)
+        ax.plot([p["area"] for p in frente], [p["ganancia"] for p in frente], color="lightgray", zorder=1)
+        ax.scatter([p["area"] for p in frente], [p["ganancia"] for p in frente], color="blue", s=18,
+                   picker=5, zorder=2)
+        self.marca_pareto = ax.plot([], [], "o", color="red", markersize=10, fillstyle="none", zorder=3)[0]
+        self.canvas_pareto = FigureCanvasTkAgg(figura, master=self.ventana_pareto)
+        self.canvas_pareto.get_tk_widget().pack(side="left", fill="both", expand=True)
+        self.canvas_pareto.mpl_connect("pick_event", lambda e: self._seleccionar_punto_pareto(int(e.ind[0])))
+
+        self.tree_pareto = ttk.Treeview(self.ventana_pareto, columns=("gan", "area", "uds"), show="headings", height=20)
+        for c, t, w in (("gan", "Ganancia", 90), ("area", "Área (m²)", 80), ("uds", "Unidades", 70)):
+            self.tree_pareto.heading(c, text=t)
+            self.tree_pareto.column(c, width=w, anchor="center")
+        for i, p in enumerate(frente):
+            self.tree_pareto.insert("", "end", iid=str(i), values=(f"{p['ganancia']:.2f}", f"{p['area']:.2f}", p["unidades"]))
+        self.tree_pareto.pack(side="left", fill="y", padx=6, pady=6)
+        self.tree_pareto.bind("<<TreeviewSelect>>", self._al_elegir_fila_pareto)
+        self.canvas_pareto.draw_idle()
+
+    def _cerrar_frente_pareto(self):
+        self.ventana_pareto.destroy()
+        self.ventana_pareto = None
+
+    def _seleccionar_punto_pareto(self, i):
+        """Clic en la gráfica: se selecciona la fila, y el evento de la lista muestra el punto."""
+        self.tree_pareto.selection_set(str(i))
+        self.tree_pareto.see(str(i))
+
+    def _al_elegir_fila_pareto(self, event):
+        seleccion = self.tree_pareto.selection()
+        if seleccion:
+            self.mostrar_punto_pareto(int(seleccion[0]))
+
+    def mostrar_punto_pareto(self, i):
+        """Empaqueta el punto i del frente y lo muestra en el plano y en la tabla de resultados."""
+        punto = self.frente[i]
+        resultado = construir_resultado(punto["individuo"], self.params_corrida["catalogo"], [], self.params_corrida)
+        self.pintar_distribucion(resultado["placements"])
+        self._mostrar_detalle(resultado["detalle"])
+        self.marca_pareto.set_data([punto["area"]], [punto["ganancia"]])
+        self.canvas_pareto.draw_idle()
+        self.lbl_progreso.config(text=f"Punto {i + 1}/{len(self.frente)} del frente de Pareto | "
+                                      f"ganancia {punto['ganancia']:.2f} | área {punto['area']:.2f} m² | "
+                                      f"colocada {resultado['ganancia_colocada']:.2f}")
 
     # -------------------------------------------------------------------------
     def construir_catalogo_para_backend(self):
-        catalogo_final = []
-        for iid in self.tree.get_children():
-            vals = self.tree.item(iid, "values")
-            if vals[0] != "✔️":
-                continue
-            id_int = int(vals[1])
-            nombre = vals[2]
-            area = float(vals[3])
-            gan = float(vals[4])
-            stock = int(vals[5])
-            match = next((a for a in self.catalogo if a.get("id") == id_int), None)
-            ancho = match.get("ancho", math.sqrt(area))
-            largo = match.get("largo", area / ancho if ancho else math.sqrt(area))
-            catalogo_final.append({"nombre": nombre, "ancho": ancho, "largo": largo, "ganancia": gan, "stock": stock})
-        return catalogo_final
+        """Artículos marcados, tomados del índice (en orden de inserción)."""
+        return [{"nombre": art["nombre"], "ancho": art["ancho"], "largo": art["largo"],
+                 "ganancia": art["ganancia"], "stock": art["stock"]}
+                for id_art, art in self.articulos.items() if id_art in self.marcados]
 
     # -------------------------------------------------------------------------
     def pintar_distribucion(self, placements):
-        import hashlib
-        self.canvas.delete("all")
-        lado_plano_m = math.sqrt(AREA_MAXIMA)
-        margin_px = 20
-        draw_size = self.canvas_size - 2 * margin_px
-        scale = draw_size / lado_plano_m
-
+        self.render.pintar(placements)
+
+
+# -----------------------------------------------------------------------------
+# Dibujo del plano
+# -----------------------------------------------------------------------------
+COLOR_NO_INCLUIDO = "#E6B0AA"
+
+
+@lru_cache(maxsize=None)
+def color_articulo(nombre):
+    """Color estable por nombre de artículo (el MD5 se calcula una sola vez por nombre)."""
+    h = int(hashlib.md5(nombre.encode()).hexdigest(), 16)
+    return f"#{(100 + h % 130):02x}{(100 + (h >> 8) % 130):02x}{(100 + (h >> 16) % 130):02x}"
+
+
+def color_ocupacion(fraccion):
+    """Blanco (vacío) a azul acero (lleno) para las celdas agregadas."""
+    fraccion = min(1.0, fraccion)
+    r = int(255 + (70 - 255) * fraccion)
+    g = int(255 + (130 - 255) * fraccion)
+    b = int(255 + (180 - 255) * fraccion)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+class RenderizadorPlano:
+    """
+    Dibuja placements en un Canvas reutilizando sus items: los rectángulos y textos de la pasada
+    anterior se mueven y recolorean con coords/itemconfigure y los que sobran se ocultan, en vez de
+    borrar y recrear todo. Los nombres solo se rotulan si caben en su rectángulo, y los artículos
+    de menos de LOD_PX píxeles (plano alejado o artículos diminutos) se agregan en celdas de
+    CELDA_LOD píxeles coloreadas según el área que ocupan. La rueda del ratón acerca/aleja y
+    arrastrar con el botón izquierdo desplaza el plano.
+    """
+    MARGEN_PX = 20
+    LOD_PX = 3
+    CELDA_LOD = 8
+    ANCHO_CARACTER = 6  # aproximado para Arial 8 negrita
+    ALTO_TEXTO = 10
+    ZOOM_MIN, ZOOM_MAX = 0.1, 20.0
+
+    def __init__(self, canvas, tam):
+        self.canvas = canvas
+        self.tam = tam
+        self.zoom = 1.0
+        self.placements = []
+        # items creados y cuántos de cada tipo están visibles
+        self.rects, self.textos, self.celdas = [], [], []
+        self.visibles = {"rect": 0, "texto": 0, "celda": 0}
+        self.crear_rect = partial(canvas.create_rectangle, outline="black", width=1.2)
+        self.crear_texto = partial(canvas.create_text, font=("Arial", 8, "bold"), fill="black")
+        self.crear_celda = partial(canvas.create_rectangle, outline="")
+        self.limite = canvas.create_rectangle(0, 0, 0, 0, outline="red", width=3, dash=(5, 3), tags="limite")
+        self.limite_texto = canvas.create_text(0, 0, text="Límite de 50 m²", fill="red",
+                                               font=("Arial", 10, "bold"), tags="limite")
+        canvas.bind("<MouseWheel>", lambda e: self.acercar(1.25 if e.delta > 0 else 0.8))
+        canvas.bind("<Button-4>", lambda e: self.acercar(1.25))
+        canvas.bind("<Button-5>", lambda e: self.acercar(0.8))
+        canvas.bind("<ButtonPress-1>", lambda e: canvas.scan_mark(e.x, e.y))
+        canvas.bind("<B1-Motion>", lambda e: canvas.scan_dragto(e.x, e.y, gain=1))
+
+    def escala(self):
+        """Píxeles por metro con el zoom actual."""
+        return (self.tam - 2 * self.MARGEN_PX) / math.sqrt(AREA_MAXIMA) * self.zoom
+
+    def acercar(self, factor):
+        zoom = min(self.ZOOM_MAX, max(self.ZOOM_MIN, self.zoom * factor))
+        if zoom != self.zoom:
+            self.zoom = zoom
+            self.pintar(self.placements)
+
+    def _item(self, pool, tipo, crear, coords, **opciones):
+        """Reutiliza el siguiente item de `pool` (o lo crea) con las coordenadas y opciones dadas."""
+        n = self.usados[tipo]
+        self.usados[tipo] = n + 1
+        if n < len(pool):
+            item = pool[n]
+            self.canvas.coords(item, *coords)
+            if n >= self.visibles[tipo]:
+                opciones["state"] = "normal"
+            self.canvas.itemconfigure(item, **opciones)
+        else:
+            pool.append(crear(*coords, tags=tipo, **opciones))
+
+    def pintar(self, placements):
+        self.placements = placements
+        canvas = self.canvas
+        escala = self.escala()
+        m = self.MARGEN_PX
+        self.usados = {"rect": 0, "texto": 0, "celda": 0}
+        celdas = {}
         for p in placements:
-            x, y = p.get("x", 0), p.get("y", 0)
-            ancho, largo = p.get("ancho", 0), p.get("largo", 0)
-            x_px = margin_px + x * scale
-            y_px = margin_px + y * scale
-            w_px = ancho * scale
-            h_px = largo * scale
-
-            h = int(hashlib.md5(p["nombre"].encode()).hexdigest(), 16)
-            color = f"#{(100 + h % 130):02x}{(100 + (h >> 8) % 130):02x}{(100 + (h >> 16) % 130):02x}"
-            if not p.get("incluido", True):
-                color = "#E6B0AA"
-            self.canvas.create_rectangle(x_px, y_px, x_px + w_px, y_px + h_px, fill=color, outline="black", width=1.2)
-            self.canvas.create_text(x_px + w_px/2, y_px + h_px/2, text=p["nombre"], font=("Arial", 8, "bold"), fill="black")
-
-        self.canvas.create_rectangle(margin_px, margin_px, margin_px + draw_size, margin_px + draw_size,
-                                     outline="red", width=3, dash=(5, 3))
-        self.canvas.create_text(margin_px + draw_size/2, margin_px - 10, text="Límite de 50 m²", fill="red", font=("Arial", 10, "bold"))
+            w_px = p.get("ancho", 0) * escala
+            h_px = p.get("largo", 0) * escala
+            x_px = m + p.get("x", 0) * escala
+            y_px = m + p.get("y", 0) * escala
+            incluido = p.get("incluido", True)
+            if incluido and max(w_px, h_px) < self.LOD_PX:
+                clave = (int((x_px - m) // self.CELDA_LOD), int((y_px - m) // self.CELDA_LOD))
+                celdas[clave] = celdas.get(clave, 0.0) + w_px * h_px
+                continue
+            color = color_articulo(p["nombre"]) if incluido else COLOR_NO_INCLUIDO
+            self._item(self.rects, "rect", self.crear_rect, (x_px, y_px, x_px + w_px, y_px + h_px),
+                       fill=color)
+            nombre = p["nombre"]
+            if w_px >= len(nombre) * self.ANCHO_CARACTER and h_px >= self.ALTO_TEXTO:
+                self._item(self.textos, "texto", self.crear_texto, (x_px + w_px / 2, y_px + h_px / 2),
+                           text=nombre)
+
+        area_celda = self.CELDA_LOD * self.CELDA_LOD
+        for (cx, cy), ocupado in celdas.items():
+            x0 = m + cx * self.CELDA_LOD
+            y0 = m + cy * self.CELDA_LOD
+            self._item(self.celdas, "celda", self.crear_celda,
+                       (x0, y0, x0 + self.CELDA_LOD, y0 + self.CELDA_LOD), fill=color_ocupacion(ocupado / area_celda))
+
+        # ocultar solo los que estaban visibles y ya no se usan
+        for tipo, pool in (("rect", self.rects), ("texto", self.textos), ("celda", self.celdas)):
+            for item in pool[self.usados[tipo]:self.visibles[tipo]]:
+                canvas.itemconfigure(item, state="hidden")
+            self.visibles[tipo] = self.usados[tipo]
+
+        lado_px = math.sqrt(AREA_MAXIMA) * escala
+        canvas.coords(self.limite, m, m, m + lado_px, m + lado_px)
+        canvas.coords(self.limite_texto, m + lado_px / 2, m - 10)
+        # los items reutilizados conservan su orden de apilado: textos y límite siempre encima
+        canvas.tag_raise("texto")
+        canvas.tag_raise("limite")
+        canvas.configure(scrollregion=(0, 0, 2 * m + lado_px, 2 * m + lado_px))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,350 @@
+# islas.py
+# Modelo de islas: la población se reparte en subpoblaciones que evolucionan por separado
+# (una tarea por isla en un pool de procesos) e intercambian sus mejores individuos cada
+# `intervalo_migracion` generaciones.
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from backend import (CATALOGO_POR_DEFECTO, PARAMS_PARADA, CriteriosParada, Perfilador, abrir_puntos_control,
+                     construir_resultado, consumir, estadisticas_evaluacion, filas_punto_control,
+                     iterar_evolucion, poblacion_inicial, preparar_evaluacion, sin_instantaneas)
+from puntos_control import estado_random, restaurar_random
+
+# estado del proceso trabajador: el catálogo se envía una sola vez al arrancar el pool y
+# la función de fitness (con su caché) se conserva entre migraciones
+_CATALOGO = None
+_EVALUACION = None
+
+# número de islas fijo (no depende de la máquina) y tamaño mínimo de cada isla: una isla de 1-2
+# individuos con elitismo apenas se reproduce
+ISLAS_POR_DEFECTO = 4
+TAM_MIN_ISLA = 4
+# estadísticas de evaluación que no son contadores y no se suman entre procesos
+NO_SUMABLES = ('tam_max',)
+
+
+def _iniciar_trabajador(catalogo, params):
+    global _CATALOGO, _EVALUACION
+    _CATALOGO = catalogo
+    _EVALUACION = preparar_evaluacion(params)
+
+
+def _evolucionar_isla(tarea):
+    """
+    Tarea del pool: evoluciona una isla `generaciones` y devuelve su estado nuevo. `totales` son
+    los de la evaluación incremental cuando la tarea continúa una época partida por un punto de
+    control (recalcularlos cambiaría el redondeo respecto de la época entera), o None.
+    """
+    poblacion, fitnesses, totales, estado_rng, pm, params, generaciones = tarea
+    rng = random.Random()
+    rng.setstate(estado_rng)
+    evaluar, cache, evaluador = _EVALUACION
+    # la pm adaptativa de cada isla continúa donde quedó en la época anterior
+    criterios = CriteriosParada(params, pm_inicial=pm)
+    perfilador = Perfilador() if params.get('perfilado') else None
+    # instantáneas por generación de la isla, para que el padre arme las globales; si el padre no
+    # las necesita le basta el historial de la isla
+    instantaneas = []
+    previo = None
+    if totales is not None:
+        previo = {'generacion': 0, 'historial': [], 'mejor_ind': None, 'mejor_fit': -1e18, 'totales': totales}
+    # con evaluación incremental, los totales de la población final (los recibe el punto de
+    # control final de iterar_evolucion) viajan con la isla como su población
+    finales = []
+
+    def guardar_totales(generacion, filas, totales, historial, mejor_ind, mejor_fit, final=False):
+        if final:
+            finales.append([list(t[:len(poblacion)]) for t in totales])
+
+    poblacion, historial, mejor_ind, mejor_fit = consumir(iterar_evolucion(
+        poblacion, _CATALOGO, params, generaciones, rng, fitnesses=fitnesses, evaluar=evaluar,
+        instantaneas=params['instantaneas'], criterios=criterios, perfilador=perfilador, estado=previo,
+        punto_control=guardar_totales if params.get('evaluacion_incremental') else None), instantaneas.append)
+    if not params['instantaneas']:
+        instantaneas = historial
+    # generación (de la tarea) en la que apareció el mejor: el padre prefiere el más antiguo entre
+    # iguales, así elige lo mismo aunque la época se haya partido en dos tareas
+    gen_mejor = historial.index(mejor_fit) if mejor_ind is not None else None
+    # fitness de la población final, necesario para elegir emigrantes y reemplazados;
+    # viaja con la isla para no reevaluarla al empezar la siguiente época
+    t0 = time.perf_counter()
+    fitnesses = [evaluar(ind, _CATALOGO) for ind in poblacion]
+    perfil = None
+    if perfilador is not None:
+        perfilador.sumar('evaluacion', time.perf_counter() - t0, len(poblacion))
+        perfil = perfilador.resumen()
+    # contadores acumulados del proceso: el padre se queda con los últimos de cada pid
+    contadores = (os.getpid(), estadisticas_evaluacion(cache, evaluador))
+    return (poblacion, fitnesses, finales[0] if finales else None, rng.getstate(), criterios.pm, instantaneas,
+            mejor_ind, mejor_fit, gen_mejor, perfil, contadores)
+
+
+def _origenes_migracion(n_islas, topologia, rng):
+    """Para cada isla destino, lista de islas de las que recibe emigrantes."""
+    if topologia == 'completa':
+        return [[j for j in range(n_islas) if j != i] for i in range(n_islas)]
+    if topologia == 'aleatoria':
+        # anillo sobre una permutación nueva en cada migración
+        orden = list(range(n_islas))
+        rng.shuffle(orden)
+        origenes = [None] * n_islas
+        for pos, isla in enumerate(orden):
+            origenes[isla] = [orden[pos - 1]]
+        return origenes
+    # 'anillo': la isla i recibe de la i-1
+    return [[(i - 1) % n_islas] for i in range(n_islas)]
+
+
+def _combinar_instantaneas(instantaneas, tams, generacion):
+    """Instantánea global de una generación a partir de las de cada isla (media ponderada por tamaño)."""
+    total = sum(tams)
+    mejor = max(instantaneas, key=lambda s: s['mejor_global'])
+    return {
+        'generacion': generacion,
+        'mejor_fitness': max(s['mejor_fitness'] for s in instantaneas),
+        'promedio_fitness': sum(s['promedio_fitness'] * t for s, t in zip(instantaneas, tams)) / total,
+        'peor_fitness': min(s['peor_fitness'] for s in instantaneas),
+        'mejor_global': mejor['mejor_global'],
+        'mejor_individuo': mejor['mejor_individuo'],
+        'diversidad': sum(s['diversidad'] * t for s, t in zip(instantaneas, tams)) / total,
+    }
+
+
+def _migrar(islas, migrantes, topologia, rng):
+    """Reemplaza los peores de cada isla por los mejores de sus islas de origen."""
+    n_islas = len(islas)
+    if n_islas < 2 or migrantes <= 0:
+        return
+    # se eligen todos los emigrantes antes de modificar ninguna isla
+    emigrantes = []
+    for poblacion, fitnesses in islas:
+        orden = sorted(range(len(poblacion)), key=lambda i: fitnesses[i], reverse=True)
+        emigrantes.append([(list(poblacion[i]), fitnesses[i]) for i in orden[:migrantes]])
+
+    for destino, origenes in enumerate(_origenes_migracion(n_islas, topologia, rng)):
+        poblacion, fitnesses = islas[destino]
+        llegados = [m for o in origenes for m in emigrantes[o]]
+        llegados.sort(key=lambda m: m[1], reverse=True)
+        llegados = llegados[:min(migrantes, len(poblacion))]
+        peores = sorted(range(len(poblacion)), key=lambda i: fitnesses[i])[:len(llegados)]
+        for i, (ind, fit) in zip(peores, llegados):
+            poblacion[i] = list(ind)
+            fitnesses[i] = fit
+
+
+def ejecutar_algoritmo_genetico_islas(params):
+    """Ver iterar_algoritmo_genetico_islas."""
+    return consumir(iterar_algoritmo_genetico_islas(sin_instantaneas(params)), params.get('callback'))
+
+
+def iterar_algoritmo_genetico_islas(params, estado=None):
+    """
+    Generador con los mismos params y resultado que backend.iterar_algoritmo_genetico, más:
+      - trabajadores: procesos del pool (por defecto os.cpu_count(); 1 = sin pool); solo decide
+        el paralelismo, no el resultado
+      - islas: número de islas (por defecto ISLAS_POR_DEFECTO), reducido si hace falta para que
+        cada isla tenga al menos TAM_MIN_ISLA individuos
+      - intervalo_migracion: generaciones entre migraciones (por defecto 10)
+      - migrantes: individuos que emigra cada isla (por defecto 2)
+      - topologia: 'anillo' (por defecto), 'completa' o 'aleatoria'
+    El resultado es reproducible para una semilla dada, independientemente de `trabajadores`
+    (salvo los aciertos y fallos de cache_fitness: cada proceso tiene su caché y se suman).
+    El historial es el mejor fitness global (entre todas las islas) en cada generación.
+    Las instantáneas de una época se producen juntas al terminarla. `cancelar` se consulta
+    entre épocas, y los criterios de parada temprana se evalúan sobre las instantáneas globales
+    de cada generación pero la corrida se detiene al final de la época en la que se cumplen.
+    La pm adaptativa se lleva por isla. Las épocas terminan en los múltiplos de
+    intervalo_migracion (contando desde el inicio de la corrida), también al reanudar: si el punto
+    de control cae a mitad de una época, primero se completa esa época. Los puntos de control se
+    guardan al final de una época, antes de su migración, con la población, los fitness (y los
+    totales de la evaluación incremental), la pm y el generador de cada isla y el generador
+    maestro. Con perfilado, los tiempos por fase son la suma de los de todas las islas
+    (tiempo de CPU repartido entre procesos, no de reloj) más la migración.
+    """
+    catalogo = params.get('catalogo', CATALOGO_POR_DEFECTO)
+    N = int(params.get('tam_poblacion', 60))
+    gen_max = int(params.get('generaciones', 40))
+    trabajadores = max(1, int(params.get('trabajadores', os.cpu_count() or 1)))
+    n_islas = max(1, min(N // TAM_MIN_ISLA, int(params.get('islas', ISLAS_POR_DEFECTO))))
+    intervalo = max(1, int(params.get('intervalo_migracion', 10)))
+    migrantes = int(params.get('migrantes', 2))
+    topologia = params.get('topologia', 'anillo').lower()
+
+    # un generador maestro reparte semillas independientes a cada isla
+    maestro = random.Random(params.get('semilla'))
+    # callback y cancelar no viajan a los procesos (no son serializables)
+    # (los criterios de parada se aplican aquí, sobre el conjunto de islas)
+    params_isla = {k: v for k, v in params.items()
+                   if k not in ('catalogo', 'callback', 'cancelar') + PARAMS_PARADA}
+    criterios = CriteriosParada(params)
+    # las islas arman instantáneas solo si hay quien las consuma: el llamador o la diversidad
+    # global de los criterios de parada
+    instantaneas = params.get('instantaneas', True)
+    params_isla['instantaneas'] = instantaneas or criterios.necesita_diversidad
+    perfilador = Perfilador() if params.get('perfilado') else None
+    inicio = time.perf_counter()
+
+    islas = []
+    totales = []
+    estados = []
+    pms = []
+    tams = []
+    mejor_ind = None
+    mejor_fit = -1e18
+    historial = []
+    hechas = 0
+    if estado is None:
+        for i in range(n_islas):
+            tam = N // n_islas + (1 if i < N % n_islas else 0)
+            rng = random.Random(maestro.getrandbits(64))
+            poblacion = poblacion_inicial(catalogo, tam, params, rng)
+            islas.append((poblacion, None))
+            totales.append(None)
+            estados.append(rng.getstate())
+            pms.append(criterios.pm)
+            tams.append(tam)
+    else:
+        meta, columnas = estado
+        tams = meta['tams']
+        filas = filas_punto_control(columnas['poblacion'], sum(tams), len(catalogo))
+        fitnesses = columnas['fitnesses'].tolist()
+        largo_rng = len(columnas['rng']) // len(tams)
+        pos = 0
+        for i, tam in enumerate(tams):
+            islas.append((filas[pos:pos + tam], fitnesses[pos:pos + tam]))
+            if 'area' in columnas:
+                totales.append([columnas['area'][pos:pos + tam].tolist(), columnas['ganancia'][pos:pos + tam].tolist()])
+            else:
+                totales.append(None)
+            pos += tam
+            rng = restaurar_random(meta['rng'][i], columnas['rng'][i * largo_rng:(i + 1) * largo_rng])
+            estados.append(rng.getstate())
+        pms = meta['pms']
+        restaurar_random(meta['rng_maestro'], columnas['rng_maestro'], maestro)
+        criterios.restaurar(meta['criterios'])
+        historial = columnas['historial'].tolist()
+        mejor_fit = meta['mejor_fit']
+        mejor_ind = columnas['mejor_individuo'].tolist() or None
+        hechas = meta['generacion']
+    contadores_por_proceso = {}
+    if perfilador is not None:
+        perfilador.sumar('inicializacion', time.perf_counter() - inicio, en_generacion=False)
+
+    pool = None
+    if trabajadores > 1:
+        pool = ProcessPoolExecutor(max_workers=min(trabajadores, n_islas),
+                                   initializer=_iniciar_trabajador, initargs=(catalogo, params_isla))
+        ejecutar = pool.map
+    else:
+        _iniciar_trabajador(catalogo, params_isla)
+        ejecutar = map
+    if pool is not None and params.get('punto_control'):
+        # el pool crea sus procesos con la primera tarea, no al construirse: se arrancan ya para
+        # que (con fork, donde se crean todos juntos) no copien el hilo del escritor
+        pool.submit(os.getpid).result()
+    escritor = abrir_puntos_control(params, catalogo, hechas)
+
+    def guardar(generacion):
+        meta_maestro, interno_maestro = estado_random(maestro)
+        meta = {'tams': tams, 'pms': pms, 'mejor_fit': mejor_fit, 'criterios': criterios.estado(),
+                'rng': [[version, gauss] for version, _, gauss in estados], 'rng_maestro': meta_maestro}
+        columnas = {'poblacion': array('q', (q for pob, _ in islas for ind in pob for q in ind)),
+                    'fitnesses': array('d', (f for _, fits in islas for f in fits)),
+                    'mejor_individuo': array('q', mejor_ind or ()),
+                    'historial': array('d', historial),
+                    'rng': array('q', (q for _, interno, _ in estados for q in interno)),
+                    'rng_maestro': interno_maestro}
+        if totales and totales[0] is not None:
+            columnas['area'] = array('d', (a for tot in totales for a in tot[0]))
+            columnas['ganancia'] = array('d', (g for tot in totales for g in tot[1]))
+        escritor.enviar(generacion, meta, columnas)
+
+    try:
+        while hechas < gen_max and not criterios.cancelada():
+            # migración de la época anterior (también al reanudar desde un punto de control que cae
+            # al final de una época); a mitad de época, la isla sigue con sus totales incrementales
+            en_epoca = hechas % intervalo
+            if hechas and not en_epoca:
+                t0 = time.perf_counter()
+                _migrar(islas, migrantes, topologia, maestro)
+                if perfilador is not None:
+                    perfilador.sumar('migracion', time.perf_counter() - t0, en_generacion=False)
+            gens = min(intervalo - en_epoca, gen_max - hechas)
+            tareas = [(pob, fits, tot if en_epoca else None, est, pm, params_isla, gens)
+                      for (pob, fits), tot, est, pm in zip(islas, totales, estados, pms)]
+            salidas = list(ejecutar(_evolucionar_isla, tareas))
+
+            islas = []
+            totales = []
+            estados = []
+            pms = []
+            previo = (mejor_fit, mejor_ind)
+            mejor_global = mejor_fit
+            series = []
+            mejor_epoca = None
+            for pob, fits, tot, est, pm, serie, ind, fit, gen_ind, perfil, (pid, contadores) in salidas:
+                islas.append((pob, fits))
+                totales.append(tot)
+                estados.append(est)
+                pms.append(pm)
+                series.append(serie)
+                contadores_por_proceso[pid] = contadores
+                if perfil is not None:
+                    perfilador.absorber(perfil, desde=hechas)
+                # entre iguales, el que apareció antes (y luego la isla de menor índice)
+                if ind is not None and (mejor_epoca is None or (fit, -gen_ind) > mejor_epoca[:2]):
+                    mejor_epoca = (fit, -gen_ind, ind)
+            if mejor_epoca is not None and mejor_epoca[0] > mejor_fit:
+                mejor_fit, _, mejor_ind = mejor_epoca
+            # mejor global por generación
+            for g in range(gens):
+                if params_isla['instantaneas']:
+                    global_g = _combinar_instantaneas([serie[g] for serie in series], tams, hechas + g + 1)
+                    historial.append(global_g['mejor_fitness'])
+                    if previo[1] is not None and previo[0] >= global_g['mejor_global']:
+                        # las islas solo conocen lo mejor de esta época
+                        global_g['mejor_global'], global_g['mejor_individuo'] = previo[0], list(previo[1])
+                    mejor_global, diversidad = global_g['mejor_global'], global_g['diversidad']
+                else:
+                    historial.append(max(serie[g] for serie in series))
+                    mejor_global, diversidad = max(mejor_global, historial[-1]), None
+                yield global_g if instantaneas else hechas + g + 1
+                criterios.actualizar(mejor_global, diversidad)
+
+            hechas += gens
+            if criterios.motivo is not None:
+                break
+            if escritor is not None and escritor.toca(hechas):
+                guardar(hechas)
+        # estado final (si no paró un criterio), para poder prolongar la corrida
+        if escritor is not None and criterios.motivo in (None, 'cancelado') and hechas != escritor.ultima:
+            guardar(hechas)
+    finally:
+        if escritor is not None:
+            escritor.cerrar()
+        if pool is not None:
+            pool.shutdown()
+
+    if mejor_ind is None:
+        mejor_ind = islas[0][0][0]
+    t0 = time.perf_counter()
+    resultado = construir_resultado(mejor_ind, catalogo, historial, params)
+    if perfilador is not None:
+        perfilador.sumar('empaquetado', time.perf_counter() - t0, en_generacion=False)
+        resultado['perfil'] = dict(perfilador.resumen(), total=time.perf_counter() - inicio)
+    resultado.update(criterios.resumen(len(historial)))
+    if pms and criterios.adaptativa:
+        resultado['pm_final'] = sum(pms) / len(pms)
+    if escritor is not None:
+        resultado['punto_control'] = escritor.resumen()
+    # suma de los contadores de todos los procesos
+    for contadores in contadores_por_proceso.values():
+        for clave, valores in contadores.items():
+            total = resultado.setdefault(clave, {})
+            for k, v in valores.items():
+                # la capacidad es la misma en cada proceso: no se suma
+                total[k] = v if k in NO_SUMABLES else total.get(k, 0) + v
+    return resultado
@@ -0,0 +1,247 @@
+# lote.py
+# Ejecución por lotes sin interfaz: barrido de parámetros del GA (rejilla o aleatorio) × semillas
+# en un pool de procesos. Cada corrida terminada se añade como un registro al archivo de salida
+# (.csv o .jsonl) en cuanto acaba, y al relanzar el mismo barrido se saltan las ya hechas.
+#
+#   python lote.py catalogo.json resultados.jsonl -p tam_poblacion=40,80 -p pm=0.05,0.1 --semillas 5
+#   python lote.py catalogo.csv resultados.csv --barrido aleatorio --puntos 20 -p pc=0.5:0.9 \
+#       -p seleccion=torneo,ruleta,sus -p motor=numpy
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from backend import ejecutar_algoritmo_genetico
+from catalogo import cargar_catalogo, huella_catalogo
+
+# columnas fijas de cada registro; las del barrido van entre 'semilla' y estas
+COLUMNAS_RESULTADO = ['mejor_ganancia', 'ganancia_colocada', 'mejor_area', 'generaciones_ejecutadas', 'motivo_parada',
+                      'tiempo_s']
+
+# catálogo del proceso trabajador, enviado una sola vez al arrancar el pool
+_CATALOGO = None
+
+
+def _iniciar_trabajador(catalogo):
+    global _CATALOGO
+    _CATALOGO = catalogo
+
+
+def _valor(texto):
+    """'40' -> 40, '0.8' -> 0.8, 'true' -> True, otro texto se deja igual."""
+    if texto.lower() in ('true', 'false'):
+        return texto.lower() == 'true'
+    for tipo in (int, float):
+        try:
+            return tipo(texto)
+        except ValueError:
+            pass
+    return texto
+
+
+def leer_espacio(especificaciones):
+    """
+    ['clave=v1,v2,...', 'clave=min:max', ...] -> {clave: lista de valores o (min, max)}.
+    Un rango min:max solo tiene sentido en el barrido aleatorio.
+    """
+    espacio = {}
+    for espec in especificaciones:
+        clave, sep, valores = espec.partition('=')
+        if not sep or not clave:
+            raise ValueError(f"parámetro mal formado: {espec!r} (se espera clave=valores)")
+        if ':' in valores and ',' not in valores:
+            minimo, maximo = (_valor(v) for v in valores.split(':', 1))
+            espacio[clave] = (minimo, maximo)
+        else:
+            espacio[clave] = [_valor(v) for v in valores.split(',')]
+    return espacio
+
+
+def puntos_rejilla(espacio):
+    """Producto cartesiano de todos los valores."""
+    for clave, valores in espacio.items():
+        if isinstance(valores, tuple):
+            raise ValueError(f"el rango de {clave!r} requiere --barrido aleatorio")
+    claves = list(espacio)
+    return [dict(zip(claves, combinacion)) for combinacion in itertools.product(*espacio.values())]
+
+
+def puntos_aleatorios(espacio, n, semilla=0):
+    """
+    n puntos al azar: de las listas se elige un valor y de los rangos se sortea uniforme (entero si
+    ambos extremos lo son). Con la misma semilla salen los mismos puntos, lo que permite reanudar.
+    """
+    rnd = random.Random(semilla)
+    puntos = []
+    for _ in range(n):
+        punto = {}
+        for clave, valores in espacio.items():
+            if isinstance(valores, tuple):
+                minimo, maximo = valores
+                if isinstance(minimo, int) and isinstance(maximo, int):
+                    punto[clave] = rnd.randint(minimo, maximo)
+                else:
+                    punto[clave] = rnd.uniform(minimo, maximo)
+            else:
+                punto[clave] = rnd.choice(valores)
+        puntos.append(punto)
+    return puntos
+
+
+def id_corrida(punto, semilla, huella=''):
+    """Identificador estable de una corrida (mismo catálogo, parámetros y semilla -> mismo id)."""
+    clave = json.dumps({'catalogo': huella, 'params': punto, 'semilla': semilla}, sort_keys=True)
+    return hashlib.sha1(clave.encode('utf-8')).hexdigest()[:16]
+
+
+def _ejecutar_corrida(tarea):
+    """Tarea del pool: una corrida del GA y su registro de resultado."""
+    id_, punto, semilla = tarea
+    params = dict(punto, catalogo=_CATALOGO, semilla=semilla)
+    # el motor de islas dentro de un trabajador no abre otro pool salvo que se pida
+    params.setdefault('trabajadores', 1)
+    t0 = time.perf_counter()
+    resultado = ejecutar_algoritmo_genetico(params)
+    tiempo = time.perf_counter() - t0
+    return {
+        'id': id_,
+        'semilla': semilla,
+        'params': punto,
+        'mejor_ganancia': resultado['mejor_ganancia'],
+        'ganancia_colocada': resultado.get('ganancia_colocada', resultado['mejor_ganancia']),
+        'mejor_area': resultado['mejor_area'],
+        'generaciones_ejecutadas': len(resultado['historial']),
+        'motivo_parada': resultado.get('motivo_parada', 'generaciones'),
+        'tiempo_s': round(tiempo, 4),
+    }
+
+
+class SalidaResultados:
+    """
+    Archivo de resultados en modo añadir. Si termina en una línea a medias (corte durante
+    la escritura) se recorta antes de seguir. `hechos` son los ids ya registrados.
+    """
+
+    def __init__(self, ruta, claves):
+        self.ruta = ruta
+        self.csv = os.path.splitext(ruta)[1].lower() == '.csv'
+        self.columnas = ['id', 'semilla'] + list(claves) + COLUMNAS_RESULTADO
+        self.hechos = set()
+        nuevo = not os.path.exists(ruta) or os.path.getsize(ruta) == 0
+        if not nuevo:
+            self._recortar_linea_incompleta()
+            self.hechos = self._leer_hechos()
+        self.f = open(ruta, 'a', newline='', encoding='utf-8')
+        if self.csv:
+            self.escritor = csv.DictWriter(self.f, fieldnames=self.columnas, extrasaction='ignore')
+            if nuevo:
+                self.escritor.writeheader()
+                self.f.flush()
+
+    def _recortar_linea_incompleta(self):
+        with open(self.ruta, 'rb+') as f:
+            datos = f.read()
+            if not datos.endswith(b'\n'):
+                f.truncate(datos.rfind(b'\n') + 1)
+
+    def _leer_hechos(self):
+        with open(self.ruta, newline='', encoding='utf-8') as f:
+            if self.csv:
+                lector = csv.DictReader(f)
+                if lector.fieldnames and lector.fieldnames != self.columnas:
+                    raise ValueError(f"{self.ruta} tiene otras columnas ({', '.join(lector.fieldnames)}); "
+                                     f"use otro archivo de salida para este barrido")
+                return {fila['id'] for fila in lector}
+            return {json.loads(linea)['id'] for linea in f if linea.strip()}
+
+    def escribir(self, registro):
+        if self.csv:
+            fila = dict(registro, **registro['params'])
+            self.escritor.writerow(fila)
+        else:
+            self.f.write(json.dumps(registro, ensure_ascii=False) + '\n')
+        self.f.flush()
+        self.hechos.add(registro['id'])
+
+    def cerrar(self):
+        self.f.close()
+
+
+def ejecutar_barrido(catalogo, puntos, semillas, ruta_salida, trabajadores=1, progreso=None):
+    """
+    Ejecuta cada punto con cada semilla y registra los resultados en `ruta_salida` según terminan.
+    Devuelve el número de corridas ejecutadas (las ya presentes en la salida se saltan).
+    """
+    claves = list(dict.fromkeys(k for p in puntos for k in p))
+    salida = SalidaResultados(ruta_salida, claves)
+    huella = huella_catalogo(catalogo)
+    tareas = []
+    for punto in puntos:
+        for semilla in semillas:
+            id_ = id_corrida(punto, semilla, huella)
+            if id_ not in salida.hechos:
+                tareas.append((id_, punto, semilla))
+    total = len(tareas)
+
+    try:
+        if trabajadores > 1 and total > 1:
+            with ProcessPoolExecutor(max_workers=trabajadores, initializer=_iniciar_trabajador,
+                                     initargs=(catalogo,)) as pool:
+                futuros = [pool.submit(_ejecutar_corrida, t) for t in tareas]
+                try:
+                    for hechas, futuro in enumerate(as_completed(futuros), 1):
+                        salida.escribir(futuro.result())
+                        if progreso:
+                            progreso(hechas, total)
+                except BaseException:
+                    for futuro in futuros:
+                        futuro.cancel()
+                    raise
+        else:
+            _iniciar_trabajador(catalogo)
+            for hechas, tarea in enumerate(tareas, 1):
+                salida.escribir(_ejecutar_corrida(tarea))
+                if progreso:
+                    progreso(hechas, total)
+    finally:
+        salida.cerrar()
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Barrido de parámetros del GA sin interfaz gráfica.")
+    parser.add_argument('catalogo', help="catálogo de artículos (.json o .csv)")
+    parser.add_argument('salida', help="archivo de resultados (.csv o .jsonl); si existe se reanuda")
+    parser.add_argument('-p', '--param', action='append', default=[], metavar='CLAVE=VALORES',
+                        help="valores de un parámetro del GA: 'v1,v2,...' o, en barrido aleatorio, 'min:max'")
+    parser.add_argument('--barrido', choices=['rejilla', 'aleatorio'], default='rejilla')
+    parser.add_argument('--puntos', type=int, default=20, help="puntos del barrido aleatorio")
+    parser.add_argument('--semilla-barrido', type=int, default=0, help="semilla del muestreo aleatorio")
+    parser.add_argument('--semillas', type=int, default=3, help="semillas 0..N-1 por punto")
+    parser.add_argument('--trabajadores', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    try:
+        catalogo = cargar_catalogo(args.catalogo)
+        espacio = leer_espacio(args.param)
+        if args.barrido == 'aleatorio':
+            puntos = puntos_aleatorios(espacio, args.puntos, args.semilla_barrido)
+        else:
+            puntos = puntos_rejilla(espacio)
+        inicio = time.perf_counter()
+        hechas = ejecutar_barrido(
+            catalogo, puntos, range(args.semillas), args.salida, max(1, args.trabajadores),
+            progreso=lambda i, n: print(f"\r{i}/{n} corridas", end='', file=sys.stderr, flush=True))
+    except (OSError, ValueError) as e:
+        parser.exit(2, f"error: {e}\n")
+    print(f"\ncorridas nuevas: {hechas} en {time.perf_counter() - inicio:.1f} s -> {args.salida}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# motor_numpy.py
+# Motor vectorizado del GA: la población es una matriz (N x artículos) de enteros
+# y todas las operaciones (evaluación, selección, cruce, mutación) se hacen por lotes.
+import time
+from array import array
+
+import numpy as np
+
+from backend import (AREA_MAXIMA, CATALOGO_POR_DEFECTO, CriteriosParada, Perfilador, abrir_puntos_control,
+                     columnas_catalogo, construir_resultado, consumir, sin_instantaneas)
+
+
+# ----------------------------
+# helpers vectorizados
+# ----------------------------
+def vectores_catalogo(catalogo):
+    """Precalcula una sola vez los vectores de área, ganancia y stock por artículo."""
+    # con un catálogo columnar las columnas se envuelven sin copiar
+    areas, ganancias, stocks = columnas_catalogo(catalogo)
+    return (np.asarray(areas, dtype=np.float64), np.asarray(ganancias, dtype=np.float64),
+            np.asarray(stocks, dtype=np.int64))
+
+def evaluar_poblacion(poblacion, areas, ganancias):
+    """Fitness de toda la población (misma penalización que evaluar_individuo)."""
+    area = poblacion @ areas
+    ganancia = poblacion @ ganancias
+    exceso = np.maximum(area - AREA_MAXIMA, 0.0)
+    return ganancia - 1000.0 * exceso
+
+def crear_poblacion_aleatoria(n, stocks, rng):
+    return rng.integers(0, stocks + 1, size=(n, len(stocks)))
+
+# selección: devuelven índices de padres, no copias
+def seleccion_torneo_np(fitnesses, n, k, rng):
+    tam = len(fitnesses)
+    candidatos = rng.integers(0, tam, size=(n, min(k, tam)))
+    ganador = np.argmax(fitnesses[candidatos], axis=1)
+    return candidatos[np.arange(n), ganador]
+
+def indice_ruleta_np(fitnesses):
+    """Pesos acumulados con el mismo criterio que backend.indice_ruleta."""
+    pesos = np.maximum(fitnesses, 0.0)
+    if not pesos.any():
+        pesos = fitnesses - fitnesses.min()
+        if not pesos.any():
+            pesos = np.ones_like(fitnesses)
+    return np.cumsum(pesos)
+
+def seleccion_ruleta_np(fitnesses, n, rng):
+    acumulado = indice_ruleta_np(fitnesses)
+    picks = rng.random(n) * acumulado[-1]
+    return np.minimum(np.searchsorted(acumulado, picks, side='right'), len(acumulado) - 1)
+
+def seleccion_sus_np(fitnesses, n, rng):
+    if n <= 0:
+        return np.empty(0, dtype=np.int64)
+    acumulado = indice_ruleta_np(fitnesses)
+    paso = acumulado[-1] / n
+    punteros = rng.random() * paso + paso * np.arange(n)
+    idxs = np.minimum(np.searchsorted(acumulado, punteros, side='right'), len(acumulado) - 1)
+    return rng.permutation(idxs)
+
+def cruce_un_punto_np(padres1, padres2, pc, rng):
+    hijos1 = padres1.copy()
+    hijos2 = padres2.copy()
+    m, largo = padres1.shape
+    if largo < 2:
+        return hijos1, hijos2
+    cruza = rng.random(m) <= pc
+    puntos = rng.integers(1, largo, size=m)
+    # genes desde el punto de corte en adelante se intercambian
+    mascara = (np.arange(largo) >= puntos[:, None]) & cruza[:, None]
+    hijos1[mascara] = padres2[mascara]
+    hijos2[mascara] = padres1[mascara]
+    return hijos1, hijos2
+
+def mutacion_np(poblacion, stocks, pm, rng):
+    filas, cols = np.nonzero(rng.random(poblacion.shape) < pm)
+    poblacion[filas, cols] = rng.integers(0, stocks[cols] + 1)
+    return poblacion
+
+# ----------------------------
+# Ejecutar GA vectorizado
+# ----------------------------
+def ejecutar_algoritmo_genetico_numpy(params):
+    """Mismos params y mismo dict de resultado que backend.ejecutar_algoritmo_genetico."""
+    return consumir(iterar_algoritmo_genetico_numpy(sin_instantaneas(params)), params.get('callback'))
+
+def iterar_algoritmo_genetico_numpy(params, estado=None):
+    """
+    Generador equivalente a backend.iterar_algoritmo_genetico para el motor vectorizado. Los
+    puntos de control guardan la matriz de población y el estado del generador de numpy.
+    """
+    catalogo = params.get('catalogo', CATALOGO_POR_DEFECTO)
+    N = int(params.get('tam_poblacion', 60))
+    gen_max = int(params.get('generaciones', 40))
+    pc = float(params.get('pc', 0.8))
+    pm = float(params.get('pm', 0.1))
+    seleccion = params.get('seleccion', 'torneo').lower()
+    elitismo = bool(params.get('elitismo', True))
+    torneo_k = int(params.get('torneo_k', 3))
+    instantaneas = params.get('instantaneas', True)
+    rng = np.random.default_rng(params.get('semilla'))
+    perfilador = Perfilador() if params.get('perfilado') else None
+    inicio = time.perf_counter()
+
+    areas, ganancias, stocks = vectores_catalogo(catalogo)
+    mejor_ind = None
+    mejor_fit = -1e18
+    historial = []
+    desde = 0
+    if estado is None:
+        poblacion = crear_poblacion_aleatoria(N, stocks, rng)
+    else:
+        meta, columnas = estado
+        if len(columnas['poblacion']) != N * len(stocks):
+            raise ValueError("la población del punto de control no coincide con tam_poblacion y el catálogo")
+        rng.bit_generator.state = meta['rng']
+        poblacion = np.frombuffer(columnas['poblacion'], dtype=np.int64).reshape(N, len(stocks)).copy()
+        if len(columnas['mejor_individuo']):
+            mejor_ind = np.array(columnas['mejor_individuo'], dtype=np.int64)
+        mejor_fit = meta['mejor_fit']
+        historial = columnas['historial'].tolist()
+        desde = meta['generacion']
+
+    # operadores como variables locales; con perfilado se envuelven para medir cada fase
+    evaluar, cruzar, mutar = evaluar_poblacion, cruce_un_punto_np, mutacion_np
+    sel_sus, sel_ruleta, sel_torneo = seleccion_sus_np, seleccion_ruleta_np, seleccion_torneo_np
+    if perfilador is not None:
+        perfilador.sumar('inicializacion', time.perf_counter() - inicio, en_generacion=False)
+        evaluar = perfilador.envolver('evaluacion', evaluar)
+        cruzar = perfilador.envolver('cruce', cruzar)
+        mutar = perfilador.envolver('mutacion', mutar)
+        sel_sus, sel_ruleta, sel_torneo = (perfilador.envolver('seleccion', f)
+                                           for f in (sel_sus, sel_ruleta, sel_torneo))
+
+    n_elite = 1 if elitismo else 0
+    n_hijos = N - n_elite
+    n_pares = (n_hijos + 1) // 2
+
+    criterios = CriteriosParada(params)
+    if estado is not None:
+        criterios.restaurar(meta['criterios'])
+
+    escritor = abrir_puntos_control(params, catalogo, desde)
+
+    def guardar(generacion):
+        meta = {'filas': N, 'mejor_fit': mejor_fit, 'criterios': criterios.estado(),
+                'rng': rng.bit_generator.state}
+        columnas = {'poblacion': array('q', poblacion.astype(np.int64, copy=False).tobytes()),
+                    'mejor_individuo': array('q', [] if mejor_ind is None else mejor_ind.tolist()),
+                    'historial': array('d', historial)}
+        escritor.enviar(generacion, meta, columnas)
+
+    try:
+        for g in range(desde, gen_max):
+            if escritor is not None and escritor.toca(g):
+                guardar(g)
+            if criterios.cancelada():
+                break
+            if perfilador is not None:
+                perfilador.nueva_generacion()
+            fitnesses = evaluar(poblacion, areas, ganancias)
+            t0 = time.perf_counter()
+            i_mejor = int(np.argmax(fitnesses))
+            if fitnesses[i_mejor] > mejor_fit:
+                mejor_fit = float(fitnesses[i_mejor])
+                mejor_ind = poblacion[i_mejor].copy()
+            historial.append(float(fitnesses[i_mejor]))
+            t1 = time.perf_counter()
+            diversidad = None
+            if instantaneas:
+                paso = {
+                    'generacion': g + 1,
+                    'mejor_fitness': historial[-1],
+                    'promedio_fitness': float(fitnesses.mean()),
+                    'peor_fitness': float(fitnesses.min()),
+                    'mejor_global': mejor_fit,
+                    'mejor_individuo': mejor_ind.tolist(),
+                    'diversidad': len(np.unique(poblacion, axis=0)) / N,
+                }
+                diversidad = paso['diversidad']
+            elif criterios.necesita_diversidad:
+                diversidad = len(np.unique(poblacion, axis=0)) / N
+            if perfilador is not None:
+                perfilador.sumar('ordenamiento', t1 - t0)
+                perfilador.sumar('estadisticas', time.perf_counter() - t1)
+            yield paso if instantaneas else g + 1
+            if criterios.actualizar(mejor_fit, diversidad):
+                break
+            pm = criterios.pm
+
+            # reproducir: todos los padres de la generación en una sola llamada
+            if seleccion == 'sus':
+                padres = sel_sus(fitnesses, 2 * n_pares, rng)
+            elif seleccion.startswith('r'):
+                padres = sel_ruleta(fitnesses, 2 * n_pares, rng)
+            else:
+                padres = sel_torneo(fitnesses, 2 * n_pares, torneo_k, rng)
+            hijos1, hijos2 = cruzar(poblacion[padres[:n_pares]], poblacion[padres[n_pares:]], pc, rng)
+            hijos = np.concatenate([hijos1, hijos2])[:n_hijos]
+            mutar(hijos, stocks, pm, rng)
+
+            if n_elite:
+                poblacion = np.concatenate([poblacion[i_mejor:i_mejor + 1], hijos])
+            else:
+                poblacion = hijos
+
+        # estado final (si no paró un criterio), para poder prolongar la corrida
+        if escritor is not None and criterios.motivo in (None, 'cancelado') and len(historial) != escritor.ultima:
+            guardar(len(historial))
+    finally:
+        if escritor is not None:
+            escritor.cerrar()
+
+    if mejor_ind is None:
+        mejor_ind = poblacion[0]
+    t0 = time.perf_counter()
+    resultado = construir_resultado([int(q) for q in mejor_ind], catalogo, historial, params)
+    resultado.update(criterios.resumen(len(historial)))
+    if perfilador is not None:
+        perfilador.sumar('empaquetado', time.perf_counter() - t0, en_generacion=False)
+        resultado['perfil'] = dict(perfilador.resumen(), total=time.perf_counter() - inicio)
+    if escritor is not None:
+        resultado['punto_control'] = escritor.resumen()
+    return resultado
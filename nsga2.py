@@ -0,0 +1,219 @@
+# nsga2.py
+# Modo multiobjetivo tipo NSGA-II: en lugar de reducir todo a un fitness escalar, cada individuo
+# tiene un vector de objetivos (ganancia a maximizar; área y unidades a minimizar) y la selección
+# usa el rango de no dominancia y la distancia de crowding. La restricción de área se trata con
+# dominancia restringida: un individuo que cabe domina a uno que no, y entre dos que no caben
+# domina el de menor exceso. Población y operadores son los del motor vectorizado.
+import time
+
+import numpy as np
+
+from backend import (AREA_MAXIMA, CATALOGO_POR_DEFECTO, CriteriosParada, Perfilador, construir_resultado,
+                     consumir, sin_instantaneas)
+from motor_numpy import (crear_poblacion_aleatoria, cruce_un_punto_np, evaluar_poblacion, mutacion_np,
+                         vectores_catalogo)
+
+OBJETIVOS = ('ganancia', 'area', 'unidades')
+# filas de la matriz de dominancia que se comparan a la vez (acota los temporales a BLOQUE x n)
+BLOQUE = 512
+
+
+# ----------------------------
+# ordenamiento no dominado
+# ----------------------------
+def matriz_objetivos(poblacion, areas, ganancias, objetivos):
+    """(F, exceso): objetivos como columnas a minimizar y exceso de área de cada individuo."""
+    area = poblacion @ areas
+    columnas = {'ganancia': -(poblacion @ ganancias), 'area': area,
+                'unidades': poblacion.sum(axis=1).astype(np.float64)}
+    F = np.column_stack([columnas[o] for o in objetivos])
+    return F, np.maximum(area - AREA_MAXIMA, 0.0)
+
+def matriz_dominancia(F, exceso):
+    """domina[i, j] = True si i domina a j (dominancia restringida), calculada por bloques de filas."""
+    n = len(F)
+    domina = np.empty((n, n), dtype=bool)
+    factible = exceso == 0.0
+    for ini in range(0, n, BLOQUE):
+        fin = min(n, ini + BLOQUE)
+        # un objetivo cada vez: matrices BLOQUE x n en vez de un temporal BLOQUE x n x objetivos
+        no_peor = np.ones((fin - ini, n), dtype=bool)
+        mejor = np.zeros((fin - ini, n), dtype=bool)
+        for k in range(F.shape[1]):
+            a, b = F[ini:fin, k, None], F[None, :, k]
+            no_peor &= a <= b
+            mejor |= a < b
+        ambos = factible[ini:fin, None] & factible[None, :]
+        domina[ini:fin] = np.where(ambos, no_peor & mejor, exceso[ini:fin, None] < exceso[None, :])
+    return domina
+
+def ordenar_no_dominados(F, exceso):
+    """Rango de cada individuo (0 = frente de Pareto), pelando frentes sobre la matriz de dominancia."""
+    n = len(F)
+    domina = matriz_dominancia(F, exceso)
+    dominadores = domina.sum(axis=0)
+    rango = np.full(n, -1, dtype=np.int64)
+    frente = np.flatnonzero(dominadores == 0)
+    r = 0
+    while len(frente):
+        rango[frente] = r
+        dominadores -= domina[frente].sum(axis=0)
+        dominadores[frente] = -1  # ya asignados
+        frente = np.flatnonzero(dominadores == 0)
+        r += 1
+    return rango
+
+def distancia_crowding(F, rango):
+    """
+    Distancia de crowding de cada individuo dentro de su frente (inf en los extremos). Todos los
+    frentes a la vez: por cada objetivo se ordena por (rango, valor) y se restan los vecinos.
+    """
+    n, m = F.shape
+    distancia = np.zeros(n)
+    posiciones = np.arange(n)
+    for k in range(m):
+        orden = np.lexsort((F[:, k], rango))
+        r = rango[orden]
+        valores = F[orden, k]
+        cambio = r[1:] != r[:-1]
+        primero = np.r_[True, cambio]
+        ultimo = np.r_[cambio, True]
+        # primera y última posición del frente de cada individuo, para la amplitud del objetivo
+        ini = np.maximum.accumulate(np.where(primero, posiciones, 0))
+        fin = np.minimum.accumulate(np.where(ultimo, posiciones, n)[::-1])[::-1]
+        amplitud = valores[fin] - valores[ini]
+        d = np.zeros(n)
+        d[1:-1] = valores[2:] - valores[:-2]
+        d = np.divide(d, amplitud, out=np.zeros(n), where=amplitud > 0)
+        d[primero | ultimo] = np.inf
+        distancia[orden] += d
+    return distancia
+
+def seleccion_torneo_binario(rango, crowding, n, rng):
+    """Índices de n padres: gana el de menor rango y, a igual rango, el de mayor crowding."""
+    tam = len(rango)
+    a = rng.integers(0, tam, size=n)
+    b = rng.integers(0, tam, size=n)
+    gana_a = (rango[a] < rango[b]) | ((rango[a] == rango[b]) & (crowding[a] >= crowding[b]))
+    return np.where(gana_a, a, b)
+
+def frente_pareto(poblacion, rango, exceso, areas, ganancias):
+    """Puntos distintos del primer frente que caben en el plano, ordenados por área."""
+    filas = np.unique(poblacion[(rango == 0) & (exceso == 0.0)], axis=0)
+    area = filas @ areas
+    ganancia = filas @ ganancias
+    unidades = filas.sum(axis=1)
+    return [{'ganancia': float(ganancia[i]), 'area': float(area[i]), 'unidades': int(unidades[i]),
+             'individuo': filas[i].tolist()} for i in np.lexsort((-ganancia, area))]
+
+# ----------------------------
+# Ejecutar NSGA-II
+# ----------------------------
+def ejecutar_nsga2(params):
+    """Ver iterar_nsga2."""
+    return consumir(iterar_nsga2(sin_instantaneas(params)), params.get('callback'))
+
+def iterar_nsga2(params):
+    """
+    Generador con los params y el resultado de backend.iterar_algoritmo_genetico, más
+    params['objetivos']: lista de 'ganancia', 'area' y 'unidades' (por defecto ganancia y área).
+    resultado['frente_pareto'] es la lista de puntos no dominados de la última generación
+    evaluada (ganancia, area, unidades, individuo), ordenada por área; el resto del resultado
+    corresponde al mejor individuo según el fitness escalar, como en los demás motores. Las
+    instantáneas y el historial usan el fitness escalar habitual, y las instantáneas traen además
+    'tam_frente'.
+    """
+    catalogo = params.get('catalogo', CATALOGO_POR_DEFECTO)
+    N = int(params.get('tam_poblacion', 60))
+    gen_max = int(params.get('generaciones', 40))
+    pc = float(params.get('pc', 0.8))
+    instantaneas = params.get('instantaneas', True)
+    objetivos = tuple(params.get('objetivos', ('ganancia', 'area')))
+    desconocidos = [o for o in objetivos if o not in OBJETIVOS]
+    if desconocidos or len(set(objetivos)) < 2:
+        raise ValueError(f"objetivos: se necesitan al menos dos de {', '.join(OBJETIVOS)}")
+    rng = np.random.default_rng(params.get('semilla'))
+    perfilador = Perfilador() if params.get('perfilado') else None
+    inicio = time.perf_counter()
+
+    areas, ganancias, stocks = vectores_catalogo(catalogo)
+    poblacion = crear_poblacion_aleatoria(N, stocks, rng)
+
+    # operadores como variables locales; con perfilado se envuelven para medir cada fase
+    evaluar, ordenar, cruzar, mutar, seleccionar = (matriz_objetivos, ordenar_no_dominados, cruce_un_punto_np,
+                                                    mutacion_np, seleccion_torneo_binario)
+    if perfilador is not None:
+        envolver = perfilador.envolver
+        evaluar, ordenar = envolver('evaluacion', evaluar), envolver('ordenamiento', ordenar)
+        cruzar, mutar = envolver('cruce', cruzar), envolver('mutacion', mutar)
+        seleccionar = envolver('seleccion', seleccionar)
+
+    F, exceso = evaluar(poblacion, areas, ganancias, objetivos)
+    rango = ordenar(F, exceso)
+    crowding = distancia_crowding(F, rango)
+    if perfilador is not None:
+        perfilador.sumar('inicializacion', time.perf_counter() - inicio, en_generacion=False)
+
+    n_pares = (N + 1) // 2
+    mejor_ind = None
+    mejor_fit = -1e18
+    historial = []
+    criterios = CriteriosParada(params)
+    evaluada = (poblacion, rango, exceso)
+
+    for g in range(gen_max):
+        if criterios.cancelada():
+            break
+        if perfilador is not None:
+            perfilador.nueva_generacion()
+        t0 = time.perf_counter()
+        fitnesses = evaluar_poblacion(poblacion, areas, ganancias)
+        i_mejor = int(np.argmax(fitnesses))
+        if fitnesses[i_mejor] > mejor_fit:
+            mejor_fit = float(fitnesses[i_mejor])
+            mejor_ind = poblacion[i_mejor].copy()
+        historial.append(float(fitnesses[i_mejor]))
+        evaluada = (poblacion, rango, exceso)
+        diversidad = None
+        if instantaneas:
+            paso = {
+                'generacion': g + 1,
+                'mejor_fitness': historial[-1],
+                'promedio_fitness': float(fitnesses.mean()),
+                'peor_fitness': float(fitnesses.min()),
+                'mejor_global': mejor_fit,
+                'mejor_individuo': mejor_ind.tolist(),
+                'diversidad': len(np.unique(poblacion, axis=0)) / N,
+                'tam_frente': int(np.count_nonzero((rango == 0) & (exceso == 0.0))),
+            }
+            diversidad = paso['diversidad']
+        elif criterios.necesita_diversidad:
+            diversidad = len(np.unique(poblacion, axis=0)) / N
+        if perfilador is not None:
+            perfilador.sumar('estadisticas', time.perf_counter() - t0)
+        yield paso if instantaneas else g + 1
+        if criterios.actualizar(mejor_fit, diversidad):
+            break
+
+        # hijos por torneo binario, cruce y mutación; sobreviven los N mejores de padres + hijos
+        padres = seleccionar(rango, crowding, 2 * n_pares, rng)
+        hijos1, hijos2 = cruzar(poblacion[padres[:n_pares]], poblacion[padres[n_pares:]], pc, rng)
+        hijos = mutar(np.concatenate([hijos1, hijos2])[:N], stocks, criterios.pm, rng)
+        union = np.concatenate([poblacion, hijos])
+        F, exceso = evaluar(union, areas, ganancias, objetivos)
+        rango = ordenar(F, exceso)
+        crowding = distancia_crowding(F, rango)
+        elegidos = np.lexsort((-crowding, rango))[:N]
+        poblacion, rango, exceso, crowding = union[elegidos], rango[elegidos], exceso[elegidos], crowding[elegidos]
+
+    if mejor_ind is None:
+        mejor_ind = poblacion[0]
+    t0 = time.perf_counter()
+    resultado = construir_resultado([int(q) for q in mejor_ind], catalogo, historial, params)
+    resultado['frente_pareto'] = frente_pareto(*evaluada, areas, ganancias)
+    resultado['objetivos'] = list(objetivos)
+    resultado.update(criterios.resumen(len(historial)))
+    if perfilador is not None:
+        perfilador.sumar('empaquetado', time.perf_counter() - t0, en_generacion=False)
+        resultado['perfil'] = dict(perfilador.resumen(), total=time.perf_counter() - inicio)
+    return resultado
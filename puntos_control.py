@@ -0,0 +1,143 @@
+# puntos_control.py
+# Puntos de control de corridas largas del GA: el estado de una corrida (población, mejor
+# individuo, historial, estado del generador aleatorio y de los criterios de parada) en un
+# archivo binario compacto, para continuarla tras una interrupción o prolongarla con más
+# generaciones (ver backend.reanudar_algoritmo_genetico). Los archivos se escriben en un hilo
+# aparte y con reemplazo atómico: un lector ve siempre el punto anterior o el nuevo completo.
+import json
+import os
+import random
+import struct
+import sys
+import threading
+from array import array
+
+MAGIA = b'GAPCTL1' + (b'L' if sys.byteorder == 'little' else b'B')
+CABECERA = struct.Struct('=8sq')  # firma, bytes del encabezado JSON
+
+
+def guardar_punto_control(ruta, meta, columnas):
+    """
+    Escribe `meta` (dict serializable a JSON) y `columnas` (nombre -> array.array) en `ruta`.
+    Formato: cabecera, encabezado JSON (meta e índice de columnas) y los bytes de cada columna.
+    """
+    indice = [[nombre, columna.typecode, len(columna)] for nombre, columna in columnas.items()]
+    encabezado = json.dumps({'meta': meta, 'columnas': indice}).encode('utf-8')
+    temporal = ruta + '.tmp'
+    with open(temporal, 'wb') as f:
+        f.write(CABECERA.pack(MAGIA, len(encabezado)))
+        f.write(encabezado)
+        for columna in columnas.values():
+            f.write(columna)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+
+
+def leer_punto_control(ruta):
+    """(meta, columnas) de un punto de control, o ValueError si el archivo no es válido."""
+    with open(ruta, 'rb') as f:
+        datos = f.read()
+    if len(datos) < CABECERA.size:
+        raise ValueError(f"punto de control truncado: {ruta}")
+    magia, largo = CABECERA.unpack_from(datos)
+    if magia != MAGIA:
+        raise ValueError(f"no es un punto de control válido: {ruta}")
+    pos = CABECERA.size + largo
+    encabezado = json.loads(datos[CABECERA.size:pos])
+    columnas = {}
+    for nombre, codigo, n in encabezado['columnas']:
+        columna = array(codigo)
+        fin = pos + n * columna.itemsize
+        columna.frombytes(datos[pos:fin])
+        if len(columna) != n:
+            raise ValueError(f"punto de control truncado: {ruta}")
+        columnas[nombre] = columna
+        pos = fin
+    if pos != len(datos):
+        raise ValueError(f"punto de control inválido: {ruta}")
+    return encabezado['meta'], columnas
+
+
+def params_serializables(params):
+    """Los params que se pueden guardar en el punto de control (sin catálogo, funciones ni
+    instantaneas, que dependen de quién consume la corrida y no de la corrida)."""
+    guardables = {}
+    for clave, valor in params.items():
+        if clave in ('catalogo', 'callback', 'cancelar', 'instantaneas'):
+            continue
+        try:
+            json.dumps(valor)
+        except (TypeError, ValueError):
+            continue
+        guardables[clave] = valor
+    return guardables
+
+
+def estado_random(rng):
+    """Estado de un random.Random como (meta, columna): el vector interno va en binario."""
+    version, interno, gauss = rng.getstate()
+    return [version, gauss], array('q', interno)
+
+
+def restaurar_random(meta, interno, rng=None):
+    rng = rng or random.Random()
+    rng.setstate((meta[0], tuple(interno), meta[1]))
+    return rng
+
+
+class EscritorPuntosControl:
+    """
+    Escribe los puntos de control de una corrida en un hilo aparte, para que el bucle de
+    generaciones solo pague la copia del estado. Si llega un punto nuevo antes de terminar de
+    escribir el anterior, el pendiente se reemplaza: solo importa el más reciente. `base` se
+    guarda en todos (motor, params, huella del catálogo).
+    """
+    def __init__(self, ruta, intervalo, base, desde=0):
+        self.ruta = ruta
+        self.intervalo = max(1, int(intervalo))
+        self.base = base
+        self.ultima = desde  # generación del último punto enviado (o de la que se parte)
+        self.escritos = 0
+        self.error = None
+        self._pendiente = None
+        self._cerrado = False
+        self._condicion = threading.Condition()
+        self._hilo = threading.Thread(target=self._escribir, daemon=True)
+        self._hilo.start()
+
+    def toca(self, generacion):
+        """True si desde el último punto se cruzó un múltiplo del intervalo."""
+        return generacion // self.intervalo > self.ultima // self.intervalo
+
+    def enviar(self, generacion, meta, columnas):
+        meta = dict(self.base, generacion=generacion, **meta)
+        with self._condicion:
+            self._pendiente = (meta, columnas)
+            self.ultima = generacion
+            self._condicion.notify()
+
+    def _escribir(self):
+        while True:
+            with self._condicion:
+                while self._pendiente is None and not self._cerrado:
+                    self._condicion.wait()
+                if self._pendiente is None:
+                    return
+                meta, columnas = self._pendiente
+                self._pendiente = None
+            try:
+                guardar_punto_control(self.ruta, meta, columnas)
+                self.escritos += 1
+            except OSError as e:
+                self.error = str(e)
+
+    def cerrar(self):
+        """Espera a que se escriba el último punto pendiente."""
+        with self._condicion:
+            self._cerrado = True
+            self._condicion.notify()
+        self._hilo.join()
+
+    def resumen(self):
+        return {'ruta': self.ruta, 'generacion': self.ultima, 'escritos': self.escritos, 'error': self.error}
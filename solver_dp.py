@@ -0,0 +1,99 @@
+# solver_dp.py
+# Solución exacta del problema como mochila acotada (cantidad 0..stock por artículo, capacidad
+# AREA_MAXIMA) por programación dinámica sobre una rejilla de área. Sirve como referencia para
+# medir la brecha de optimalidad del GA y como semilla de su población inicial.
+import math
+
+import numpy as np
+
+from backend import AREA_MAXIMA, CATALOGO_POR_DEFECTO, area_item, construir_resultado
+
+
+def _piezas_binarias(stock):
+    """Descomposición binaria del stock (1, 2, 4, ..., resto): cualquier cantidad 0..stock es suma de piezas."""
+    piezas = []
+    k = 1
+    while stock > 0:
+        tomar = min(k, stock)
+        piezas.append(tomar)
+        stock -= tomar
+        k *= 2
+    return piezas
+
+
+def resolver_cantidades_dp(catalogo, resolucion=0.001, memoria_max_mb=256):
+    """
+    Cantidades óptimas por artículo. El área de cada pieza se redondea hacia arriba a múltiplos
+    de `resolucion`, así que la solución siempre cabe; al afinar la rejilla converge al óptimo real.
+    La DP es un único vector de capacidad (actualizado por piezas binarias del stock) y para
+    reconstruir la solución solo se guarda un bit por pieza y celda (empaquetado con packbits).
+    Memoria de la reconstrucción: piezas × (AREA_MAXIMA / resolucion) / 8 bytes; si supera
+    `memoria_max_mb` la rejilla se hace más gruesa. Devuelve (cantidades, resolución usada).
+    """
+    n_piezas = sum(len(_piezas_binarias(int(a.get('stock', 1)))) for a in catalogo)
+    celdas_max = memoria_max_mb * 1024 * 1024 * 8 / max(n_piezas, 1)
+    resolucion = max(resolucion, AREA_MAXIMA / celdas_max)
+    capacidad = int(math.floor(AREA_MAXIMA / resolucion + 1e-9))
+    cantidades = [0] * len(catalogo)
+
+    piezas = []  # (artículo, unidades, peso, valor)
+    for i, art in enumerate(catalogo):
+        stock = int(art.get('stock', 1))
+        ganancia = art['ganancia']
+        if stock <= 0 or ganancia <= 0:
+            continue
+        area = area_item(art)
+        if area <= 0:
+            # no ocupa plano: siempre se lleva todo el stock
+            cantidades[i] = stock
+            continue
+        for unidades in _piezas_binarias(stock):
+            # se redondea el área de la pieza entera, no la de cada unidad
+            peso = int(math.ceil(unidades * area / resolucion - 1e-9))
+            if peso <= capacidad:
+                piezas.append((i, unidades, peso, unidades * ganancia))
+
+    # dp[c] = mejor ganancia usando a lo sumo c celdas de área
+    dp = np.zeros(capacidad + 1, dtype=np.float64)
+    tomadas = []
+    for _, _, peso, valor in piezas:
+        candidato = dp[:capacidad + 1 - peso] + valor
+        mejora = candidato > dp[peso:]
+        dp[peso:] = np.where(mejora, candidato, dp[peso:])
+        bits = np.zeros(capacidad + 1, dtype=bool)
+        bits[peso:] = mejora
+        tomadas.append(np.packbits(bits))
+
+    # reconstrucción hacia atrás
+    c = capacidad
+    for (i, unidades, peso, _), bits in zip(reversed(piezas), reversed(tomadas)):
+        if (bits[c >> 3] >> (7 - (c & 7))) & 1:
+            cantidades[i] += unidades
+            c -= peso
+    return cantidades, resolucion
+
+
+def resolver_knapsack_dp(params):
+    """
+    Mismo dict de resultado que backend.ejecutar_algoritmo_genetico, con el óptimo de la DP.
+    params: catalogo, resolucion_area (m², por defecto 0.001), memoria_max_mb (por defecto 256)
+    y las opciones de empaquetado. resultado['resolucion_area'] es la rejilla realmente usada.
+    """
+    catalogo = params.get('catalogo', CATALOGO_POR_DEFECTO)
+    mejor_ind, resolucion = resolver_cantidades_dp(catalogo, float(params.get('resolucion_area', 0.001)),
+                                                   float(params.get('memoria_max_mb', 256)))
+    ganancia = sum(q * a['ganancia'] for q, a in zip(mejor_ind, catalogo))
+    resultado = construir_resultado(mejor_ind, catalogo, [ganancia], params)
+    resultado['resolucion_area'] = resolucion
+    return resultado
+
+
+def brecha_optimalidad(resultado_ga, resultado_dp):
+    """
+    Fracción de la ganancia óptima que le falta al GA (0 = óptimo). Del GA se toma su mejor
+    fitness, que ya descuenta la penalización si su mejor individuo no cabe.
+    """
+    optimo = resultado_dp['mejor_ganancia']
+    if optimo <= 0:
+        return 0.0
+    return (optimo - max(resultado_ga['historial'])) / optimo